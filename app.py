@@ -1,13 +1,44 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import os
 import numpy as np
 
+from imigrasi.aggregates import KOLOM_AGREGAT, agregat_dari_statistik
+from imigrasi.analytics import rekomendasi
+from imigrasi.bootstrap import interval_bootstrap, interval_per_kelompok
+from imigrasi.chart_data import (
+    BATAS_WEBGL, FREKUENSI, pasangan_skor, ringkasan_box, seri_lttb, tabel_frekuensi, tren_per_bucket
+)
+from imigrasi.drivers import analisis_penggerak
+from imigrasi.export import FORMAT_EKSPOR, buat_ekspor
+from imigrasi.importer import MODE_GABUNG, MODE_GANTI, MODE_TAMBAH, import_csv
+from imigrasi.ingest import BATAS_TUNGGU, AntrianIngest
+from imigrasi.instrumentasi import PerekamRerun, RegistriMetrik
+from imigrasi.kategori import LABEL_USIA, kategori_kepuasan
+from imigrasi.kualitas import laporan_kualitas
+from imigrasi.kubus import DIMENSI_KUBUS, UKURAN_KUBUS, iris_kubus, pilih_sel, pivot_kubus
+from imigrasi.query import IndeksFilter, spesifikasi_filter
+from imigrasi.regression import regresi_berganda, regresi_sederhana
+from imigrasi.rollups import ringkasan_rollup, tren_dari_rollup
+from imigrasi.running_stats import StatistikBerjalan
+from imigrasi.schema import (
+    ASPEK_ALL, ASPEK_ADMIN, ASPEK_SERVQUAL, JENIS_KELAMIN, JENIS_LAYANAN, KANTOR_DEFAULT, KEPUASAN, KOLOM_SKOR,
+    laporan_memori, normalisasi
+)
+from imigrasi.storage import RepositoriResponden, DB_DEFAULT
+from imigrasi.teks import hitung_istilah
+
+# Kantor yang dilayani instance aplikasi ini
+KANTOR = os.environ.get('IMIGRASI_KANTOR', KANTOR_DEFAULT)
+# Panel instrumentasi untuk admin; IMIGRASI_METRIK = file teks Prometheus yang diperbarui tiap rerun
+DEBUG = os.environ.get('IMIGRASI_DEBUG') == '1'
+FILE_METRIK = os.environ.get('IMIGRASI_METRIK')
+
 # Konfigurasi halaman
 st.set_page_config(
-    page_title="Sistem Analisis Kepuasan Pelayanan Kantor Imigrasi Kelas II TPI Langsa",
+    page_title=f"Sistem Analisis Kepuasan Pelayanan {KANTOR}",
     page_icon="🛂",
     layout="wide"
 )
@@ -48,9 +79,264 @@ st.markdown("""
 st.markdown('<div class="main-header">🛂 Sistem Analisis Kepuasan Pelayanan Imigrasi</div>', unsafe_allow_html=True)
 st.markdown('<div class="sub-header">Kantor Imigrasi - Sistem Terintegrasi</div>', unsafe_allow_html=True)
 
-# Inisialisasi session state
-if 'data_responden' not in st.session_state:
-    st.session_state.data_responden = pd.DataFrame()
+# Penyimpanan bersama untuk semua sesi browser
+@st.cache_resource
+def get_repositori():
+    return RepositoriResponden(os.environ.get('IMIGRASI_DB', DB_DEFAULT), kantor=KANTOR)
+
+
+@st.cache_resource
+def get_antrian():
+    return AntrianIngest(get_repositori())
+
+
+@st.cache_resource
+def get_registri_metrik():
+    # Satu registri per proses server, jadi persentil latensi mencakup semua sesi
+    return RegistriMetrik()
+
+
+@st.cache_resource
+def get_dataset_partisi():
+    # pyarrow (parquet) hanya dimuat bila fitur multi-kantor dipakai
+    from imigrasi.partitions import PARTISI_DEFAULT, DatasetPartisi
+    return DatasetPartisi(os.environ.get('IMIGRASI_PARTISI', PARTISI_DEFAULT))
+
+
+@st.cache_data(ttl=30)
+def muat_perbandingan(kantor, periode):
+    from imigrasi.partitions import peringkat_kantor
+    # Statistik tiap file partisi juga di-cache di DatasetPartisi menurut mtime
+    statistik = get_dataset_partisi().statistik_per_kantor(list(kantor), list(periode))
+    return peringkat_kantor(statistik)
+
+
+@st.cache_data(max_entries=32)
+def muat_data(versi, kolom=None):
+    # versi ikut jadi kunci cache, jadi data dibaca ulang dan kolom turunan
+    # (Kategori, Tanggal datetime) dihitung hanya saat data berubah
+    return normalisasi(get_repositori().muat(kolom))
+
+
+@st.cache_resource(max_entries=4)
+def muat_indeks(versi):
+    # Dibagi antar sesi tanpa disalin; frame di dalamnya hanya dibaca
+    return IndeksFilter(muat_data(versi))
+
+
+@st.cache_data(max_entries=32)
+def muat_seleksi(versi, spek):
+    # Filter global dikompilasi sekali menjadi bitmap baris per (versi, filter)
+    return muat_indeks(versi).pilih(spek)
+
+
+def data_terpilih(versi, spek, kolom=None):
+    """Baris dalam seleksi filter global; tanpa filter cukup baca kolom yang perlu."""
+    if spek is None:
+        return muat_data(versi, kolom)
+    df = muat_indeks(versi).df.loc[muat_seleksi(versi, spek)]
+    return df if kolom is None else df[list(kolom)]
+
+
+@st.cache_data(max_entries=16)
+def muat_statistik(versi, spek=None):
+    # Tanpa filter dipakai statistik berjalan dari store, tanpa memindai baris
+    if spek is None:
+        return get_repositori().statistik()
+    return StatistikBerjalan.dari_df(data_terpilih(versi, spek, KOLOM_AGREGAT))
+
+
+@st.cache_data(max_entries=16)
+def muat_agregat(versi, spek=None):
+    return agregat_dari_statistik(muat_statistik(versi, spek))
+
+
+@st.cache_data(max_entries=16)
+def muat_regresi(versi, spek=None):
+    # Semua regresi dihitung sekaligus, jadi ganti aspek di selectbox tidak menghitung ulang
+    statistik = muat_statistik(versi, spek)
+    return {'sederhana': regresi_sederhana(statistik), 'berganda': regresi_berganda(statistik)}
+
+
+@st.cache_data(max_entries=16)
+def muat_penggerak(versi, spek=None):
+    # Dari co-moment yang sudah di-cache; 256 subset aspek diselesaikan dalam satu batch
+    return analisis_penggerak(muat_statistik(versi, spek))
+
+
+@st.cache_data(max_entries=16)
+def muat_data_grafik(versi, spek=None):
+    # Skor diskrit 1-5, jadi semua grafik distribusi cukup dari tabel hitungan kecil
+    df = data_terpilih(versi, spek, KOLOM_SKOR)
+    frekuensi = tabel_frekuensi(df, KOLOM_SKOR)
+    return {
+        'frekuensi': frekuensi,
+        'box': ringkasan_box(frekuensi[ASPEK_ADMIN]),
+        'pasangan': pasangan_skor(df, ASPEK_ALL, KEPUASAN),
+    }
+
+
+@st.cache_data(max_entries=16)
+def muat_tren(versi, frek=None, spek=None):
+    # Hanya seri per periode yang sudah direduksi yang dikirim ke browser
+    return tren_per_bucket(data_terpilih(versi, spek, KOLOM_TREN), ASPEK_ADMIN, frek)
+
+
+@st.cache_data(max_entries=32)
+def muat_rollup(versi, mulai=None, sampai=None, layanan=()):
+    # Beberapa ratus baris per tahun, berapa pun jumlah respondennya
+    rollup = get_repositori().muat_rollup(mulai, sampai)
+    if layanan:
+        rollup = rollup[rollup['Jenis Layanan'].isin(layanan)]
+    return rollup
+
+
+@st.cache_data(max_entries=4)
+def muat_kubus(versi):
+    # Sel kubus segmen; irisan, pivot dan rincian sel dihitung dari sini tanpa membaca baris
+    return get_repositori().muat_kubus()
+
+
+@st.cache_data(max_entries=16)
+def muat_tren_lttb(versi, spek=None):
+    return seri_lttb(data_terpilih(versi, spek, KOLOM_TREN), ASPEK_ADMIN)
+
+
+@st.cache_data(max_entries=64)
+def muat_saran(versi, kata='', spek=None, nomor=1):
+    # Pencarian lewat indeks FTS5 di SQLite; hanya satu halaman yang dibaca
+    return get_repositori().cari_saran(kata, spek, nomor, UKURAN_HALAMAN_SARAN)
+
+
+@st.cache_data(max_entries=16)
+def muat_istilah(versi, n, spek=None):
+    # Filter tanpa tanggal/kelamin/usia cukup dari tabel istilah yang diperbarui bertahap
+    if spek is None or not (spek[0] or spek[1] or any(spek[3:])):
+        return get_repositori().istilah_saran(n, spek[2] if spek else None)
+    istilah = hitung_istilah(data_terpilih(versi, spek, ('Jenis Layanan', 'Saran')))
+    istilah = istilah[istilah['N'] == n]
+    return istilah.drop(columns='N').sort_values('Frekuensi', ascending=False, ignore_index=True)
+
+
+@st.cache_resource
+def get_pelaksana_latar():
+    # Thread latar untuk hitungan/ekspor berat yang hasilnya boleh menyusul
+    return ThreadPoolExecutor(max_workers=2)
+
+
+def tunggu_latar(hasil, pesan):
+    """Tampilkan pesan sampai Future latar selesai, lalu jalankan ulang halaman."""
+    @st.fragment(run_every=1)
+    def pantau():
+        # Rerun penuh menggambar hasilnya dan menghentikan polling
+        if hasil.done():
+            st.rerun()
+        st.info(pesan)
+    pantau()
+
+
+@st.cache_resource(max_entries=6)
+def muat_ekspor(versi, format_ekspor):
+    # Dibuat sekali per (versi, format) dan dibagi antar sesi
+    return get_pelaksana_latar().submit(buat_ekspor, get_repositori(), format_ekspor)
+
+
+@st.cache_resource(max_entries=8)
+def muat_bootstrap(versi, spek=None):
+    # Future dibagi antar sesi; halaman tidak menunggu replikasi selesai
+    df = data_terpilih(versi, spek, KOLOM_AGREGAT)
+    return get_pelaksana_latar().submit(
+        lambda: {'aspek': interval_bootstrap(df), 'layanan': interval_per_kelompok(df)}
+    )
+
+
+def grafik(fig, nama):
+    """st.plotly_chart dengan waktu serialisasi (dan ukuran payload di mode debug) tercatat."""
+    # Payload diukur di luar bagian agar serialisasi tambahannya tidak ikut terhitung
+    with instrumen.bagian(f"grafik:{nama}", payload=instrumen.payload(fig)):
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def tampilkan_instrumentasi(registri):
+    st.caption(f"Rerun ini: {instrumen.selesai() * 1000:.0f} ms")
+    st.dataframe(instrumen.tabel().set_index('Bagian').style.format('{:.1f}', na_rep=''),
+                 use_container_width=True)
+    st.markdown("**Semua sesi (sampel terakhir):**")
+    st.dataframe(registri.ringkasan().style.format(
+        {'p50 (ms)': '{:.1f}', 'p95 (ms)': '{:.1f}', 'Maks (ms)': '{:.1f}', 'Δ Memori (MB)': '{:.2f}',
+         'Payload (KB)': '{:.1f}'}, na_rep=''
+    ), use_container_width=True)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button("JSON", registri.ke_json(indent=2), "metrik_dashboard.json",
+                           "application/json", use_container_width=True)
+    with col2:
+        st.download_button("Prometheus", registri.ke_prometheus(), "metrik_dashboard.prom",
+                           "text/plain", use_container_width=True)
+
+
+def akhiri_rerun(panel_debug):
+    # Dipanggil di akhir skrip dan sebelum st.stop, jadi setiap rerun tercatat dan diekspor
+    if panel_debug is not None:
+        with panel_debug:
+            tampilkan_instrumentasi(get_registri_metrik())
+    else:
+        instrumen.selesai()
+    if FILE_METRIK:
+        get_registri_metrik().tulis_prometheus(FILE_METRIK)
+
+
+def tampilkan_interval(hasil):
+    import plotly.graph_objects as go
+    
+    aspek = hasil['aspek']
+    if aspek is None:
+        st.info("Minimal dua responden lengkap diperlukan untuk interval kepercayaan.")
+        return
+    st.caption(f"Interval persentil 95% dari {aspek['replikasi']:,} replikasi bootstrap (n = {aspek['n']:,})")
+    
+    fig_ci = go.Figure(go.Scatter(
+        x=aspek['rata'].index,
+        y=aspek['rata']['Rata-rata'],
+        error_y=dict(
+            type='data', symmetric=False,
+            array=aspek['rata']['Atas'] - aspek['rata']['Rata-rata'],
+            arrayminus=aspek['rata']['Rata-rata'] - aspek['rata']['Bawah']
+        ),
+        mode='markers',
+        marker_color='#1f4788'
+    ))
+    fig_ci.update_layout(title='Rata-rata Skor dengan Interval Kepercayaan 95%',
+                         yaxis_title='Skor', xaxis_tickangle=-45)
+    grafik(fig_ci, 'ci')
+    
+    format_ci = {'Bawah': '{:.3f}', 'Atas': '{:.3f}', 'p-value': '{:.4f}'}
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Korelasi dengan Kepuasan Keseluruhan:**")
+        st.dataframe(aspek['korelasi'].style.format({'Korelasi': '{:.3f}', **format_ci}),
+                     use_container_width=True)
+    with col2:
+        st.markdown("**Gap terhadap Harapan:**")
+        st.dataframe(aspek['gap'].style.format({'Gap': '{:.2f}', **format_ci}),
+                     use_container_width=True)
+    st.markdown("**Kepuasan Keseluruhan per Jenis Layanan:**")
+    st.dataframe(hasil['layanan'].style.format({'Rata-rata': '{:.2f}', **format_ci}),
+                 use_container_width=True)
+
+
+instrumen = PerekamRerun(get_registri_metrik(), ukur_payload=DEBUG)
+repo = get_repositori()
+versi_data = repo.versi()
+total_responden = repo.statistik().n
+
+# Kolom yang dibutuhkan tiap bagian dashboard
+# (statistik agregat dan data grafik diambil dari cache masing-masing)
+KOLOM_TREN = ('Tanggal', *ASPEK_ADMIN)
+UKURAN_HALAMAN_SARAN = 20
+UKURAN_HALAMAN_KARANTINA = 100
+# Detik antar pemeriksaan data baru dari sesi/kiosk lain
+INTERVAL_PANTAU = 5
 
 # Sidebar untuk input data
 with st.sidebar:
@@ -106,16 +392,23 @@ with st.sidebar:
                     'Saran': saran
                 }
                 
-                if st.session_state.data_responden.empty:
-                    st.session_state.data_responden = pd.DataFrame([data_baru])
-                else:
-                    st.session_state.data_responden = pd.concat([
-                        st.session_state.data_responden, 
-                        pd.DataFrame([data_baru])
-                    ], ignore_index=True)
-                
-                st.success("✅ Data berhasil disimpan!")
-                st.rerun()
+                # Kiriman dari semua sesi/kiosk ditulis per batch oleh satu thread penulis
+                try:
+                    with instrumen.bagian("ingest:form"):
+                        tersimpan = get_antrian().kirim(data_baru, 'form').result(timeout=BATAS_TUNGGU)
+                except TimeoutError:
+                    tersimpan = None
+                    st.error("Penyimpanan sedang sibuk dan data belum terkonfirmasi tersimpan. "
+                             "Periksa tab Data Mentah sebelum mengirim ulang.")
+                except Exception as e:
+                    tersimpan = None
+                    st.error(f"Data gagal disimpan: {e}")
+                if tersimpan:
+                    st.success("✅ Data berhasil disimpan!")
+                    st.rerun()
+                elif tersimpan is not None:
+                    st.error("Data tidak disimpan dan masuk karantina (format tidak sesuai, semua skor sama, "
+                             "atau Nama + Tanggal sudah ada). Lihat Laporan Kualitas Data di tab Data Mentah.")
             else:
                 st.error("Nama responden harus diisi!")
     
@@ -123,490 +416,970 @@ with st.sidebar:
     
     # Upload CSV
     st.subheader("📁 Import Data CSV")
+    mode_import = st.radio(
+        "Mode Import",
+        [MODE_TAMBAH, MODE_GABUNG, MODE_GANTI],
+        format_func={
+            MODE_TAMBAH: "Tambahkan ke data",
+            MODE_GABUNG: "Gabung (lewati yang sudah ada)",
+            MODE_GANTI: "Ganti semua data",
+        }.get,
+    )
     uploaded_file = st.file_uploader("Upload file CSV", type=['csv'])
-    if uploaded_file:
+    # File yang sama cukup diimport sekali, bukan di setiap rerun
+    if uploaded_file and st.session_state.get('file_diimport') != uploaded_file.file_id:
         try:
-            df_upload = pd.read_csv(uploaded_file)
-            st.session_state.data_responden = df_upload
-            st.success(f"✅ {len(df_upload)} data berhasil diimport!")
+            bar_import = st.progress(0.0, text="Mengimport data...")
+            with instrumen.bagian("ingest:csv"):
+                hasil_import = import_csv(
+                    uploaded_file, repo, mode=mode_import,
+                    progres=lambda n: bar_import.progress(
+                        min(uploaded_file.tell() / max(uploaded_file.size, 1), 1.0),
+                        text=f"Mengimport data... {n} baris dibaca"
+                    )
+                )
+            bar_import.empty()
+            st.session_state.file_diimport = uploaded_file.file_id
+            versi_data = repo.versi()
+            total_responden = repo.statistik().n
+            st.success(f"✅ {hasil_import['disimpan']} data berhasil diimport!")
+            if hasil_import['duplikat']:
+                st.warning(f"{hasil_import['duplikat']} baris duplikat (Nama + Tanggal) tidak disimpan")
+            for alasan, jumlah in hasil_import['tidak_valid'].items():
+                st.warning(f"{jumlah} baris ditolak: {alasan}")
+            if hasil_import['dikarantina']:
+                st.info(f"🧹 {hasil_import['dikarantina']} baris dikarantina; lihat Laporan Kualitas Data")
         except Exception as e:
             st.error(f"Error: {e}")
     
-    # Download template dan data
-    if not st.session_state.data_responden.empty:
-        csv = st.session_state.data_responden.to_csv(index=False)
-        st.download_button(
-            "💾 Download Data CSV",
-            csv,
-            "data_kepuasan_imigrasi.csv",
-            "text/csv",
-            use_container_width=True
+    # Ekspor dibuat hanya saat diminta, di latar, sekali per versi data
+    if total_responden > 0:
+        st.subheader("💾 Ekspor Data")
+        format_ekspor = st.selectbox(
+            "Format", list(FORMAT_EKSPOR), format_func=lambda f: FORMAT_EKSPOR[f][0]
         )
+        if st.button("📦 Siapkan File", use_container_width=True):
+            st.session_state.ekspor = (versi_data, format_ekspor)
+        if st.session_state.get('ekspor') == (versi_data, format_ekspor):
+            hasil_ekspor = muat_ekspor(versi_data, format_ekspor)
+            if not hasil_ekspor.done():
+                tunggu_latar(hasil_ekspor, "⏳ File sedang disiapkan...")
+            elif hasil_ekspor.exception() is not None:
+                st.error(f"Ekspor gagal: {hasil_ekspor.exception()}")
+            else:
+                try:
+                    with open(hasil_ekspor.result(), 'rb') as f:
+                        isi_ekspor = f.read()
+                except FileNotFoundError:
+                    # File sudah dihapus (mis. pembersihan folder sementara); buat ulang
+                    muat_ekspor.clear(versi_data, format_ekspor)
+                    st.rerun()
+                st.download_button(
+                    f"⬇️ Download {FORMAT_EKSPOR[format_ekspor][0]}",
+                    isi_ekspor,
+                    f"data_kepuasan_imigrasi.{format_ekspor}",
+                    FORMAT_EKSPOR[format_ekspor][1],
+                    use_container_width=True
+                )
+    
+    if total_responden > 0 and st.button("🔄 Sinkronkan ke Dataset Multi-Kantor", use_container_width=True):
+        jumlah_sinkron = get_dataset_partisi().ganti_kantor(repo.muat(), KANTOR)
+        # Hanya cache perbandingan yang membaca dataset partisi
+        muat_perbandingan.clear()
+        st.success(f"✅ {jumlah_sinkron} data {KANTOR} disinkronkan")
     
     if st.button("🗑️ Reset Semua Data", use_container_width=True):
-        st.session_state.data_responden = pd.DataFrame()
+        repo.kosongkan()
+        st.rerun()
+    
+    # Filter global untuk tab 1-4
+    filter_global = None
+    if total_responden > 0:
+        st.markdown("---")
+        st.subheader("🔎 Filter Analisis")
+        rollup_semua = muat_rollup(versi_data)
+        awal_data = pd.Timestamp(rollup_semua['Hari'].iloc[0]).date()
+        akhir_data = pd.Timestamp(rollup_semua['Hari'].iloc[-1]).date()
+        rentang = st.date_input(
+            "Rentang Tanggal",
+            value=(awal_data, akhir_data),
+            min_value=awal_data,
+            max_value=akhir_data
+        )
+        # Saat pengguna baru memilih tanggal awal, pakai rentang satu hari
+        mulai_filter, sampai_filter = (tuple(rentang) * 2)[:2] if rentang else (awal_data, akhir_data)
+        filter_layanan_global = st.multiselect("Jenis Layanan", JENIS_LAYANAN, placeholder="Semua layanan")
+        filter_kelamin_global = st.multiselect("Jenis Kelamin", JENIS_KELAMIN, placeholder="Semua")
+        filter_usia_global = st.multiselect("Kelompok Usia", LABEL_USIA, placeholder="Semua usia")
+        filter_global = spesifikasi_filter(
+            mulai_filter if mulai_filter > awal_data else None,
+            sampai_filter if sampai_filter < akhir_data else None,
+            filter_layanan_global, filter_kelamin_global, filter_usia_global
+        )
+    
+    # Diisi di akhir rerun, setelah semua bagian selesai diukur
+    panel_debug = st.expander("🛠️ Instrumentasi Rerun") if DEBUG else None
+
+# Data dari kiosk/sesi lain: muat ulang halaman begitu versi dataset berubah
+@st.fragment(run_every=INTERVAL_PANTAU)
+def pantau_data_baru():
+    if repo.versi() != versi_data:
         st.rerun()
 
+
+pantau_data_baru()
+
 # Main content
-if st.session_state.data_responden.empty:
+if total_responden == 0:
     st.info("👈 Silakan mulai dengan menginput data responden di sidebar atau upload file CSV")
 else:
-    df = st.session_state.data_responden
+    # Filter tanpa Jenis Kelamin/Kelompok Usia bisa dijawab dari rollup harian,
+    # filter tanpa rentang tanggal dari kubus segmen
+    with instrumen.bagian("metrik"):
+        if filter_global is not None and not any(filter_global[3:]):
+            ringkasan = ringkasan_rollup(muat_rollup(versi_data, *filter_global[:3]))
+        elif filter_global is not None and not any(filter_global[:2]):
+            ringkasan = ringkasan_rollup(iris_kubus(muat_kubus(versi_data), *filter_global))
+        else:
+            ringkasan = muat_agregat(versi_data, filter_global)
     
     # Hitung metrik
-    total_responden = len(df)
-    rata_rata_kepuasan = df['Kepuasan Keseluruhan'].mean()
-    
-    # Kategori kepuasan
-    def kategori_kepuasan(nilai):
-        if nilai >= 4.5:
-            return "Sangat Puas"
-        elif nilai >= 3.5:
-            return "Puas"
-        elif nilai >= 2.5:
-            return "Cukup Puas"
-        elif nilai >= 1.5:
-            return "Tidak Puas"
-        else:
-            return "Sangat Tidak Puas"
+    n_terpilih = ringkasan['total_responden']
+    rata_rata_kepuasan = ringkasan['rata_rata_kepuasan']
     
     # Metrik ringkasan
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Responden", total_responden)
+        st.metric("Total Responden", n_terpilih)
+    
+    if n_terpilih == 0:
+        st.warning("Tidak ada responden yang cocok dengan filter analisis.")
+        akhiri_rerun(panel_debug)
+        st.stop()
     
     with col2:
         st.metric("Rata-rata Kepuasan", f"{rata_rata_kepuasan:.2f}/5.0")
     
     with col3:
-        puas = len(df[df['Kepuasan Keseluruhan'] >= 4])
-        persentase_puas = (puas/total_responden*100)
+        persentase_puas = ringkasan['persentase_puas']
         st.metric("Tingkat Kepuasan", f"{persentase_puas:.1f}%")
     
     with col4:
         st.metric("Status", kategori_kepuasan(rata_rata_kepuasan))
     
+    if filter_global is not None:
+        st.caption(f"🔎 Filter analisis aktif: {n_terpilih:,} dari {total_responden:,} responden")
     st.markdown("---")
     
-    # Tab untuk 3 laporan
-    tab1, tab2, tab3, tab4 = st.tabs([
+    # Plotly baru diimport saat ada data yang digambar
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    # Tab untuk 3 laporan; hanya tab yang sedang dibuka yang dihitung dan digambar
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
         "📊 Analisis Tingkat Kepuasan",
         "📈 Pengaruh Kualitas Layanan",
         "📋 Evaluasi Pelayanan Administrasi",
-        "📑 Data Mentah"
-    ])
+        "📑 Data Mentah",
+        "🏢 Perbandingan Kantor",
+        "🧊 Segmen Responden"
+    ], key='tab_aktif', on_change='rerun')
     
-    with tab1:
-        st.header("Analisis Tingkat Kepuasan Masyarakat terhadap Kualitas Pelayanan")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Distribusi kepuasan keseluruhan
-            fig_dist = px.histogram(
-                df, 
-                x='Kepuasan Keseluruhan',
-                nbins=5,
-                title='Distribusi Tingkat Kepuasan Keseluruhan',
-                labels={'Kepuasan Keseluruhan': 'Skor Kepuasan', 'count': 'Jumlah Responden'},
-                color_discrete_sequence=['#1f4788']
-            )
-            fig_dist.update_layout(showlegend=False)
-            st.plotly_chart(fig_dist, use_container_width=True)
-            
-            # Kepuasan per jenis layanan
-            kepuasan_layanan = df.groupby('Jenis Layanan')['Kepuasan Keseluruhan'].mean().sort_values()
-            fig_layanan = px.bar(
-                kepuasan_layanan,
-                orientation='h',
-                title='Rata-rata Kepuasan per Jenis Layanan',
-                labels={'value': 'Rata-rata Kepuasan', 'index': 'Jenis Layanan'},
-                color=kepuasan_layanan.values,
-                color_continuous_scale='RdYlGn'
-            )
-            st.plotly_chart(fig_layanan, use_container_width=True)
-        
-        with col2:
-            # Pie chart kategori kepuasan
-            df['Kategori'] = df['Kepuasan Keseluruhan'].apply(
-                lambda x: 'Sangat Puas' if x >= 4.5 else 
-                         'Puas' if x >= 3.5 else 
-                         'Cukup Puas' if x >= 2.5 else 
-                         'Tidak Puas'
-            )
-            kategori_counts = df['Kategori'].value_counts()
+    with tab1, instrumen.bagian("tab1", aktif=tab1.open):
+        if tab1.open:
+            agregat = muat_agregat(versi_data, filter_global)
+            data_grafik = muat_data_grafik(versi_data, filter_global)
+            frekuensi_kepuasan = data_grafik['frekuensi'][KEPUASAN]
+            st.header("Analisis Tingkat Kepuasan Masyarakat terhadap Kualitas Pelayanan")
             
-            fig_pie = px.pie(
-                values=kategori_counts.values,
-                names=kategori_counts.index,
-                title='Proporsi Kategori Kepuasan',
-                color_discrete_sequence=px.colors.sequential.Blues_r
-            )
-            st.plotly_chart(fig_pie, use_container_width=True)
-            
-            # Demografi
-            fig_demo = px.bar(
-                df['Jenis Kelamin'].value_counts(),
-                title='Demografi Responden',
-                labels={'value': 'Jumlah', 'index': 'Jenis Kelamin'},
-                color_discrete_sequence=['#1f4788', '#4a90e2']
-            )
-            st.plotly_chart(fig_demo, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # Analisis deskriptif
-        st.subheader("📊 Statistik Deskriptif")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("**Rata-rata per Aspek:**")
-            aspek_cols = ['Fasilitas Fisik', 'Keandalan', 'Responsivitas', 
-                         'Jaminan', 'Empati', 'Waktu Tunggu', 
-                         'Kemudahan Prosedur', 'Kejelasan Informasi']
-            for col in aspek_cols:
-                rata = df[col].mean()
-                st.write(f"• {col}: **{rata:.2f}**")
-        
-        with col2:
-            st.markdown("**Standar Deviasi:**")
-            for col in aspek_cols:
-                std = df[col].std()
-                st.write(f"• {col}: **{std:.2f}**")
-        
-        with col3:
-            st.markdown("**Min - Max:**")
-            for col in aspek_cols:
-                min_val = df[col].min()
-                max_val = df[col].max()
-                st.write(f"• {col}: **{min_val} - {max_val}**")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Distribusi kepuasan keseluruhan
+                fig_dist = px.bar(
+                    x=frekuensi_kepuasan.index,
+                    y=frekuensi_kepuasan.values,
+                    title='Distribusi Tingkat Kepuasan Keseluruhan',
+                    labels={'x': 'Skor Kepuasan', 'y': 'Jumlah Responden'},
+                    color_discrete_sequence=['#1f4788']
+                )
+                fig_dist.update_layout(showlegend=False)
+                grafik(fig_dist, 'dist')
+                
+                # Kepuasan per jenis layanan
+                kepuasan_layanan = agregat['kepuasan_layanan']
+                fig_layanan = px.bar(
+                    kepuasan_layanan,
+                    orientation='h',
+                    title='Rata-rata Kepuasan per Jenis Layanan',
+                    labels={'value': 'Rata-rata Kepuasan', 'index': 'Jenis Layanan'},
+                    color=kepuasan_layanan.values,
+                    color_continuous_scale='RdYlGn'
+                )
+                grafik(fig_layanan, 'layanan')
+            
+            with col2:
+                # Pie chart kategori kepuasan
+                # Kategori tiap skor 1-5 dijumlahkan dari tabel frekuensi
+                kategori_counts = frekuensi_kepuasan.groupby(
+                    kategori_kepuasan(frekuensi_kepuasan.index.to_numpy()), observed=True
+                ).sum()
+                kategori_counts = kategori_counts[kategori_counts > 0]
+                
+                fig_pie = px.pie(
+                    values=kategori_counts.values,
+                    names=kategori_counts.index,
+                    title='Proporsi Kategori Kepuasan',
+                    color_discrete_sequence=px.colors.sequential.Blues_r
+                )
+                grafik(fig_pie, 'pie')
+                
+                # Demografi
+                fig_demo = px.bar(
+                    agregat['jenis_kelamin'],
+                    title='Demografi Responden',
+                    labels={'value': 'Jumlah', 'index': 'Jenis Kelamin'},
+                    color_discrete_sequence=['#1f4788', '#4a90e2']
+                )
+                grafik(fig_demo, 'demo')
+            
+            st.markdown("---")
+            
+            # Analisis deskriptif
+            st.subheader("📊 Statistik Deskriptif")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.markdown("**Rata-rata per Aspek:**")
+                deskriptif = agregat['deskriptif']
+                for col, rata in deskriptif['mean'].items():
+                    st.write(f"• {col}: **{rata:.2f}**")
+            
+            with col2:
+                st.markdown("**Standar Deviasi:**")
+                for col, std in deskriptif['std'].items():
+                    st.write(f"• {col}: **{std:.2f}**")
+            
+            with col3:
+                st.markdown("**Min - Max:**")
+                for col, min_val, max_val in deskriptif[['min', 'max']].itertuples():
+                    st.write(f"• {col}: **{min_val:.0f} - {max_val:.0f}**")
     
-    with tab2:
-        st.header("Pengaruh Kualitas Pelayanan terhadap Kepuasan Masyarakat")
-        
-        # Radar chart untuk dimensi ServQual
-        aspek_servqual = ['Fasilitas Fisik', 'Keandalan', 'Responsivitas', 'Jaminan', 'Empati']
-        rata_servqual = [df[col].mean() for col in aspek_servqual]
-        
-        fig_radar = go.Figure()
-        
-        fig_radar.add_trace(go.Scatterpolar(
-            r=rata_servqual,
-            theta=aspek_servqual,
-            fill='toself',
-            name='Rata-rata Skor',
-            line_color='#1f4788'
-        ))
-        
-        fig_radar.update_layout(
-            polar=dict(
-                radialaxis=dict(visible=True, range=[0, 5])
-            ),
-            showlegend=True,
-            title='Analisis Dimensi Kualitas Pelayanan (ServQual)'
-        )
-        
-        st.plotly_chart(fig_radar, use_container_width=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Korelasi
-            st.subheader("📊 Analisis Korelasi")
-            
-            aspek_all = ['Fasilitas Fisik', 'Keandalan', 'Responsivitas', 
-                        'Jaminan', 'Empati', 'Waktu Tunggu', 
-                        'Kemudahan Prosedur', 'Kejelasan Informasi']
-            
-            korelasi_data = []
-            for aspek in aspek_all:
-                korrel = df[aspek].corr(df['Kepuasan Keseluruhan'])
-                korelasi_data.append({'Aspek': aspek, 'Korelasi': korrel})
-            
-            df_korelasi = pd.DataFrame(korelasi_data).sort_values('Korelasi', ascending=False)
-            
-            fig_korelasi = px.bar(
-                df_korelasi,
-                x='Korelasi',
-                y='Aspek',
-                orientation='h',
-                title='Korelasi Aspek Layanan dengan Kepuasan Keseluruhan',
-                color='Korelasi',
-                color_continuous_scale='RdYlGn',
-                range_color=[0, 1]
-            )
-            st.plotly_chart(fig_korelasi, use_container_width=True)
-        
-        with col2:
-            # Scatter plot pengaruh
-            st.subheader("📈 Visualisasi Pengaruh")
+    with tab2, instrumen.bagian("tab2", aktif=tab2.open):
+        if tab2.open:
+            agregat = muat_agregat(versi_data, filter_global)
+            data_grafik = muat_data_grafik(versi_data, filter_global)
+            regresi = muat_regresi(versi_data, filter_global)
+            st.header("Pengaruh Kualitas Pelayanan terhadap Kepuasan Masyarakat")
+            
+            # Radar chart untuk dimensi ServQual
+            rata_servqual = agregat['rata_servqual']
+            
+            fig_radar = go.Figure()
             
-            aspek_pilihan = st.selectbox(
-                "Pilih Aspek untuk Analisis Scatter:",
-                aspek_all
+            fig_radar.add_trace(go.Scatterpolar(
+                r=rata_servqual.values,
+                theta=rata_servqual.index,
+                fill='toself',
+                name='Rata-rata Skor',
+                line_color='#1f4788'
+            ))
+            
+            fig_radar.update_layout(
+                polar=dict(
+                    radialaxis=dict(visible=True, range=[0, 5])
+                ),
+                showlegend=True,
+                title='Analisis Dimensi Kualitas Pelayanan (ServQual)'
             )
             
-            fig_scatter = px.scatter(
-                df,
-                x=aspek_pilihan,
-                y='Kepuasan Keseluruhan',
-                title=f'Pengaruh {aspek_pilihan} terhadap Kepuasan',
-                trendline='ols',
-                labels={aspek_pilihan: f'Skor {aspek_pilihan}', 
-                       'Kepuasan Keseluruhan': 'Skor Kepuasan Keseluruhan'},
-                color_discrete_sequence=['#1f4788']
+            grafik(fig_radar, 'radar')
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Korelasi
+                st.subheader("📊 Analisis Korelasi")
+                
+                df_korelasi = agregat['df_korelasi']
+                
+                fig_korelasi = px.bar(
+                    df_korelasi,
+                    x='Korelasi',
+                    y='Aspek',
+                    orientation='h',
+                    title='Korelasi Aspek Layanan dengan Kepuasan Keseluruhan',
+                    color='Korelasi',
+                    color_continuous_scale='RdYlGn',
+                    range_color=[0, 1]
+                )
+                grafik(fig_korelasi, 'korelasi')
+            
+            with col2:
+                # Scatter plot pengaruh
+                st.subheader("📈 Visualisasi Pengaruh")
+                
+                aspek_pilihan = st.selectbox(
+                    "Pilih Aspek untuk Analisis Scatter:",
+                    ASPEK_ALL
+                )
+                
+                # Satu titik per pasangan skor, ukurannya sebanding jumlah responden
+                pasangan = data_grafik['pasangan'][aspek_pilihan]
+                fig_scatter = px.scatter(
+                    pasangan,
+                    x='x',
+                    y='y',
+                    size='n',
+                    title=f'Pengaruh {aspek_pilihan} terhadap Kepuasan',
+                    labels={'x': f'Skor {aspek_pilihan}', 
+                           'y': 'Skor Kepuasan Keseluruhan',
+                           'n': 'Jumlah Responden'},
+                    color_discrete_sequence=['#1f4788']
+                )
+                trend = regresi['sederhana'].loc[aspek_pilihan]
+                if np.isfinite(trend['Kemiringan']):
+                    garis_x = np.array([pasangan['x'].min(), pasangan['x'].max()])
+                    fig_scatter.add_trace(go.Scatter(
+                        x=garis_x,
+                        y=trend['Intersep'] + trend['Kemiringan'] * garis_x,
+                        mode='lines',
+                        name='Trendline OLS',
+                        line_color='#1f4788'
+                    ))
+                grafik(fig_scatter, 'scatter')
+                st.caption(
+                    f"y = {trend['Intersep']:.2f} + {trend['Kemiringan']:.2f}x • "
+                    f"R² = {trend['R²']:.3f} • p = {trend['p-value']:.3g}"
+                )
+                
+                # Tabel korelasi
+                st.markdown("**Tabel Korelasi:**")
+                st.dataframe(
+                    df_korelasi.style.background_gradient(cmap='RdYlGn', subset=['Korelasi']),
+                    use_container_width=True
+                )
+            
+            # Penggerak kepuasan: korelasi berpasangan menyesatkan bila aspek saling berkorelasi
+            st.markdown("---")
+            st.subheader("🎯 Penggerak Utama Kepuasan")
+            
+            penggerak = muat_penggerak(versi_data, filter_global)
+            if penggerak is None:
+                st.info("Belum cukup responden bervariasi untuk analisis penggerak.")
+            else:
+                tabel_penggerak = penggerak['tabel'].reset_index()
+                st.caption(
+                    f"Kepentingan relatif = sumbangan rata-rata tiap aspek ke R² atas semua "
+                    f"{2 ** len(ASPEK_ALL)} kombinasi aspek (Shapley/LMG) • regresi ridge "
+                    f"α = {penggerak['alfa']:.3g} • R² = {penggerak['R²']:.3f} • n = {penggerak['n']:,}"
+                )
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    fig_kepentingan = px.bar(
+                        tabel_penggerak.sort_values('Kepentingan %'),
+                        x='Kepentingan %',
+                        y='Aspek',
+                        orientation='h',
+                        title='Kepentingan Relatif terhadap Kepuasan Keseluruhan',
+                        color='Kepentingan %',
+                        color_continuous_scale='Blues'
+                    )
+                    grafik(fig_kepentingan, 'kepentingan')
+                
+                with col2:
+                    fig_matriks = px.scatter(
+                        tabel_penggerak,
+                        x='Kinerja',
+                        y='Kepentingan %',
+                        text='Aspek',
+                        color='Kuadran',
+                        title='Matriks Kepentingan × Kinerja',
+                        labels={'Kinerja': 'Kinerja (rata-rata skor)'}
+                    )
+                    fig_matriks.update_traces(textposition='top center')
+                    fig_matriks.add_vline(x=penggerak['batas_kinerja'], line_dash='dash', line_color='gray')
+                    fig_matriks.add_hline(y=penggerak['batas_kepentingan'], line_dash='dash', line_color='gray')
+                    grafik(fig_matriks, 'matriks')
+                
+                st.dataframe(
+                    penggerak['tabel'].style.format({
+                        'Koefisien Ridge': '{:.3f}',
+                        'Beta Baku': '{:.3f}',
+                        'Kepentingan': '{:.4f}',
+                        'Kepentingan %': '{:.1f}%',
+                        'Kinerja': '{:.2f}',
+                        'Potensi': '{:.3f}'
+                    }).background_gradient(cmap='Blues', subset=['Kepentingan %']),
+                    use_container_width=True
+                )
+            
+            # Gap Analysis
+            st.markdown("---")
+            st.subheader("📉 Gap Analysis (Harapan vs Realita)")
+            
+            st.info("💡 Asumsi: Harapan masyarakat adalah skor sempurna (5.0)")
+            
+            df_gap = agregat['df_gap']
+            
+            fig_gap = go.Figure()
+            
+            fig_gap.add_trace(go.Bar(
+                name='Harapan',
+                x=df_gap['Aspek'],
+                y=df_gap['Harapan'],
+                marker_color='lightblue'
+            ))
+            
+            fig_gap.add_trace(go.Bar(
+                name='Realisasi',
+                x=df_gap['Aspek'],
+                y=df_gap['Realisasi'],
+                marker_color='#1f4788'
+            ))
+            
+            fig_gap.update_layout(
+                title='Perbandingan Harapan vs Realisasi',
+                barmode='group',
+                xaxis_tickangle=-45
             )
-            st.plotly_chart(fig_scatter, use_container_width=True)
             
-            # Tabel korelasi
-            st.markdown("**Tabel Korelasi:**")
+            grafik(fig_gap, 'gap')
+            
             st.dataframe(
-                df_korelasi.style.background_gradient(cmap='RdYlGn', subset=['Korelasi']),
+                df_gap.style.format({
+                    'Harapan': '{:.2f}',
+                    'Realisasi': '{:.2f}',
+                    'Gap': '{:.2f}',
+                    'Gap %': '{:.1f}%'
+                }).background_gradient(cmap='RdYlGn_r', subset=['Gap']),
                 use_container_width=True
             )
-        
-        # Gap Analysis
-        st.markdown("---")
-        st.subheader("📉 Gap Analysis (Harapan vs Realita)")
-        
-        st.info("💡 Asumsi: Harapan masyarakat adalah skor sempurna (5.0)")
-        
-        gap_data = []
-        for aspek in aspek_all:
-            realisasi = df[aspek].mean()
-            harapan = 5.0
-            gap = realisasi - harapan
-            gap_data.append({
-                'Aspek': aspek,
-                'Harapan': harapan,
-                'Realisasi': realisasi,
-                'Gap': gap,
-                'Gap %': (gap/harapan)*100
-            })
-        
-        df_gap = pd.DataFrame(gap_data)
-        
-        fig_gap = go.Figure()
-        
-        fig_gap.add_trace(go.Bar(
-            name='Harapan',
-            x=df_gap['Aspek'],
-            y=df_gap['Harapan'],
-            marker_color='lightblue'
-        ))
-        
-        fig_gap.add_trace(go.Bar(
-            name='Realisasi',
-            x=df_gap['Aspek'],
-            y=df_gap['Realisasi'],
-            marker_color='#1f4788'
-        ))
-        
-        fig_gap.update_layout(
-            title='Perbandingan Harapan vs Realisasi',
-            barmode='group',
-            xaxis_tickangle=-45
-        )
-        
-        st.plotly_chart(fig_gap, use_container_width=True)
-        
-        st.dataframe(
-            df_gap.style.format({
-                'Harapan': '{:.2f}',
-                'Realisasi': '{:.2f}',
-                'Gap': '{:.2f}',
-                'Gap %': '{:.1f}%'
-            }).background_gradient(cmap='RdYlGn_r', subset=['Gap']),
-            use_container_width=True
-        )
-    
-    with tab3:
-        st.header("Evaluasi Kepuasan Masyarakat terhadap Pelayanan Administrasi Keimigrasian")
-        
-        # Fokus pada aspek administratif
-        aspek_admin = ['Waktu Tunggu', 'Kemudahan Prosedur', 'Kejelasan Informasi', 'Keandalan']
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Box plot
-            fig_box = go.Figure()
-            
-            for aspek in aspek_admin:
-                fig_box.add_trace(go.Box(
-                    y=df[aspek],
-                    name=aspek,
-                    boxmean='sd'
-                ))
-            
-            fig_box.update_layout(
-                title='Distribusi Penilaian Aspek Administrasi',
-                yaxis_title='Skor',
-                showlegend=True
-            )
             
-            st.plotly_chart(fig_box, use_container_width=True)
+            # Interval kepercayaan bootstrap, dihitung di latar
+            st.markdown("---")
+            st.subheader("📏 Interval Kepercayaan (Bootstrap)")
             
-            # Tren per layanan
-            st.subheader("📊 Kepuasan per Jenis Layanan")
+            hasil_bootstrap = muat_bootstrap(versi_data, filter_global)
+            if not hasil_bootstrap.done():
+                tunggu_latar(hasil_bootstrap, "⏳ Interval kepercayaan sedang dihitung di latar...")
+            elif hasil_bootstrap.exception() is not None:
+                st.error(f"Interval bootstrap gagal dihitung: {hasil_bootstrap.exception()}")
+                # Future gagal tidak disimpan; rerun berikutnya mencoba lagi
+                muat_bootstrap.clear(versi_data, filter_global)
+            else:
+                tampilkan_interval(hasil_bootstrap.result())
             
-            df_layanan = df.groupby('Jenis Layanan')[aspek_admin + ['Kepuasan Keseluruhan']].mean()
+            # Regresi berganda
+            st.markdown("---")
+            st.subheader("📐 Regresi Berganda Kepuasan Keseluruhan")
             
+            berganda = regresi['berganda']
+            st.write(
+                f"R² = **{berganda['R²']:.3f}** • R² adj = **{berganda['R² adj']:.3f}** • "
+                f"n = **{berganda['n']}**"
+            )
             st.dataframe(
-                df_layanan.style.format('{:.2f}').background_gradient(cmap='RdYlGn', axis=0),
+                berganda['koefisien'].style.format({
+                    'Koefisien': '{:.3f}',
+                    'Std. Error': '{:.3f}',
+                    't': '{:.2f}',
+                    'p-value': '{:.4f}'
+                }),
                 use_container_width=True
             )
-        
-        with col2:
-            # Heatmap
-            correlation_matrix = df[aspek_admin + ['Kepuasan Keseluruhan']].corr()
-            
-            fig_heatmap = px.imshow(
-                correlation_matrix,
-                title='Matriks Korelasi Aspek Administrasi',
-                color_continuous_scale='RdYlGn',
-                aspect='auto',
-                labels=dict(color="Korelasi")
-            )
+    
+    with tab3, instrumen.bagian("tab3", aktif=tab3.open):
+        if tab3.open:
+            agregat = muat_agregat(versi_data, filter_global)
+            data_grafik = muat_data_grafik(versi_data, filter_global)
+            st.header("Evaluasi Kepuasan Masyarakat terhadap Pelayanan Administrasi Keimigrasian")
+            
+            # Fokus pada aspek administratif
+            aspek_admin = ASPEK_ADMIN
             
-            st.plotly_chart(fig_heatmap, use_container_width=True)
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Box plot
+                fig_box = go.Figure()
+                
+                # Box plot dari ringkasan kuartil yang sudah dihitung di server
+                for aspek, ringkas in data_grafik['box'].iterrows():
+                    fig_box.add_trace(go.Box(
+                        x=[aspek],
+                        q1=[ringkas['q1']],
+                        median=[ringkas['median']],
+                        q3=[ringkas['q3']],
+                        lowerfence=[ringkas['lowerfence']],
+                        upperfence=[ringkas['upperfence']],
+                        mean=[ringkas['mean']],
+                        sd=[ringkas['sd']],
+                        name=aspek,
+                        boxmean='sd'
+                    ))
+                
+                fig_box.update_layout(
+                    title='Distribusi Penilaian Aspek Administrasi',
+                    yaxis_title='Skor',
+                    showlegend=True
+                )
+                
+                grafik(fig_box, 'box')
+                
+                # Tren per layanan
+                st.subheader("📊 Kepuasan per Jenis Layanan")
+                
+                df_layanan = agregat['df_layanan']
+                
+                st.dataframe(
+                    df_layanan.style.format('{:.2f}').background_gradient(cmap='RdYlGn', axis=0),
+                    use_container_width=True
+                )
+            
+            with col2:
+                # Heatmap
+                correlation_matrix = agregat['korelasi_admin']
+                
+                fig_heatmap = px.imshow(
+                    correlation_matrix,
+                    title='Matriks Korelasi Aspek Administrasi',
+                    color_continuous_scale='RdYlGn',
+                    aspect='auto',
+                    labels=dict(color="Korelasi")
+                )
+                
+                grafik(fig_heatmap, 'heatmap')
+                
+                # Line chart tren
+                st.subheader("📈 Tren Penilaian Administrasi")
+                
+                mode_tren = st.radio(
+                    "Tampilan Tren",
+                    ["Rata-rata per Periode", "Titik Sampel (LTTB)"],
+                    horizontal=True
+                )
+                
+                fig_tren = go.Figure()
+                warna = px.colors.qualitative.Plotly
+                
+                if mode_tren == "Rata-rata per Periode":
+                    frek_tren = st.selectbox(
+                        "Periode",
+                        [None] + [frek for frek, _ in FREKUENSI],
+                        format_func=lambda f: "Otomatis" if f is None else dict(FREKUENSI)[f]
+                    )
+                    if frek_tren == 'h' or (filter_global is not None and any(filter_global[3:])):
+                        # Rollup berbutir harian per layanan; per jam atau segmen lain dari data mentah
+                        df_tren, frek_tren = muat_tren(versi_data, frek_tren, filter_global)
+                    else:
+                        rollup_rentang = muat_rollup(versi_data, *(filter_global or (None, None, ()))[:3])
+                        df_tren, frek_tren = tren_dari_rollup(rollup_rentang, ASPEK_ADMIN, frek_tren)
+                    st.caption(f"Periode: {dict(FREKUENSI)[frek_tren]} • pita = interval kepercayaan 95%")
+                    
+                    for i, (aspek, seri) in enumerate(df_tren.groupby('Aspek', sort=False)):
+                        # Pita kepercayaan: batas atas lalu batas bawah diisi ke atas
+                        fig_tren.add_trace(go.Scatter(
+                            x=seri['Tanggal'], y=seri['Atas'],
+                            mode='lines', line_width=0,
+                            legendgroup=aspek, showlegend=False, hoverinfo='skip'
+                        ))
+                        fig_tren.add_trace(go.Scatter(
+                            x=seri['Tanggal'], y=seri['Bawah'],
+                            mode='lines', line_width=0, fill='tonexty',
+                            fillcolor=warna[i % len(warna)], opacity=0.2,
+                            legendgroup=aspek, showlegend=False, hoverinfo='skip'
+                        ))
+                        fig_tren.add_trace(go.Scatter(
+                            x=seri['Tanggal'], y=seri['Rata-rata'],
+                            mode='lines+markers', name=aspek,
+                            line_color=warna[i % len(warna)],
+                            legendgroup=aspek, customdata=seri['n'],
+                            hovertemplate='%{y:.2f} (n=%{customdata})'
+                        ))
+                else:
+                    # Scattergl bila titik yang digambar banyak agar browser tidak tersendat
+                    seri_tren = muat_tren_lttb(versi_data, filter_global)
+                    titik_tren = sum(len(seri) for seri in seri_tren.values())
+                    Scatter = go.Scattergl if titik_tren > BATAS_WEBGL else go.Scatter
+                    for aspek, seri in seri_tren.items():
+                        fig_tren.add_trace(Scatter(
+                            x=seri['Tanggal'],
+                            y=seri['Skor'],
+                            mode='lines+markers',
+                            name=aspek
+                        ))
+                
+                fig_tren.update_layout(
+                    title='Tren Penilaian dari Waktu ke Waktu',
+                    xaxis_title='Tanggal',
+                    yaxis_title='Skor'
+                )
+                
+                grafik(fig_tren, 'tren')
             
-            # Line chart tren
-            st.subheader("📈 Tren Penilaian Administrasi")
+            # Rekomendasi
+            st.markdown("---")
+            st.subheader("💡 Rekomendasi Perbaikan")
             
-            df['Tanggal_Parse'] = pd.to_datetime(df['Tanggal'])
-            df_sorted = df.sort_values('Tanggal_Parse')
+            # Aspek dipilih menurut penggerak kepuasan, bukan sekadar rata-rata terendah
+            penggerak = muat_penggerak(versi_data, filter_global)
+            rek = rekomendasi(agregat['rata_admin'], None if penggerak is None else penggerak['tabel'])
             
-            fig_tren = go.Figure()
+            col1, col2 = st.columns(2)
             
-            for aspek in aspek_admin:
-                fig_tren.add_trace(go.Scatter(
-                    x=df_sorted['Tanggal_Parse'],
-                    y=df_sorted[aspek],
-                    mode='lines+markers',
-                    name=aspek
-                ))
+            with col1:
+                st.error(f"**⚠️ Aspek yang Perlu Ditingkatkan:**")
+                st.write(f"• **{rek['terlemah']['aspek']}**: {rek['terlemah']['nilai']:.2f}/5.0"
+                         + (f" • kepentingan {rek['terlemah']['kepentingan']:.1f}%" if 'kepentingan' in rek['terlemah'] else ""))
+                for tindakan in rek['terlemah']['tindakan']:
+                    st.write(f"  - {tindakan}")
             
-            fig_tren.update_layout(
-                title='Tren Penilaian dari Waktu ke Waktu',
-                xaxis_title='Tanggal',
-                yaxis_title='Skor'
-            )
+            with col2:
+                st.success(f"**✅ Aspek yang Sudah Baik:**")
+                st.write(f"• **{rek['terkuat']['aspek']}**: {rek['terkuat']['nilai']:.2f}/5.0"
+                         + (f" • kepentingan {rek['terkuat']['kepentingan']:.1f}%" if 'kepentingan' in rek['terkuat'] else ""))
+                for tindakan in rek['terkuat']['tindakan']:
+                    st.write(f"  - {tindakan}")
             
-            st.plotly_chart(fig_tren, use_container_width=True)
-        
-        # Rekomendasi
-        st.markdown("---")
-        st.subheader("💡 Rekomendasi Perbaikan")
-        
-        # Identifikasi aspek terlemah
-        rata_aspek_admin = {aspek: df[aspek].mean() for aspek in aspek_admin}
-        aspek_terlemah = min(rata_aspek_admin, key=rata_aspek_admin.get)
-        aspek_terkuat = max(rata_aspek_admin, key=rata_aspek_admin.get)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.error(f"**⚠️ Aspek yang Perlu Ditingkatkan:**")
-            st.write(f"• **{aspek_terlemah}**: {rata_aspek_admin[aspek_terlemah]:.2f}/5.0")
-            
-            if aspek_terlemah == 'Waktu Tunggu':
-                st.write("  - Tambah loket layanan")
-                st.write("  - Implementasi sistem antrian online")
-                st.write("  - Optimalkan proses verifikasi dokumen")
-            elif aspek_terlemah == 'Kemudahan Prosedur':
-                st.write("  - Sederhanakan alur prosedur")
-                st.write("  - Buat panduan visual yang jelas")
-                st.write("  - Tingkatkan digitalisasi layanan")
-            elif aspek_terlemah == 'Kejelasan Informasi':
-                st.write("  - Perbaiki signage dan papan informasi")
-                st.write("  - Latih petugas informasi")
-                st.write("  - Lengkapi website dengan FAQ")
-        
-        with col2:
-            st.success(f"**✅ Aspek yang Sudah Baik:**")
-            st.write(f"• **{aspek_terkuat}**: {rata_aspek_admin[aspek_terkuat]:.2f}/5.0")
-            st.write("  - Pertahankan standar layanan")
-            st.write("  - Jadikan best practice untuk aspek lain")
-            st.write("  - Dokumentasi prosedur yang berhasil")
-        
-        # Saran responden
-        if 'Saran' in df.columns and df['Saran'].notna().any():
+            # Saran responden, dibaca per halaman dari indeks teks di penyimpanan
             st.markdown("---")
             st.subheader("💬 Saran dari Responden")
             
-            saran_list = df[df['Saran'].notna() & (df['Saran'] != '')]['Saran'].tolist()
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                kata_saran = st.text_input("🔍 Cari saran", placeholder="mis. antrian, informasi kurang jelas")
+            with col2:
+                nomor_saran = st.number_input("Halaman saran", min_value=1, value=1)
+            
+            df_saran, jumlah_saran = muat_saran(versi_data, kata_saran, filter_global, nomor_saran)
+            jumlah_halaman_saran = max(1, -(-jumlah_saran // UKURAN_HALAMAN_SARAN))
+            if nomor_saran > jumlah_halaman_saran:
+                # Jumlah halaman baru diketahui dari hasil pencarian; lewat akhir = halaman terakhir
+                nomor_saran = jumlah_halaman_saran
+                df_saran, jumlah_saran = muat_saran(versi_data, kata_saran, filter_global, nomor_saran)
             
-            if saran_list:
-                for i, saran in enumerate(saran_list[-10:], 1):  # Tampilkan 10 saran terakhir
-                    st.write(f"{i}. {saran}")
+            if jumlah_saran:
+                st.caption(f"{jumlah_saran:,} saran • halaman {nomor_saran}/{jumlah_halaman_saran}")
+                st.dataframe(df_saran, hide_index=True, use_container_width=True)
+            elif kata_saran.strip():
+                st.info("Tidak ada saran yang cocok dengan kata kunci")
             else:
                 st.info("Belum ada saran dari responden")
+            
+            # Kata dan frasa yang paling sering muncul
+            n_istilah = st.radio(
+                "Ringkasan Istilah", [1, 2], horizontal=True,
+                format_func={1: "Kata", 2: "Frasa (2 kata)"}.get
+            )
+            df_istilah = muat_istilah(versi_data, n_istilah, filter_global)
+            if not df_istilah.empty:
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    teratas = (df_istilah.groupby('Istilah')['Frekuensi'].sum()
+                               .nlargest(15).sort_values().reset_index())
+                    fig_istilah = px.bar(
+                        teratas, x='Frekuensi', y='Istilah', orientation='h',
+                        title='Istilah Terbanyak dalam Saran',
+                        color_discrete_sequence=['#1f4788']
+                    )
+                    grafik(fig_istilah, 'istilah')
+                
+                with col2:
+                    st.markdown("**5 Istilah Teratas per Jenis Layanan:**")
+                    per_layanan = (df_istilah.sort_values('Frekuensi', ascending=False, kind='stable')
+                                   .groupby('Jenis Layanan').head(5))
+                    st.dataframe(
+                        per_layanan.sort_values(['Jenis Layanan', 'Frekuensi'], ascending=[True, False]),
+                        hide_index=True, use_container_width=True
+                    )
     
-    with tab4:
-        st.header("📑 Data Mentah Responden")
-        
-        # Filter
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            filter_layanan = st.multiselect(
-                "Filter Jenis Layanan",
-                options=df['Jenis Layanan'].unique(),
-                default=df['Jenis Layanan'].unique()
+    with tab4, instrumen.bagian("tab4", aktif=tab4.open):
+        if tab4.open:
+            indeks = muat_indeks(versi_data)
+            df = indeks.df
+            st.header("📑 Data Mentah Responden")
+            
+            # Filter
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                filter_layanan = st.multiselect(
+                    "Filter Jenis Layanan",
+                    options=indeks.nilai('Jenis Layanan'),
+                    default=indeks.nilai('Jenis Layanan')
+                )
+            
+            with col2:
+                filter_gender = st.multiselect(
+                    "Filter Jenis Kelamin",
+                    options=indeks.nilai('Jenis Kelamin'),
+                    default=indeks.nilai('Jenis Kelamin')
+                )
+            
+            with col3:
+                min_kepuasan = st.slider(
+                    "Minimal Kepuasan",
+                    1, 5, 1
+                )
+            
+            col1, col2, col3 = st.columns([2, 1, 1])
+            
+            with col1:
+                kata_cari = st.text_input("🔍 Cari Nama / Saran")
+            
+            with col2:
+                kolom_urut = st.selectbox(
+                    "Urutkan berdasarkan",
+                    [None] + list(df.columns),
+                    format_func=lambda k: "(urutan input)" if k is None else k
+                )
+            
+            with col3:
+                urut_naik = st.toggle("Urut naik", value=True)
+            
+            # Terapkan filter lewat indeks boolean yang sudah dihitung
+            mask = indeks.mask(
+                filter_layanan, filter_gender, min_kepuasan, kata_cari,
+                dasar=muat_seleksi(versi_data, filter_global) if filter_global is not None else None
             )
-        
-        with col2:
-            filter_gender = st.multiselect(
-                "Filter Jenis Kelamin",
-                options=df['Jenis Kelamin'].unique(),
-                default=df['Jenis Kelamin'].unique()
+            jumlah_terpilih = int(mask.sum())
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                ukuran_halaman = st.selectbox("Baris per halaman", [25, 50, 100, 250], index=1)
+            
+            with col2:
+                nomor_halaman = st.number_input(
+                    "Halaman", min_value=1,
+                    max_value=max(1, -(-jumlah_terpilih // ukuran_halaman)), value=1
+                )
+            
+            df_halaman, jumlah_halaman = indeks.halaman(
+                mask, kolom_urut, urut_naik, nomor_halaman, ukuran_halaman
             )
-        
-        with col3:
-            min_kepuasan = st.slider(
-                "Minimal Kepuasan",
-                1, 5, 1
+            
+            st.write(
+                f"Menampilkan {len(df_halaman)} dari {jumlah_terpilih} data terfilter "
+                f"({len(df)} total) • halaman {nomor_halaman}/{jumlah_halaman}"
             )
-        
-        # Terapkan filter
-        df_filtered = df[
-            (df['Jenis Layanan'].isin(filter_layanan)) &
-            (df['Jenis Kelamin'].isin(filter_gender)) &
-            (df['Kepuasan Keseluruhan'] >= min_kepuasan)
-        ]
-        
-        st.write(f"Menampilkan {len(df_filtered)} dari {len(df)} data")
-        
-        # Tampilkan data
-        st.dataframe(
-            df_filtered.style.background_gradient(
-                cmap='RdYlGn',
-                subset=['Kepuasan Keseluruhan']
-            ),
-            use_container_width=True,
-            height=400
-        )
-        
-        # Statistik ringkas
-        st.markdown("---")
-        st.subheader("📊 Statistik Data yang Ditampilkan")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Jumlah Data", len(df_filtered))
-        
-        with col2:
-            st.metric("Rata-rata Kepuasan", f"{df_filtered['Kepuasan Keseluruhan'].mean():.2f}")
-        
-        with col3:
-            st.metric("Kepuasan Tertinggi", f"{df_filtered['Kepuasan Keseluruhan'].max():.2f}")
-        
-        with col4:
-            st.metric("Kepuasan Terendah", f"{df_filtered['Kepuasan Keseluruhan'].min():.2f}")
+            
+            # Styling hanya untuk baris pada halaman yang tampil
+            st.dataframe(
+                df_halaman.style.background_gradient(
+                    cmap='RdYlGn',
+                    subset=['Kepuasan Keseluruhan'],
+                    vmin=1,
+                    vmax=5
+                ),
+                use_container_width=True,
+                height=400
+            )
+            
+            # Statistik ringkas
+            st.markdown("---")
+            st.subheader("📊 Statistik Data yang Ditampilkan")
+            
+            col1, col2, col3, col4 = st.columns(4)
+            
+            skor_terpilih = df['Kepuasan Keseluruhan'].to_numpy()[mask]
+            ada_data = skor_terpilih.size > 0
+            
+            with col1:
+                st.metric("Jumlah Data", jumlah_terpilih)
+            
+            with col2:
+                st.metric("Rata-rata Kepuasan", f"{skor_terpilih.mean() if ada_data else np.nan:.2f}")
+            
+            with col3:
+                st.metric("Kepuasan Tertinggi", f"{skor_terpilih.max() if ada_data else np.nan:.2f}")
+            
+            with col4:
+                st.metric("Kepuasan Terendah", f"{skor_terpilih.min() if ada_data else np.nan:.2f}")
+            
+            # Laporan memori (opsional, karena membaca ulang data mentah)
+            if st.toggle("💾 Tampilkan Laporan Memori"):
+                st.dataframe(
+                    laporan_memori(repo.muat(), df).style.format(
+                        {'Sebelum (KB)': '{:.1f}', 'Sesudah (KB)': '{:.1f}', 'Hemat %': '{:.1f}%'}, na_rep='–'
+                    ),
+                    use_container_width=True
+                )
+            
+            # Baris yang ditolak validasi/deduplikasi saat ingest (form, kiosk, CSV)
+            st.markdown("---")
+            st.subheader("🧹 Laporan Kualitas Data")
+            
+            ringkasan_karantina = repo.ringkasan_karantina()
+            jumlah_karantina = int(ringkasan_karantina['Jumlah'].sum())
+            if jumlah_karantina == 0:
+                st.success("✅ Belum ada baris yang dikarantina.")
+            else:
+                col1, col2 = st.columns([1, 2])
+                
+                with col1:
+                    st.metric("Baris Dikarantina", jumlah_karantina)
+                    st.caption(
+                        f"{jumlah_karantina / (jumlah_karantina + total_responden):.1%} dari semua kiriman"
+                    )
+                
+                with col2:
+                    st.dataframe(laporan_kualitas(ringkasan_karantina), hide_index=True, use_container_width=True)
+                
+                st.markdown(f"**{min(jumlah_karantina, UKURAN_HALAMAN_KARANTINA)} baris karantina terbaru:**")
+                st.dataframe(
+                    repo.muat_karantina(UKURAN_HALAMAN_KARANTINA), hide_index=True, use_container_width=True
+                )
+
+    with tab5, instrumen.bagian("tab5", aktif=tab5.open):
+        if tab5.open:
+            st.header("🏢 Perbandingan Antar Kantor (ServQual)")
+            
+            dataset_partisi = get_dataset_partisi()
+            daftar_kantor = dataset_partisi.daftar_kantor()
+            
+            if not daftar_kantor:
+                st.info(
+                    "Belum ada dataset multi-kantor. Gunakan tombol sinkronisasi di sidebar atau "
+                    "`python -m imigrasi.partitions <folder> impor --kantor <nama> <file.csv>`"
+                )
+            else:
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    pilih_kantor = st.multiselect("Kantor", daftar_kantor, default=daftar_kantor)
+                
+                with col2:
+                    daftar_periode = dataset_partisi.daftar_periode()
+                    pilih_periode = st.multiselect("Periode (bulan)", daftar_periode, default=daftar_periode)
+                
+                # Hanya partisi kantor & bulan terpilih yang dibaca
+                df_banding = muat_perbandingan(tuple(pilih_kantor), tuple(pilih_periode))
+                
+                if df_banding.empty:
+                    st.warning("Tidak ada data untuk pilihan ini")
+                else:
+                    fig_banding = go.Figure()
+                    for kantor_banding, baris in df_banding.iterrows():
+                        fig_banding.add_trace(go.Bar(
+                            name=kantor_banding,
+                            x=ASPEK_SERVQUAL + [KEPUASAN],
+                            y=baris[ASPEK_SERVQUAL + [KEPUASAN]].astype(float)
+                        ))
+                    fig_banding.update_layout(
+                        title='Rata-rata Dimensi ServQual per Kantor',
+                        barmode='group',
+                        yaxis_range=[0, 5]
+                    )
+                    grafik(fig_banding, 'banding')
+                    
+                    st.dataframe(
+                        df_banding.style.format(
+                            {k: '{:.2f}' for k in ASPEK_SERVQUAL + [KEPUASAN]}
+                        ).background_gradient(cmap='RdYlGn', subset=ASPEK_SERVQUAL + [KEPUASAN]),
+                        use_container_width=True
+                    )
+
+    with tab6, instrumen.bagian("tab6", aktif=tab6.open):
+        if tab6.open:
+            st.header("🧊 Segmen Responden: Usia × Jenis Kelamin × Layanan × Bulan")
+            
+            # Seluruh tab dihitung dari kubus segmen (beberapa ratus sel), bukan baris responden
+            kubus = iris_kubus(muat_kubus(versi_data), *(filter_global or ()))
+            if filter_global is not None and any(filter_global[:2]):
+                st.caption("📅 Kubus berbutir bulanan: rentang tanggal filter dibulatkan ke bulan penuh.")
+            
+            daftar_bulan = sorted(kubus['Bulan'].unique())
+            if len(daftar_bulan) > 1:
+                bulan_awal, bulan_akhir = st.select_slider(
+                    "Bulan", options=daftar_bulan, value=(daftar_bulan[0], daftar_bulan[-1])
+                )
+                kubus = iris_kubus(kubus, bulan_awal, bulan_akhir)
+            
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                dimensi_baris = st.selectbox("Baris", DIMENSI_KUBUS, index=1)
+            with col2:
+                dimensi_kolom = st.selectbox("Kolom", ["(tidak ada)", *DIMENSI_KUBUS], index=3)
+            with col3:
+                ukuran_segmen = st.selectbox("Ukuran", UKURAN_KUBUS)
+            with col4:
+                skor_segmen = st.selectbox(
+                    "Skor", KOLOM_SKOR, index=len(KOLOM_SKOR) - 1,
+                    disabled=ukuran_segmen in ('% Puas', 'Responden')
+                )
+            dimensi_kolom = None if dimensi_kolom == "(tidak ada)" else dimensi_kolom
+            
+            if dimensi_kolom == dimensi_baris:
+                st.warning("Pilih dimensi kolom yang berbeda dari dimensi baris.")
+            elif kubus.empty:
+                st.warning("Tidak ada responden pada segmen ini.")
+            else:
+                pivot = pivot_kubus(kubus, dimensi_baris, dimensi_kolom, ukuran_segmen, skor_segmen)
+                format_ukuran = {'Responden': '{:,}', '% Puas': '{:.1f}%'}.get(ukuran_segmen, '{:.2f}')
+                if ukuran_segmen == '% Puas':
+                    st.caption("% Puas = persentase Kepuasan Keseluruhan ≥ 4.")
+                pilihan_pivot = st.dataframe(
+                    pivot.style.format(format_ukuran, na_rep='–').background_gradient(
+                        cmap='Blues' if ukuran_segmen == 'Responden' else 'RdYlGn', axis=None
+                    ),
+                    on_select='rerun',
+                    selection_mode='single-cell',
+                    key='pivot_segmen',
+                    use_container_width=True
+                )
+                
+                # Rincian sel terpilih (baris/kolom Total = semua nilai dimensi itu)
+                pilihan = {}
+                for posisi, nama_kolom in pilihan_pivot.selection.cells[:1]:
+                    if posisi < len(pivot) and nama_kolom in pivot.columns:
+                        pilihan[dimensi_baris] = pivot.index[posisi]
+                        if dimensi_kolom is not None:
+                            pilihan[dimensi_kolom] = nama_kolom
+                if not pilihan:
+                    st.caption("Klik sel pada tabel untuk menelusuri segmen tersebut.")
+                rincian = ringkasan_rollup(pilih_sel(kubus, pilihan))
+                
+                st.subheader("🔍 " + (" • ".join(f"{d}: {v}" for d, v in pilihan.items()) or "Semua segmen"))
+                if rincian['total_responden'] == 0:
+                    st.info("Sel ini tidak berisi responden.")
+                else:
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Responden", f"{rincian['total_responden']:,}")
+                    with col2:
+                        st.metric("Rata-rata Kepuasan", f"{rincian['rata_rata_kepuasan']:.2f}/5.0")
+                    with col3:
+                        st.metric("Tingkat Kepuasan", f"{rincian['persentase_puas']:.1f}%")
+                    
+                    deskriptif = rincian['deskriptif'].rename(
+                        columns={'mean': 'Rata-rata', 'std': 'Simpangan Baku'}
+                    )
+                    col1, col2 = st.columns([3, 2])
+                    with col1:
+                        fig_segmen = px.bar(
+                            deskriptif.reset_index(names='Aspek'),
+                            x='Aspek',
+                            y='Rata-rata',
+                            error_y='Simpangan Baku',
+                            title='Rata-rata Skor per Aspek (± simpangan baku)',
+                            color='Rata-rata',
+                            color_continuous_scale='RdYlGn',
+                            range_color=[1, 5]
+                        )
+                        fig_segmen.update_layout(yaxis_range=[0, 5.5], showlegend=False)
+                        grafik(fig_segmen, 'segmen')
+                    with col2:
+                        st.dataframe(deskriptif.style.format('{:.2f}', na_rep='–'), use_container_width=True)
+
+# Ringkasan instrumentasi rerun ini (total rerun dicatat saat panel/berkas metrik diperbarui)
+akhiri_rerun(panel_debug)
 
 # Footer
 st.markdown("---")
@@ -0,0 +1,201 @@
+"""Benchmark tiap tahap pipeline dashboard pada data sintetis.
+
+Jalankan dari root repositori:
+    python benchmarks/bench_pipeline.py --ukuran 10000 100000
+
+Setiap run ditambahkan ke benchmarks/hasil.jsonl (waktu, commit, ukuran,
+detik per tahap) lalu dibandingkan dengan run terakhir pada ukuran yang
+sama; tahap yang melambat lebih dari --toleransi ditandai REGRESI.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imigrasi.aggregates import hitung_agregat  # noqa: E402
+from imigrasi.bootstrap import interval_bootstrap  # noqa: E402
+from imigrasi.chart_data import pasangan_skor, tabel_frekuensi, tren_per_bucket  # noqa: E402
+from imigrasi.drivers import analisis_penggerak  # noqa: E402
+from imigrasi.importer import import_csv  # noqa: E402
+from imigrasi.kualitas import kunci_responden  # noqa: E402
+from imigrasi.kategori import kategori_kepuasan, kelompok_usia  # noqa: E402
+from imigrasi.kubus import kubus_batch, pivot_kubus  # noqa: E402
+from imigrasi.regression import regresi_berganda, regresi_sederhana  # noqa: E402
+from imigrasi.rollups import rollup_batch, tren_dari_rollup  # noqa: E402
+from imigrasi.running_stats import StatistikBerjalan  # noqa: E402
+from imigrasi.schema import ASPEK_ADMIN, ASPEK_ALL, KEPUASAN, KOLOM_SKOR, normalisasi  # noqa: E402
+from imigrasi.storage import RepositoriResponden  # noqa: E402
+from imigrasi.synthetic import buat_responden  # noqa: E402
+
+FILE_HASIL = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hasil.jsonl')
+JUMLAH_APPEND = 50
+BATAS_STYLER_PENUH = 20_000
+
+
+def _ukur(fungsi, ulang=3):
+    # Ambil waktu terbaik dari beberapa ulangan agar derau sistem berkurang
+    terbaik = float('inf')
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        fungsi()
+        terbaik = min(terbaik, time.perf_counter() - mulai)
+    return terbaik
+
+
+def jalankan(n, ulang=3):
+    """Kembalikan {nama tahap: detik} untuk n responden sintetis."""
+    mentah = buat_responden(n, seed=42)
+    csv = mentah.to_csv(index=False)
+    df = normalisasi(mentah)
+    hasil = {}
+
+    with tempfile.TemporaryDirectory() as folder:
+        def ingest():
+            repo = RepositoriResponden(os.path.join(folder, f'{time.perf_counter_ns()}.db'))
+            disimpan = import_csv(io.StringIO(csv), repo)['disimpan']
+            assert disimpan == n, f"hanya {disimpan} dari {n} responden tersimpan"
+        hasil['ingest_csv'] = _ukur(ingest, ulang=1)
+
+        repo = RepositoriResponden(os.path.join(folder, 'append.db'))
+        disimpan = repo.tambah_banyak(mentah)
+        assert disimpan == n, f"hanya {disimpan} dari {n} responden tersimpan"
+        baris = mentah.iloc[:JUMLAH_APPEND].to_dict('records')
+
+        def append_concat():
+            # Pola lama: DataFrame dibangun ulang dengan pd.concat per submit
+            data = mentah
+            for b in baris:
+                data = pd.concat([data, pd.DataFrame([b])], ignore_index=True)
+        hasil['append_concat_per_baris'] = _ukur(append_concat, ulang) / JUMLAH_APPEND
+
+        putaran = iter(range(ulang + 1))
+
+        def append_store():
+            # Nama diberi penanda per putaran agar tidak tertolak sebagai duplikat
+            u = next(putaran)
+            for b in baris:
+                repo.tambah({**b, 'Nama': f"{b['Nama']} {u}"})
+        hasil['append_store_per_baris'] = _ukur(append_store, ulang) / JUMLAH_APPEND
+        hasil['muat_store'] = _ukur(lambda: repo.muat(), ulang)
+
+    hasil['kunci_duplikat'] = _ukur(lambda: kunci_responden(mentah), ulang)
+    hasil['normalisasi'] = _ukur(lambda: normalisasi(mentah), ulang)
+    hasil['statistik_berjalan'] = _ukur(lambda: StatistikBerjalan.dari_df(df), ulang)
+    hasil['agregat_tab1_tab3'] = _ukur(lambda: hitung_agregat(df), ulang)
+    statistik = StatistikBerjalan.dari_df(df)
+    hasil['regresi'] = _ukur(lambda: (regresi_sederhana(statistik), regresi_berganda(statistik)), ulang)
+    hasil['analisis_penggerak'] = _ukur(lambda: analisis_penggerak(statistik), ulang)
+    hasil['bootstrap_interval'] = _ukur(lambda: interval_bootstrap(df), ulang=1)
+    hasil['kategori_vektor'] = _ukur(lambda: kategori_kepuasan(df[KEPUASAN]), ulang)
+    hasil['kategori_apply_lama'] = _ukur(
+        lambda: df[KEPUASAN].apply(lambda x: kategori_kepuasan(x)), ulang=1
+    )
+    hasil['data_grafik'] = _ukur(
+        lambda: (tabel_frekuensi(df, KOLOM_SKOR), pasangan_skor(df, ASPEK_ALL, KEPUASAN)), ulang
+    )
+    hasil['tren_per_bucket'] = _ukur(lambda: tren_per_bucket(df, ASPEK_ADMIN), ulang)
+    rollup = rollup_batch(df)
+    hasil['tren_dari_rollup'] = _ukur(lambda: tren_dari_rollup(rollup, ASPEK_ADMIN), ulang)
+    hasil['kubus_batch'] = _ukur(lambda: kubus_batch(df), ulang)
+    kubus = kubus_batch(df)
+    hasil['pivot_kubus'] = _ukur(lambda: pivot_kubus(kubus, 'Kelompok Usia', 'Jenis Kelamin'), ulang)
+    hasil['pivot_baris_lama'] = _ukur(
+        lambda: df.assign(**{'Kelompok Usia': kelompok_usia(df['Usia'])}).pivot_table(
+            index='Kelompok Usia', columns='Jenis Kelamin', values=KEPUASAN,
+            aggfunc='mean', margins=True, observed=True
+        ), ulang
+    )
+
+    halaman = df.head(50)
+    hasil['styler_halaman'] = _ukur(
+        lambda: halaman.style.background_gradient(cmap='RdYlGn', subset=[KEPUASAN]).to_html(), ulang
+    )
+    penuh = df.head(BATAS_STYLER_PENUH)
+    hasil[f'styler_{len(penuh)}_baris'] = _ukur(
+        lambda: penuh.style.background_gradient(cmap='RdYlGn', subset=[KEPUASAN]).to_html(), ulang=1
+    )
+
+    import plotly.graph_objects as go
+    frekuensi = tabel_frekuensi(df, [KEPUASAN])[KEPUASAN]
+    hasil['plotly_histogram_agregat'] = _ukur(
+        lambda: go.Figure(go.Bar(x=frekuensi.index, y=frekuensi.values)).to_json(), ulang
+    )
+    hasil['plotly_scatter_mentah'] = _ukur(
+        lambda: go.Figure(go.Scatter(x=df['Tanggal'], y=df[KEPUASAN], mode='lines+markers')).to_json(),
+        ulang=1
+    )
+    return hasil
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _run_sebelumnya(n):
+    if not os.path.exists(FILE_HASIL):
+        return None
+    terakhir = None
+    with open(FILE_HASIL, encoding='utf-8') as f:
+        for baris in f:
+            catatan = json.loads(baris)
+            if catatan['n'] == n:
+                terakhir = catatan
+    return terakhir
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ukuran', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--ulang', type=int, default=3)
+    parser.add_argument('--toleransi', type=float, default=0.25,
+                        help="Ambang perlambatan relatif yang dianggap regresi")
+    parser.add_argument('--tanpa-simpan', action='store_true')
+    parser.add_argument('--gagal-jika-regresi', action='store_true')
+    args = parser.parse_args(argv)
+
+    ada_regresi = False
+    for n in args.ukuran:
+        hasil = jalankan(n, args.ulang)
+        sebelumnya = _run_sebelumnya(n)
+        print(f"\n== {n} responden ==")
+        for tahap, detik in hasil.items():
+            tanda = ''
+            if sebelumnya and tahap in sebelumnya['tahap']:
+                lama = sebelumnya['tahap'][tahap]
+                rasio = detik / lama if lama else 1.0
+                tanda = f"  ({rasio:.2f}x vs {sebelumnya['commit']})"
+                if rasio > 1 + args.toleransi:
+                    tanda += "  REGRESI"
+                    ada_regresi = True
+            print(f"{tahap:<28} {detik * 1000:>12.2f} ms{tanda}")
+
+        if not args.tanpa_simpan:
+            with open(FILE_HASIL, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({
+                    'waktu': datetime.now().isoformat(timespec='seconds'),
+                    'commit': _commit(),
+                    'python': platform.python_version(),
+                    'pandas': pd.__version__,
+                    'n': n,
+                    'tahap': hasil,
+                }) + '\n')
+    return 1 if ada_regresi and args.gagal_jika_regresi else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
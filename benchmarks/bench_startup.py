@@ -0,0 +1,135 @@
+"""Waktu start dingin dashboard: profil import dan waktu sampai render pertama.
+
+Jalankan dari root repositori:
+    python benchmarks/bench_startup.py --ukuran 0 10000 --anggaran 8
+
+Setiap pengukuran memakai proses Python baru (cache Streamlit dan modul
+kosong), lalu menjalankan app.py sekali lewat AppTest seperti sesi pertama
+pengguna. Bila render pertama melebihi --anggaran detik, skrip keluar dengan
+kode 1 sehingga bisa dipakai sebagai gerbang CI.
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+
+AKAR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, AKAR)
+
+from imigrasi.storage import RepositoriResponden  # noqa: E402
+from imigrasi.synthetic import buat_responden  # noqa: E402
+
+FILE_HASIL = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hasil_startup.jsonl')
+# Modul yang dulu diimport di puncak app.py; harus tetap di luar render pertama.
+# (plotly, plotly.graph_objects dan pyarrow dasar sudah dimuat Streamlit sendiri.)
+MODUL_BERAT = ('plotly.express', 'pyarrow.parquet', 'openpyxl', 'statsmodels', 'scipy.stats')
+
+# Dijalankan di proses baru; mencetak JSON {detik, modul} di baris terakhir
+_SKRIP_RENDER = """
+import json, sys, time
+mulai = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=300).run()
+detik = time.perf_counter() - mulai
+if at.exception:
+    sys.exit('render gagal: ' + str(at.exception[0].value))
+print(json.dumps({{'detik': detik, 'modul': sorted(sys.modules)}}))
+"""
+_POLA_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def render_pertama(db, importtime=False):
+    """Jalankan app.py sekali di proses baru; ({'detik', 'modul'}, stderr)."""
+    perintah = [sys.executable]
+    if importtime:
+        perintah += ['-X', 'importtime']
+    perintah += ['-c', _SKRIP_RENDER.format(app=os.path.join(AKAR, 'app.py'))]
+    proses = subprocess.run(
+        perintah, cwd=AKAR, capture_output=True, text=True, check=True,
+        env={**os.environ, 'IMIGRASI_DB': db},
+    )
+    return json.loads(proses.stdout.strip().splitlines()[-1]), proses.stderr
+
+
+def profil_import(stderr, n=15):
+    """Modul tingkat atas dengan waktu import kumulatif terbesar: [(modul, detik)]."""
+    kumulatif = {}
+    for cocok in _POLA_IMPORTTIME.finditer(stderr):
+        # Indentasi 1 spasi = modul yang diimport langsung, bukan sub-import
+        if len(cocok.group(3)) == 1:
+            modul = cocok.group(4).split('.')[0]
+            kumulatif[modul] = kumulatif.get(modul, 0) + int(cocok.group(2)) / 1e6
+    return sorted(kumulatif.items(), key=lambda x: -x[1])[:n]
+
+
+def jalankan(n, ulang=3):
+    """Waktu render pertama terbaik dari `ulang` proses baru untuk database berisi n responden."""
+    with tempfile.TemporaryDirectory() as folder:
+        db = os.path.join(folder, 'responden.db')
+        if n:
+            disimpan = RepositoriResponden(db).tambah_banyak(buat_responden(n, seed=42))
+            assert disimpan == n, f"hanya {disimpan} dari {n} responden tersimpan"
+        terbaik, modul = float('inf'), []
+        for _ in range(ulang):
+            hasil, _ = render_pertama(db)
+            terbaik = min(terbaik, hasil['detik'])
+            modul = hasil['modul']
+        _, stderr = render_pertama(db, importtime=True)
+    berat = sorted(set(modul) & set(MODUL_BERAT))
+    return {'render_pertama': terbaik, 'modul_berat': berat, 'import': profil_import(stderr)}
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ukuran', type=int, nargs='+', default=[0, 10_000])
+    parser.add_argument('--ulang', type=int, default=3)
+    parser.add_argument('--anggaran', type=float, default=None,
+                        help="Batas detik render pertama; lewat batas = kode keluar 1")
+    parser.add_argument('--tanpa-simpan', action='store_true')
+    args = parser.parse_args(argv)
+
+    lewat = False
+    for n in args.ukuran:
+        hasil = jalankan(n, args.ulang)
+        print(f"\n== {n} responden ==")
+        tanda = ''
+        if args.anggaran is not None:
+            if hasil['render_pertama'] > args.anggaran:
+                tanda = f"  MELEBIHI ANGGARAN {args.anggaran:.2f} s"
+                lewat = True
+            else:
+                tanda = f"  (anggaran {args.anggaran:.2f} s)"
+        print(f"{'render_pertama':<28} {hasil['render_pertama'] * 1000:>12.2f} ms{tanda}")
+        print(f"{'modul berat termuat':<28} {', '.join(hasil['modul_berat']) or '-'}")
+        print("import kumulatif (dengan -X importtime):")
+        for modul, detik in hasil['import']:
+            print(f"  {modul:<26} {detik * 1000:>12.2f} ms")
+
+        if not args.tanpa_simpan:
+            with open(FILE_HASIL, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({
+                    'waktu': datetime.now().isoformat(timespec='seconds'),
+                    'commit': _commit(),
+                    'python': platform.python_version(),
+                    'n': n,
+                    **hasil,
+                }) + '\n')
+    return 1 if lewat else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Komponen inti Sistem Analisis Kepuasan Pelayanan Imigrasi."""
@@ -0,0 +1,69 @@
+"""Agregat statistik dashboard, dihitung sekali per versi dataset."""
+import numpy as np
+import pandas as pd
+
+from imigrasi.running_stats import StatistikBerjalan
+from imigrasi.schema import ASPEK_ALL, ASPEK_ADMIN, ASPEK_SERVQUAL, KEPUASAN, KOLOM_SKOR
+
+HARAPAN = 5.0
+
+KOLOM_AGREGAT = ('Jenis Kelamin', 'Jenis Layanan', *KOLOM_SKOR)
+
+
+def hitung_agregat(df):
+    """Hitung semua statistik tab1-tab3 dalam satu lintasan vektor."""
+    return agregat_dari_statistik(StatistikBerjalan.dari_df(df))
+
+
+def agregat_dari_statistik(stat):
+    """Bentuk tabel-tabel dashboard dari StatistikBerjalan tanpa membaca baris."""
+    total = stat.n
+    rata = pd.Series(stat.mean if total else np.nan, index=KOLOM_SKOR)
+
+    deskriptif = pd.DataFrame({
+        'mean': rata,
+        'std': np.sqrt(stat.varians()),
+        'min': np.where(np.isinf(stat.min), np.nan, stat.min),
+        'max': np.where(np.isinf(stat.max), np.nan, stat.max),
+    }, index=KOLOM_SKOR)
+
+    matriks_korelasi = pd.DataFrame(stat.korelasi(), index=KOLOM_SKOR, columns=KOLOM_SKOR)
+
+    df_korelasi = pd.DataFrame({
+        'Aspek': ASPEK_ALL,
+        'Korelasi': matriks_korelasi.loc[ASPEK_ALL, KEPUASAN].to_numpy(),
+    }).sort_values('Korelasi', ascending=False)
+
+    realisasi = rata[ASPEK_ALL].to_numpy()
+    gap = realisasi - HARAPAN
+    df_gap = pd.DataFrame({
+        'Aspek': ASPEK_ALL,
+        'Harapan': HARAPAN,
+        'Realisasi': realisasi,
+        'Gap': gap,
+        'Gap %': gap / HARAPAN * 100,
+    })
+
+    per_layanan = pd.DataFrame(
+        {layanan: np.array(entri[1:]) / entri[0] for layanan, entri in stat.per_layanan.items()},
+        index=KOLOM_SKOR,
+    ).T.sort_index()
+    per_layanan.index.name = 'Jenis Layanan'
+    jenis_kelamin = pd.Series(stat.per_kelamin, name='count', dtype='int64').sort_values(ascending=False)
+    jenis_kelamin.index.name = 'Jenis Kelamin'
+    kolom_admin = ASPEK_ADMIN + [KEPUASAN]
+
+    return {
+        'total_responden': total,
+        'rata_rata_kepuasan': rata[KEPUASAN],
+        'persentase_puas': stat.puas / total * 100 if total else 0.0,
+        'deskriptif': deskriptif.loc[ASPEK_ALL],
+        'kepuasan_layanan': per_layanan[KEPUASAN].sort_values(),
+        'jenis_kelamin': jenis_kelamin,
+        'rata_servqual': rata[ASPEK_SERVQUAL],
+        'df_korelasi': df_korelasi,
+        'df_gap': df_gap,
+        'df_layanan': per_layanan[kolom_admin],
+        'korelasi_admin': matriks_korelasi.loc[kolom_admin, kolom_admin],
+        'rata_admin': rata[ASPEK_ADMIN],
+    }
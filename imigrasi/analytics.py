@@ -0,0 +1,231 @@
+"""Laporan analisis kepuasan tanpa Streamlit/Plotly, plus antarmuka baris perintah.
+
+Contoh:
+    python -m imigrasi.analytics data/langsa.csv data/medan.db --format excel --output laporan/
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from imigrasi.aggregates import agregat_dari_statistik
+from imigrasi.drivers import analisis_penggerak
+from imigrasi.importer import baca_csv
+from imigrasi.kategori import kategori_kepuasan
+from imigrasi.regression import regresi_berganda, regresi_sederhana
+from imigrasi.running_stats import StatistikBerjalan
+from imigrasi.schema import normalisasi
+from imigrasi.storage import RepositoriResponden
+
+TINDAKAN_PERBAIKAN = {
+    'Waktu Tunggu': [
+        "Tambah loket layanan",
+        "Implementasi sistem antrian online",
+        "Optimalkan proses verifikasi dokumen",
+    ],
+    'Kemudahan Prosedur': [
+        "Sederhanakan alur prosedur",
+        "Buat panduan visual yang jelas",
+        "Tingkatkan digitalisasi layanan",
+    ],
+    'Kejelasan Informasi': [
+        "Perbaiki signage dan papan informasi",
+        "Latih petugas informasi",
+        "Lengkapi website dengan FAQ",
+    ],
+}
+TINDAKAN_PERTAHANKAN = [
+    "Pertahankan standar layanan",
+    "Jadikan best practice untuk aspek lain",
+    "Dokumentasi prosedur yang berhasil",
+]
+
+
+def muat_dataset(path):
+    """Baca dataset responden dari CSV atau database SQLite aplikasi."""
+    # RepositoriResponden membuat database baru bila path tidak ada
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Dataset tidak ditemukan: {path}")
+    if path.endswith('.db'):
+        return normalisasi(RepositoriResponden(path).muat())
+    df, _ = baca_csv(path)
+    return df
+
+
+def rekomendasi(rata_admin, penggerak=None):
+    """Aspek administrasi yang perlu ditingkatkan dan yang dipertahankan beserta tindakannya.
+
+    Dengan tabel `penggerak` (analisis_penggerak), aspek yang ditingkatkan adalah
+    yang potensinya terbesar (kepentingan relatif x jarak ke harapan) dan yang
+    dipertahankan adalah penggerak terpenting di kuadran "Pertahankan";
+    tanpa tabel dipakai rata-rata terendah dan tertinggi. None bila belum ada data.
+    """
+    if rata_admin.isna().all():
+        return None
+    if penggerak is None:
+        terlemah = rata_admin.idxmin()
+        terkuat = rata_admin.idxmax()
+    else:
+        tabel = penggerak.loc[rata_admin.index]
+        terlemah = tabel['Potensi'].idxmax()
+        dipertahankan = tabel[(tabel['Kuadran'] == "Pertahankan") & (tabel.index != terlemah)]
+        if len(dipertahankan):
+            terkuat = dipertahankan['Kepentingan %'].idxmax()
+        else:
+            terkuat = rata_admin.drop(terlemah).idxmax()
+    hasil = {
+        'terlemah': {
+            'aspek': terlemah,
+            'nilai': float(rata_admin[terlemah]),
+            'tindakan': TINDAKAN_PERBAIKAN.get(terlemah, []),
+        },
+        'terkuat': {
+            'aspek': terkuat,
+            'nilai': float(rata_admin[terkuat]),
+            'tindakan': TINDAKAN_PERTAHANKAN,
+        },
+    }
+    if penggerak is not None:
+        for kunci in ('terlemah', 'terkuat'):
+            hasil[kunci]['kepentingan'] = float(penggerak.loc[hasil[kunci]['aspek'], 'Kepentingan %'])
+    return hasil
+
+
+def hitung_laporan(df=None, statistik=None):
+    """Hitung statistik tab1-tab3, regresi dan rekomendasi dari frame atau statistik."""
+    if statistik is None:
+        statistik = StatistikBerjalan.dari_df(df)
+    agregat = agregat_dari_statistik(statistik)
+    penggerak = analisis_penggerak(statistik)
+    tabel_penggerak = None if penggerak is None else penggerak['tabel']
+    return {
+        'ringkasan': {
+            'total_responden': agregat['total_responden'],
+            'rata_rata_kepuasan': agregat['rata_rata_kepuasan'],
+            'persentase_puas': agregat['persentase_puas'],
+            'status': kategori_kepuasan(agregat['rata_rata_kepuasan']),
+        },
+        'deskriptif': agregat['deskriptif'],
+        'kepuasan_layanan': agregat['kepuasan_layanan'],
+        'jenis_kelamin': agregat['jenis_kelamin'],
+        'korelasi': agregat['df_korelasi'],
+        'gap': agregat['df_gap'],
+        'per_layanan': agregat['df_layanan'],
+        'korelasi_admin': agregat['korelasi_admin'],
+        'regresi_sederhana': regresi_sederhana(statistik),
+        'regresi_berganda': regresi_berganda(statistik),
+        'penggerak': tabel_penggerak,
+        'rekomendasi': rekomendasi(agregat['rata_admin'], tabel_penggerak),
+    }
+
+
+def _ke_python(nilai):
+    if isinstance(nilai, pd.DataFrame):
+        return json.loads(nilai.to_json(orient='index', force_ascii=False))
+    if isinstance(nilai, pd.Series):
+        return json.loads(nilai.to_json(force_ascii=False))
+    if isinstance(nilai, dict):
+        return {k: _ke_python(v) for k, v in nilai.items()}
+    if isinstance(nilai, (list, tuple)):
+        return [_ke_python(v) for v in nilai]
+    if isinstance(nilai, (np.integer, np.floating)):
+        nilai = nilai.item()
+    if isinstance(nilai, float) and not np.isfinite(nilai):
+        return None
+    return nilai
+
+
+def ke_json(laporan, **kwargs):
+    return json.dumps(_ke_python(laporan), ensure_ascii=False, **kwargs)
+
+
+def lembar_excel(laporan):
+    """Tabel laporan sebagai {nama sheet: DataFrame}."""
+    ringkasan = pd.DataFrame([laporan['ringkasan']])
+    rek = laporan['rekomendasi']
+    lembar = {
+        'Ringkasan': ringkasan,
+        'Statistik Deskriptif': laporan['deskriptif'],
+        'Korelasi': laporan['korelasi'],
+        'Gap Analysis': laporan['gap'],
+        'Per Jenis Layanan': laporan['per_layanan'],
+        'Regresi Sederhana': laporan['regresi_sederhana'],
+        'Regresi Berganda': laporan['regresi_berganda']['koefisien'],
+    }
+    if rek is not None:
+        lembar['Rekomendasi'] = pd.DataFrame([
+            {'Jenis': 'Perlu Ditingkatkan', 'Aspek': rek['terlemah']['aspek'],
+             'Nilai': rek['terlemah']['nilai'], 'Tindakan': '; '.join(rek['terlemah']['tindakan'])},
+            {'Jenis': 'Sudah Baik', 'Aspek': rek['terkuat']['aspek'],
+             'Nilai': rek['terkuat']['nilai'], 'Tindakan': '; '.join(rek['terkuat']['tindakan'])},
+        ])
+    if laporan.get('penggerak') is not None:
+        lembar['Penggerak Kepuasan'] = laporan['penggerak']
+    return lembar
+
+
+def ke_excel(laporan, tujuan):
+    with pd.ExcelWriter(tujuan, engine='openpyxl') as penulis:
+        for nama, tabel in lembar_excel(laporan).items():
+            tabel.to_excel(penulis, sheet_name=nama, index=not isinstance(tabel.index, pd.RangeIndex))
+
+
+def proses_file(path, format_keluaran, folder_keluaran):
+    """Satu unit kerja CLI: muat dataset, hitung laporan, tulis ke folder keluaran.
+
+    Kembalikan path laporan, atau None bila dataset tidak berisi responden.
+    """
+    laporan = hitung_laporan(muat_dataset(path))
+    if laporan['ringkasan']['total_responden'] == 0:
+        return None
+    nama = os.path.splitext(os.path.basename(path))[0]
+    if format_keluaran == 'excel':
+        tujuan = os.path.join(folder_keluaran, f"{nama}.xlsx")
+        ke_excel(laporan, tujuan)
+    else:
+        tujuan = os.path.join(folder_keluaran, f"{nama}.json")
+        with open(tujuan, 'w', encoding='utf-8') as f:
+            f.write(ke_json(laporan, indent=2))
+    return tujuan
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m imigrasi.analytics',
+        description="Hitung laporan kepuasan pelayanan untuk satu atau banyak dataset."
+    )
+    parser.add_argument('dataset', nargs='+', help="File CSV atau database .db")
+    parser.add_argument('--format', choices=['json', 'excel'], default='json')
+    parser.add_argument('--output', default='.', help="Folder tujuan laporan")
+    parser.add_argument('--jobs', type=int, default=1, help="Jumlah proses paralel")
+    args = parser.parse_args(argv)
+
+    hilang = [path for path in args.dataset if not os.path.exists(path)]
+    if hilang:
+        parser.error(f"dataset tidak ditemukan: {', '.join(hilang)}")
+
+    os.makedirs(args.output, exist_ok=True)
+    if args.jobs > 1 and len(args.dataset) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            hasil = list(pool.map(
+                proses_file, args.dataset,
+                [args.format] * len(args.dataset), [args.output] * len(args.dataset)
+            ))
+    else:
+        hasil = [proses_file(path, args.format, args.output) for path in args.dataset]
+    kosong = False
+    for path, tujuan in zip(args.dataset, hasil):
+        if tujuan is None:
+            print(f"{path}: tidak ada data responden", file=sys.stderr)
+            kosong = True
+        else:
+            print(tujuan)
+    return 1 if kosong else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
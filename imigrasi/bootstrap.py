@@ -0,0 +1,137 @@
+"""Interval kepercayaan bootstrap untuk rata-rata, gap dan korelasi aspek.
+
+Setiap blok replikasi diambil sebagai matriks indeks (replikasi x n) yang
+diubah menjadi bobot frekuensi, sehingga jumlah tertimbang semua statistik
+cukup satu perkalian matriks bobot @ fitur. Blok dibagi ke pool proses bila
+datanya besar.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from imigrasi.aggregates import HARAPAN
+from imigrasi.schema import ASPEK_ALL, KEPUASAN, KOLOM_SKOR
+
+JUMLAH_REPLIKASI = 2000
+# Batas elemen matriks indeks per blok agar memori per pekerja tetap kecil
+ELEMEN_PER_BLOK = 4_000_000
+# Di bawah (replikasi x baris) ini start-up pool proses lebih mahal dari hitungannya
+BATAS_PARALEL = 50_000_000
+
+_N = len(KOLOM_SKOR)
+_fitur = None
+
+
+def _siapkan(fitur):
+    # Initializer pekerja: fitur dikirim sekali per proses, bukan per blok
+    global _fitur
+    _fitur = fitur
+
+
+def _jumlah_blok(benih, ukuran, fitur=None):
+    """Jumlah fitur tertimbang untuk `ukuran` replikasi bootstrap."""
+    fitur = _fitur if fitur is None else fitur
+    n = len(fitur)
+    rng = np.random.default_rng(benih)
+    indeks = rng.integers(0, n, size=(ukuran, n))
+    bobot = np.bincount(
+        (indeks + np.arange(ukuran)[:, None] * n).ravel(), minlength=ukuran * n
+    ).reshape(ukuran, n)
+    return bobot @ fitur
+
+
+def replikasi_jumlah(fitur, replikasi=JUMLAH_REPLIKASI, seed=0, maks_pekerja=None):
+    """Matriks (replikasi x kolom fitur) berisi jumlah fitur tiap sampel ulang.
+
+    Hasil sama untuk seed yang sama, dijalankan serial maupun paralel.
+    """
+    n = len(fitur)
+    per_blok = max(1, min(replikasi, ELEMEN_PER_BLOK // max(n, 1)))
+    ukuran = [min(per_blok, replikasi - i) for i in range(0, replikasi, per_blok)]
+    benih = np.random.SeedSequence(seed).spawn(len(ukuran))
+    maks_pekerja = maks_pekerja or os.cpu_count() or 1
+    if maks_pekerja == 1 or len(ukuran) == 1 or replikasi * n < BATAS_PARALEL:
+        hasil = [_jumlah_blok(b, u, fitur) for b, u in zip(benih, ukuran)]
+    else:
+        # spawn, bukan fork: server Streamlit multi-thread tidak aman di-fork
+        with ProcessPoolExecutor(
+            max_workers=min(maks_pekerja, len(ukuran)),
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_siapkan, initargs=(fitur,),
+        ) as pool:
+            hasil = list(pool.map(_jumlah_blok, benih, ukuran))
+    return np.vstack(hasil)
+
+
+def _persentil(replikasi, tingkat):
+    alfa = (1 - tingkat) / 2 * 100
+    return np.nanpercentile(replikasi, [alfa, 100 - alfa], axis=0)
+
+
+def _p_dua_sisi(replikasi):
+    # Proporsi replikasi di sisi nol yang berlawanan, dikali dua
+    with np.errstate(invalid='ignore'):
+        kiri = np.nanmean(replikasi <= 0, axis=0)
+        kanan = np.nanmean(replikasi >= 0, axis=0)
+    return np.minimum(1.0, 2 * np.minimum(kiri, kanan))
+
+
+def interval_bootstrap(df, replikasi=JUMLAH_REPLIKASI, tingkat=0.95, seed=0, maks_pekerja=None):
+    """Interval persentil untuk rata-rata skor, gap terhadap HARAPAN dan korelasi dengan kepuasan.
+
+    Kembalikan dict 'rata', 'gap' dan 'korelasi' (DataFrame per aspek);
+    None bila responden lengkap kurang dari dua.
+    """
+    skor = df[KOLOM_SKOR].to_numpy(dtype='float64')
+    skor = skor[~np.isnan(skor).any(axis=1)]
+    n = len(skor)
+    if n < 2:
+        return None
+    # Dipusatkan dulu agar selisih jumlah kuadrat tidak kehilangan presisi
+    rata_asli = skor.mean(axis=0)
+    pusat = skor - rata_asli
+    fitur = np.hstack([pusat, pusat ** 2, pusat[:, :-1] * pusat[:, -1:]])
+
+    jumlah = replikasi_jumlah(fitur, replikasi, seed, maks_pekerja) / n
+    m = jumlah[:, :_N]
+    var = jumlah[:, _N:2 * _N] - m ** 2
+    kov = jumlah[:, 2 * _N:] - m[:, :-1] * m[:, -1:]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        r = kov / np.sqrt(var[:, :-1] * var[:, -1:])
+        r_asli = (pusat[:, :-1] * pusat[:, -1:]).mean(axis=0) / np.sqrt(
+            (pusat[:, :-1] ** 2).mean(axis=0) * (pusat[:, -1] ** 2).mean()
+        )
+    rata = m + rata_asli
+    gap = rata[:, :-1] - HARAPAN
+
+    bawah, atas = _persentil(rata, tingkat)
+    tabel_rata = pd.DataFrame(
+        {'Rata-rata': rata_asli, 'Bawah': bawah, 'Atas': atas}, index=KOLOM_SKOR
+    )
+    bawah, atas = _persentil(gap, tingkat)
+    tabel_gap = pd.DataFrame({
+        'Gap': rata_asli[:-1] - HARAPAN, 'Bawah': bawah, 'Atas': atas, 'p-value': _p_dua_sisi(gap),
+    }, index=ASPEK_ALL)
+    bawah, atas = _persentil(r, tingkat)
+    tabel_korelasi = pd.DataFrame({
+        'Korelasi': r_asli, 'Bawah': bawah, 'Atas': atas, 'p-value': _p_dua_sisi(r),
+    }, index=ASPEK_ALL)
+    return {'rata': tabel_rata, 'gap': tabel_gap, 'korelasi': tabel_korelasi, 'n': n, 'replikasi': replikasi}
+
+
+def interval_per_kelompok(df, kolom='Jenis Layanan', target=KEPUASAN,
+                          replikasi=JUMLAH_REPLIKASI, tingkat=0.95, seed=0):
+    """Rata-rata target per kelompok beserta interval bootstrap (kelompok kecil)."""
+    baris = []
+    for nama, grup in df.groupby(kolom, observed=True):
+        nilai = grup[target].dropna().to_numpy(dtype='float64')
+        if len(nilai) == 0:
+            continue
+        rata = nilai.mean()
+        jumlah = replikasi_jumlah((nilai - rata)[:, None], replikasi, seed, maks_pekerja=1)
+        bawah, atas = _persentil(jumlah[:, 0] / len(nilai) + rata, tingkat)
+        baris.append({kolom: nama, 'n': len(nilai), 'Rata-rata': rata, 'Bawah': bawah, 'Atas': atas})
+    return pd.DataFrame(baris, columns=[kolom, 'n', 'Rata-rata', 'Bawah', 'Atas']).set_index(kolom)
@@ -0,0 +1,148 @@
+"""Data grafik yang sudah direduksi di server sebelum dikirim ke browser."""
+import numpy as np
+import pandas as pd
+
+# Di atas jumlah titik ini grafik garis memakai Scattergl (WebGL)
+BATAS_WEBGL = 5_000
+TITIK_LTTB = 1_000
+
+# Kandidat ukuran bucket, dari yang paling halus
+FREKUENSI = [('h', 'Per Jam'), ('D', 'Harian'), ('W', 'Mingguan'), ('M', 'Bulanan')]
+_DURASI = {'h': pd.Timedelta(hours=1), 'D': pd.Timedelta(days=1),
+           'W': pd.Timedelta(weeks=1), 'M': pd.Timedelta(days=30)}
+
+
+def pilih_frekuensi(tanggal, maks_bucket=200):
+    """Pilih bucket terhalus yang menghasilkan paling banyak maks_bucket titik."""
+    if len(tanggal) == 0:
+        return 'D'
+    rentang = tanggal.max() - tanggal.min()
+    for frek, _ in FREKUENSI:
+        if rentang / _DURASI[frek] <= maks_bucket:
+            return frek
+    return FREKUENSI[-1][0]
+
+
+def tren_per_bucket(df, kolom, frek=None, z=1.96):
+    """Rata-rata, jumlah dan pita kepercayaan (normal) per bucket waktu.
+
+    Hasil dalam format panjang: Tanggal, Aspek, Rata-rata, n, Bawah, Atas.
+    """
+    frek = frek or pilih_frekuensi(df['Tanggal'])
+    bucket = df['Tanggal'].dt.to_period(frek).dt.start_time
+    grup = df[kolom].astype('float64').groupby(bucket)
+    ringkas = grup.agg(['mean', 'count', 'std'])
+    return susun_tren(ringkas, kolom, z), frek
+
+
+def susun_tren(ringkas, kolom, z=1.96):
+    """Ubah ringkasan per bucket (kolom MultiIndex aspek x mean/count/std) ke format panjang."""
+    hasil = []
+    for aspek in kolom:
+        r = ringkas[aspek]
+        galat = z * r['std'].fillna(0) / np.sqrt(r['count'])
+        hasil.append(pd.DataFrame({
+            'Tanggal': r.index,
+            'Aspek': aspek,
+            'Rata-rata': r['mean'].to_numpy(),
+            'n': r['count'].to_numpy(),
+            'Bawah': (r['mean'] - galat).to_numpy(),
+            'Atas': (r['mean'] + galat).to_numpy(),
+        }))
+    return pd.concat(hasil, ignore_index=True)
+
+
+def lttb(x, y, n_keluar):
+    """Largest-Triangle-Three-Buckets: kembalikan indeks titik yang dipertahankan.
+
+    x harus numerik dan terurut naik (mis. timestamp dalam int64).
+    """
+    n = len(x)
+    if n_keluar >= n or n_keluar < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+
+    # Batas bucket untuk titik di antara titik pertama dan terakhir
+    batas = np.linspace(1, n - 1, n_keluar - 1).astype(np.int64)
+    terpilih = np.empty(n_keluar, dtype=np.int64)
+    terpilih[0] = 0
+    terpilih[-1] = n - 1
+    a = 0
+    for i in range(n_keluar - 2):
+        awal, akhir = batas[i], batas[i + 1]
+        # Titik rata-rata bucket berikutnya sebagai titik ketiga segitiga
+        berikut_awal, berikut_akhir = akhir, batas[i + 2] if i + 2 < len(batas) else n
+        cx = x[berikut_awal:berikut_akhir].mean()
+        cy = y[berikut_awal:berikut_akhir].mean()
+        luas = np.abs(
+            (x[a] - cx) * (y[awal:akhir] - y[a]) - (x[a] - x[awal:akhir]) * (cy - y[a])
+        )
+        a = awal + int(np.argmax(luas))
+        terpilih[i + 1] = a
+    return terpilih
+
+
+def seri_lttb(df, kolom, n_keluar=TITIK_LTTB):
+    """Turunkan resolusi tiap seri aspek (diurutkan per Tanggal) dengan LTTB."""
+    df = df.sort_values('Tanggal')
+    x = df['Tanggal'].to_numpy().astype('int64')
+    hasil = {}
+    for aspek in kolom:
+        idx = lttb(x, df[aspek].to_numpy(), n_keluar)
+        hasil[aspek] = df.iloc[idx][['Tanggal', aspek]].rename(columns={aspek: 'Skor'})
+    return hasil
+
+
+SKALA = np.arange(1, 6)
+
+
+def tabel_frekuensi(df, kolom):
+    """Jumlah responden per skor 1-5 untuk tiap kolom (index = skor)."""
+    return pd.DataFrame(
+        {k: np.bincount(df[k].to_numpy(dtype=np.int64), minlength=6)[1:6] for k in kolom},
+        index=pd.Index(SKALA, name='Skor'),
+    )
+
+
+def _kuantil_frekuensi(frek, p):
+    # Kuantil interpolasi linier (seperti numpy/plotly) langsung dari tabel frekuensi
+    kumulatif = np.cumsum(frek)
+    posisi = p * (kumulatif[-1] - 1)
+    bawah, atas = int(np.floor(posisi)), int(np.ceil(posisi))
+    nilai_bawah = SKALA[np.searchsorted(kumulatif, bawah, side='right')]
+    nilai_atas = SKALA[np.searchsorted(kumulatif, atas, side='right')]
+    return nilai_bawah + (nilai_atas - nilai_bawah) * (posisi - bawah)
+
+
+def ringkasan_box(frekuensi):
+    """Statistik box plot (kuartil, pagar, mean, sd) dari tabel frekuensi."""
+    hasil = {}
+    for kolom, frek in frekuensi.items():
+        frek = frek.to_numpy()
+        if frek.sum() == 0:
+            continue
+        q1, median, q3 = (_kuantil_frekuensi(frek, p) for p in (0.25, 0.5, 0.75))
+        iqr = q3 - q1
+        ada = SKALA[frek > 0]
+        mean = (SKALA * frek).sum() / frek.sum()
+        sd = np.sqrt((frek * (SKALA - mean) ** 2).sum() / max(frek.sum() - 1, 1))
+        hasil[kolom] = {
+            'q1': q1, 'median': median, 'q3': q3,
+            'lowerfence': ada[ada >= q1 - 1.5 * iqr].min(),
+            'upperfence': ada[ada <= q3 + 1.5 * iqr].max(),
+            'mean': mean, 'sd': sd,
+        }
+    return pd.DataFrame(hasil).T
+
+
+def pasangan_skor(df, kolom_x, kolom_y):
+    """Jumlah responden per pasangan skor (x, y), hanya pasangan yang muncul."""
+    y = df[kolom_y].to_numpy(dtype=np.int64)
+    hasil = {}
+    for k in kolom_x:
+        x = df[k].to_numpy(dtype=np.int64)
+        jumlah = np.bincount((x - 1) * 5 + (y - 1), minlength=25).reshape(5, 5)
+        xi, yi = np.nonzero(jumlah)
+        hasil[k] = pd.DataFrame({'x': SKALA[xi], 'y': SKALA[yi], 'n': jumlah[xi, yi]})
+    return hasil
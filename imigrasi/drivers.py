@@ -0,0 +1,121 @@
+"""Analisis penggerak kepuasan: regresi ridge dan kepentingan relatif Shapley/LMG.
+
+Semua dihitung dari matriks co-moment StatistikBerjalan, tanpa membaca baris.
+R² untuk seluruh 2^p subset aspek diselesaikan sekaligus sebagai satu batch
+persamaan normal p x p, lalu dibagi ke tiap aspek dengan bobot Shapley.
+"""
+from math import factorial
+
+import numpy as np
+import pandas as pd
+
+from imigrasi.aggregates import HARAPAN
+from imigrasi.schema import ASPEK_ALL, KEPUASAN, KOLOM_SKOR
+
+_IDX_X = [KOLOM_SKOR.index(k) for k in ASPEK_ALL]
+_IDX_Y = KOLOM_SKOR.index(KEPUASAN)
+_P = len(ASPEK_ALL)
+
+# Kandidat penalti ridge pada skala korelasi; dipilih dengan GCV
+GRID_ALFA = np.logspace(-4, 1, 26)
+
+KUADRAN = {
+    (True, False): "Prioritas Utama",
+    (True, True): "Pertahankan",
+    (False, False): "Prioritas Rendah",
+    (False, True): "Berlebihan",
+}
+
+# Subset ke-s memuat aspek j bila bit j pada s menyala
+_SUBSET = np.arange(2 ** _P)
+_BIT = 1 << np.arange(_P)
+_ANGGOTA = (_SUBSET[:, None] & _BIT) != 0
+_BOBOT_SHAPLEY = np.array([factorial(k) * factorial(_P - k - 1) / factorial(_P) for k in range(_P)])
+
+
+def _r2_ridge(rxx, rxy, koef):
+    # R² kecocokan ridge pada skala baku: 2 b'r - b'Rb (= b'r bila alfa 0)
+    return 2 * (koef * rxy).sum(axis=-1) - np.einsum('...i,ij,...j->...', koef, rxx, koef)
+
+
+def pilih_alfa(rxx, rxy, n, grid=GRID_ALFA):
+    """Penalti ridge dengan generalized cross-validation terkecil (dari dekomposisi eigen)."""
+    d, v = np.linalg.eigh(rxx)
+    z2 = (v.T @ rxy) ** 2
+    d, alfa = d[None, :], grid[:, None]
+    r2 = (z2 * (d + 2 * alfa) / (d + alfa) ** 2).sum(axis=1)
+    derajat = (d / (d + alfa)).sum(axis=1) + 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gcv = (1 - r2) / (1 - derajat / n) ** 2
+    return float(grid[np.nanargmin(gcv)])
+
+
+def r2_subset(rxx, rxy, alfa=0.0):
+    """R² ridge untuk semua 2^p subset prediktor, satu np.linalg.solve ber-batch."""
+    dalam = _ANGGOTA[:, :, None] & _ANGGOTA[:, None, :]
+    # Baris/kolom di luar subset diganti identitas dan ruas kanannya nol,
+    # sehingga koefisien aspek yang tidak ikut tepat nol
+    a = np.where(dalam, rxx + alfa * np.eye(_P), np.eye(_P))
+    r = np.where(_ANGGOTA, rxy, 0.0)
+    koef = np.linalg.solve(a, r[..., None])[..., 0]
+    return _r2_ridge(rxx, rxy, koef)
+
+
+def kepentingan_shapley(r2):
+    """Sumbangan rata-rata tiap aspek ke R² atas semua urutan masuk (LMG)."""
+    tanpa = ~_ANGGOTA
+    tambah = r2[_SUBSET[:, None] | _BIT] - r2[:, None]
+    ukuran = np.minimum(_ANGGOTA.sum(axis=1), _P - 1)
+    return (np.where(tanpa, _BOBOT_SHAPLEY[ukuran][:, None] * tambah, 0.0)).sum(axis=0)
+
+
+def analisis_penggerak(stat, alfa=None):
+    """Koefisien ridge, kepentingan relatif dan matriks kepentingan x kinerja.
+
+    Kembalikan dict berisi 'tabel' (per aspek), 'R²', 'alfa', 'n' serta batas
+    kuadran; None bila responden terlalu sedikit atau ada aspek tanpa variasi.
+    """
+    n = stat.n
+    if n < _P + 2:
+        return None
+    sd = np.sqrt(np.diag(stat.m2))
+    if not (sd > 0).all():
+        return None
+    korelasi = stat.m2 / np.outer(sd, sd)
+    rxx = korelasi[np.ix_(_IDX_X, _IDX_X)]
+    rxy = korelasi[_IDX_X, _IDX_Y]
+
+    if alfa is None:
+        alfa = pilih_alfa(rxx, rxy, n)
+    beta_baku = np.linalg.solve(rxx + alfa * np.eye(_P), rxy)
+    koefisien = beta_baku * sd[_IDX_Y] / sd[_IDX_X]
+    r2 = r2_subset(rxx, rxy, alfa)
+    kepentingan = kepentingan_shapley(r2)
+    r2_penuh = r2[-1]
+
+    kinerja = stat.mean[_IDX_X]
+    persen = kepentingan / r2_penuh * 100 if r2_penuh > 0 else np.full(_P, np.nan)
+    batas_kepentingan = 100 / _P
+    batas_kinerja = float(kinerja.mean())
+    kuadran = [
+        KUADRAN[(bool(k >= batas_kepentingan), bool(m >= batas_kinerja))]
+        for k, m in zip(persen, kinerja)
+    ]
+    tabel = pd.DataFrame({
+        'Koefisien Ridge': koefisien,
+        'Beta Baku': beta_baku,
+        'Kepentingan': kepentingan,
+        'Kepentingan %': persen,
+        'Kinerja': kinerja,
+        'Kuadran': kuadran,
+        # Perkiraan kenaikan R²-tertimbang bila aspek mencapai harapan
+        'Potensi': persen / 100 * (HARAPAN - kinerja),
+    }, index=pd.Index(ASPEK_ALL, name='Aspek'))
+    return {
+        'tabel': tabel,
+        'R²': float(r2_penuh),
+        'alfa': alfa,
+        'n': n,
+        'batas_kepentingan': batas_kepentingan,
+        'batas_kinerja': batas_kinerja,
+    }
@@ -0,0 +1,118 @@
+"""Ekspor data responden (CSV, Parquet, Excel) yang ditulis bertahap per chunk.
+
+File dibuat dari satu snapshot baca dan diberi nama menurut versi dataset,
+sehingga ekspor yang sama cukup dibuat sekali per versi.
+"""
+import glob
+import hashlib
+import os
+import re
+import tempfile
+
+import pandas as pd
+
+from imigrasi.analytics import hitung_laporan, lembar_excel
+from imigrasi.schema import KOLOM_PARTISI, KOLOM_RESPONDEN, KOLOM_SKOR
+
+UKURAN_CHUNK = 20_000
+# {format: (label, mime)}
+FORMAT_EKSPOR = {
+    'csv': ("CSV", 'text/csv'),
+    'parquet': ("Parquet", 'application/vnd.apache.parquet'),
+    'xlsx': ("Excel (data + laporan)",
+             'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+}
+FOLDER_EKSPOR = os.path.join(tempfile.gettempdir(), 'imigrasi-ekspor')
+# Batas baris satu sheet Excel (termasuk header)
+BATAS_BARIS_EXCEL = 1_048_575
+
+_KOLOM_EKSPOR = KOLOM_RESPONDEN + KOLOM_PARTISI
+_KOLOM_BULAT = ['Usia', *KOLOM_SKOR]
+
+
+def _rapikan(chunk):
+    # Kolom bulat bisa berisi NULL dari SQLite; Int64 menjaganya tetap bulat
+    return chunk.astype({k: 'Int64' for k in _KOLOM_BULAT})
+
+
+def ekspor_csv(snapshot, tujuan, ukuran_chunk=UKURAN_CHUNK):
+    with open(tujuan, 'w', encoding='utf-8', newline='') as f:
+        for i, chunk in enumerate(snapshot.bertahap(ukuran_chunk, _KOLOM_EKSPOR)):
+            _rapikan(chunk).to_csv(f, index=False, header=i == 0)
+
+
+def ekspor_parquet(snapshot, tujuan, ukuran_chunk=UKURAN_CHUNK):
+    # pyarrow dan openpyxl baru diimport saat ekspor benar-benar diminta
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    skema = pa.schema([(k, pa.int64() if k in _KOLOM_BULAT else pa.string()) for k in _KOLOM_EKSPOR])
+    # Satu row group per chunk; memori dibatasi satu chunk
+    with pq.ParquetWriter(tujuan, skema) as penulis:
+        for chunk in snapshot.bertahap(ukuran_chunk, _KOLOM_EKSPOR):
+            penulis.write_table(pa.Table.from_pandas(_rapikan(chunk), schema=skema, preserve_index=False))
+
+
+def _tulis_lembar(buku, nama, tabel):
+    lembar = buku.create_sheet(nama)
+    dengan_index = not isinstance(tabel.index, pd.RangeIndex)
+    if dengan_index:
+        tabel = tabel.reset_index()
+    lembar.append([str(k) for k in tabel.columns])
+    for baris in tabel.itertuples(index=False, name=None):
+        lembar.append([None if pd.isna(v) else v for v in baris])
+
+
+def ekspor_excel(snapshot, tujuan, ukuran_chunk=UKURAN_CHUNK):
+    """Sheet data mentah (dialirkan per baris, write-only) ditambah tabel laporan tab1-tab3."""
+    from openpyxl import Workbook
+
+    buku = Workbook(write_only=True)
+    lembar = buku.create_sheet('Data Responden')
+    lembar.append(_KOLOM_EKSPOR)
+    ditulis, nomor_lembar = 0, 1
+    for chunk in snapshot.bertahap(ukuran_chunk, _KOLOM_EKSPOR):
+        chunk = _rapikan(chunk).astype(object).where(chunk.notna(), None)
+        for baris in chunk.itertuples(index=False, name=None):
+            if ditulis == BATAS_BARIS_EXCEL:
+                # Sheet baru setelah batas baris Excel
+                nomor_lembar += 1
+                lembar = buku.create_sheet(f'Data Responden {nomor_lembar}')
+                lembar.append(_KOLOM_EKSPOR)
+                ditulis = 0
+            lembar.append(baris)
+            ditulis += 1
+    for nama, tabel in lembar_excel(hitung_laporan(statistik=snapshot.statistik())).items():
+        _tulis_lembar(buku, nama, tabel)
+    buku.save(tujuan)
+
+
+_PENULIS = {'csv': ekspor_csv, 'parquet': ekspor_parquet, 'xlsx': ekspor_excel}
+
+
+def buat_ekspor(repo, format_ekspor, folder=FOLDER_EKSPOR):
+    """Tulis ekspor dari snapshot terkini dan kembalikan path-nya.
+
+    Nama file memuat versi dataset; file versi yang lebih lama dengan format yang
+    sama dihapus. Versi yang lebih baru dibiarkan: job lama yang selesai
+    belakangan tidak boleh menghapus ekspor terkini.
+    """
+    os.makedirs(folder, exist_ok=True)
+    awalan = "responden-" + hashlib.md5(os.path.abspath(repo.path).encode()).hexdigest()[:12]
+    with repo.snapshot() as snapshot:
+        versi = snapshot.versi
+        tujuan = os.path.join(folder, f"{awalan}-v{versi}.{format_ekspor}")
+        if not os.path.exists(tujuan):
+            sementara = f"{tujuan}.{os.getpid()}.tmp"
+            _PENULIS[format_ekspor](snapshot, sementara)
+            os.replace(sementara, tujuan)
+    pola = re.compile(rf"{re.escape(awalan)}-v(\d+)\.{re.escape(format_ekspor)}")
+    for lama in glob.glob(os.path.join(folder, f"{awalan}-v*.{format_ekspor}")):
+        cocok = pola.fullmatch(os.path.basename(lama))
+        if cocok and int(cocok.group(1)) < versi:
+            try:
+                os.remove(lama)
+            except FileNotFoundError:
+                # Sudah dihapus job lain
+                pass
+    return tujuan
@@ -0,0 +1,171 @@
+"""Import CSV bertahap (per chunk) dengan validasi skema dan dtype ringkas."""
+from collections import Counter
+from contextlib import nullcontext
+
+import numpy as np
+import pandas as pd
+
+from imigrasi.kualitas import ALASAN_STRAIGHT_LINING, PEMISAH_ALASAN, straight_lining
+from imigrasi.schema import DTYPE_KANONIK, FORMAT_TANGGAL, JENIS_KELAMIN, JENIS_LAYANAN, KOLOM_RESPONDEN, KOLOM_SKOR
+
+UKURAN_CHUNK = 20_000
+
+MODE_TAMBAH = 'tambah'
+MODE_GABUNG = 'gabung'
+MODE_GANTI = 'ganti'
+
+# Dtype hasil seragamkan; skor float dulu agar sel kosong terdeteksi. CSV dibaca
+# sebagai teks lalu dikonversi per chunk, jadi sel rusak dikarantina per baris
+# alih-alih menggagalkan seluruh import.
+DTYPE_BACA = {
+    'Nama': 'string',
+    'Jenis Kelamin': pd.CategoricalDtype(JENIS_KELAMIN),
+    'Usia': 'float64',
+    'Jenis Layanan': pd.CategoricalDtype(JENIS_LAYANAN),
+    'Saran': 'string',
+    **{kolom: 'float64' for kolom in KOLOM_SKOR},
+}
+
+
+class SkemaTidakValid(ValueError):
+    pass
+
+
+def periksa_header(kolom):
+    """Tolak file lebih awal bila ada kolom form yang hilang."""
+    hilang = [k for k in KOLOM_RESPONDEN if k not in kolom]
+    if hilang:
+        raise SkemaTidakValid(f"Kolom tidak ditemukan: {', '.join(hilang)}")
+
+
+def baca_chunk(sumber, ukuran_chunk=UKURAN_CHUNK):
+    """Iterator chunk CSV dengan semua kolom sebagai teks (dikonversi di pisah_chunk)."""
+    return pd.read_csv(sumber, dtype=str, chunksize=ukuran_chunk)
+
+
+def pisah_chunk(chunk):
+    """Kembalikan (baris valid bertipe ringkas, baris ditolak + kolom 'Alasan', Counter alasan).
+
+    chunk boleh mentah (teks dari CSV, dict kiosk); nilainya diseragamkan dulu.
+    Baris ditolak tetap berisi nilai aslinya agar bisa dikarantina dan diperiksa.
+    """
+    asli, chunk = chunk, seragamkan(chunk)
+    tanggal = pd.to_datetime(chunk['Tanggal'], errors='coerce', format='mixed')
+    skor = chunk[KOLOM_SKOR]
+
+    cek = {
+        'Tanggal tidak valid': tanggal.isna(),
+        'Nama kosong': chunk['Nama'].fillna('').str.strip() == '',
+        'Jenis Kelamin tidak dikenal': chunk['Jenis Kelamin'].isna(),
+        'Jenis Layanan tidak dikenal': chunk['Jenis Layanan'].isna(),
+        'Usia tidak valid': ~chunk['Usia'].between(17, 100),
+        'Skor di luar 1-5': ~(skor.isin([1, 2, 3, 4, 5])).all(axis=1),
+        ALASAN_STRAIGHT_LINING: straight_lining(skor),
+    }
+    alasan = Counter()
+    tolak = np.zeros(len(chunk), dtype=bool)
+    teks_alasan = np.full(len(chunk), '', dtype=object)
+    for nama, mask in cek.items():
+        mask = np.asarray(mask, dtype=bool)
+        alasan[nama] = int(mask.sum())
+        teks_alasan[mask & tolak] += PEMISAH_ALASAN
+        teks_alasan[mask] += nama
+        tolak |= mask
+
+    valid = chunk.loc[~tolak, KOLOM_RESPONDEN].copy()
+    valid['Tanggal'] = tanggal[~tolak].dt.floor('min')
+    valid['Usia'] = valid['Usia'].astype('int8')
+    valid[KOLOM_SKOR] = valid[KOLOM_SKOR].astype('int8')
+    valid['Saran'] = valid['Saran'].fillna('')
+    ditolak = asli.loc[tolak].reindex(columns=KOLOM_RESPONDEN).assign(Alasan=teks_alasan[tolak])
+    return valid, ditolak, +alasan
+
+
+def validasi_chunk(chunk):
+    """Kembalikan (baris valid bertipe ringkas, Counter alasan penolakan)."""
+    valid, _, alasan = pisah_chunk(chunk)
+    return valid, alasan
+
+
+def seragamkan(df):
+    """Salinan df berkolom KOLOM_RESPONDEN dan berdtype DTYPE_BACA (index dipertahankan).
+
+    Nilai yang tidak bisa dikonversi menjadi kosong agar ditolak validasi_chunk.
+    """
+    df = df.reindex(columns=KOLOM_RESPONDEN)
+    for kolom, dtype in DTYPE_BACA.items():
+        if dtype == 'float64':
+            df[kolom] = pd.to_numeric(df[kolom], errors='coerce')
+        elif isinstance(dtype, pd.CategoricalDtype):
+            # Label di luar kategori dikosongkan dulu (pandas baru menolak cast langsung)
+            df[kolom] = df[kolom].where(df[kolom].isin(dtype.categories)).astype(dtype)
+        else:
+            df[kolom] = df[kolom].astype(dtype)
+    return df
+
+
+def rekaman_ke_frame(rekaman):
+    """Frame mentah berkolom KOLOM_RESPONDEN dari daftar dict (mis. kiriman kiosk)."""
+    return pd.DataFrame(list(rekaman)).reindex(columns=KOLOM_RESPONDEN)
+
+
+def untuk_disimpan(df):
+    # Repositori menyimpan Tanggal dalam format teks yang sama dengan form
+    df = df.copy()
+    df['Tanggal'] = df['Tanggal'].dt.strftime(FORMAT_TANGGAL)
+    return df.astype({k: 'int64' for k in ['Usia', *KOLOM_SKOR]})
+
+
+def baca_csv(sumber, ukuran_chunk=UKURAN_CHUNK):
+    """Muat seluruh CSV yang valid sebagai satu frame (tanpa menulis ke repositori).
+
+    Mengembalikan (frame valid bertipe ringkas, Counter alasan penolakan).
+    """
+    potongan, alasan = [], Counter()
+    for chunk in baca_chunk(sumber, ukuran_chunk):
+        periksa_header(chunk.columns)
+        valid, alasan_chunk = validasi_chunk(chunk)
+        potongan.append(valid)
+        alasan.update(alasan_chunk)
+    if not potongan:
+        kosong = pd.DataFrame(columns=KOLOM_RESPONDEN).astype(
+            {'Tanggal': 'datetime64[ns]', **{k: v for k, v in DTYPE_KANONIK.items() if k in KOLOM_RESPONDEN}}
+        )
+        return kosong, alasan
+    return pd.concat(potongan, ignore_index=True), alasan
+
+
+def import_csv(sumber, repo, mode=MODE_TAMBAH, ukuran_chunk=UKURAN_CHUNK, progres=None):
+    """Baca CSV per chunk, validasi, deduplikasi, lalu tulis ke repositori.
+
+    Baris tidak valid dikarantina. Duplikat Nama + Tanggal (di dalam file atau
+    terhadap data tersimpan) dikarantina pada mode tambah dan dilewati diam-diam
+    pada mode gabung. Mode ganti mengosongkan dan mengisi ulang dalam satu
+    transaksi, jadi file yang gagal dibaca di tengah tidak menghapus data lama.
+    progres(baris_dibaca) dipanggil setiap selesai satu chunk.
+    """
+    hasil = {'dibaca': 0, 'disimpan': 0, 'duplikat': 0, 'dikarantina': 0, 'tidak_valid': Counter()}
+
+    with repo.transaksi() if mode == MODE_GANTI else nullcontext():
+        header_diperiksa = False
+        for chunk in baca_chunk(sumber, ukuran_chunk):
+            if not header_diperiksa:
+                periksa_header(chunk.columns)
+                header_diperiksa = True
+                if mode == MODE_GANTI:
+                    repo.kosongkan()
+
+            hasil['dibaca'] += len(chunk)
+            valid, ditolak, alasan = pisah_chunk(chunk)
+            hasil['tidak_valid'].update(alasan)
+            hasil['dikarantina'] += repo.karantinakan(ditolak, 'csv')
+
+            # Kunci dicek terhadap indeks persisten di transaksi yang sama dengan penulisan
+            disimpan = repo.simpan(untuk_disimpan(valid), 'csv', lewati_duplikat=mode == MODE_GABUNG)
+            hasil['disimpan'] += int(disimpan.sum())
+            hasil['duplikat'] += int((~disimpan).sum())
+            if mode != MODE_GABUNG:
+                hasil['dikarantina'] += int((~disimpan).sum())
+            if progres is not None:
+                progres(hasil['dibaca'])
+    return hasil
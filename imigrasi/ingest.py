@@ -0,0 +1,156 @@
+"""Antrian kiriman responden bersama dengan penulisan per batch (group commit).
+
+Kiosk dan sesi dashboard memanggil AntrianIngest.kirim(); satu thread
+penulis mengumpulkan kiriman selama paling lama `jeda` detik lalu
+memvalidasi dan menyimpannya dalam satu transaksi.
+
+Kiosk yang tidak menjalankan Streamlit dapat mengirim lewat HTTP:
+    python -m imigrasi.ingest --port 8502
+    curl -X POST localhost:8502/responden -d '{"Nama": "...", ...}'
+"""
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from imigrasi.importer import FORMAT_TANGGAL, pisah_chunk, rekaman_ke_frame, untuk_disimpan
+from imigrasi.storage import DB_DEFAULT, RepositoriResponden
+
+UKURAN_BATCH = 500
+JEDA_BATCH = 0.5
+BATAS_TUNGGU = 10
+
+
+class AntrianIngest:
+    """Antrian thread-safe; kiriman dari banyak thread ditulis per batch."""
+
+    def __init__(self, repo, ukuran_batch=UKURAN_BATCH, jeda=JEDA_BATCH):
+        self.repo = repo
+        self.ukuran_batch = ukuran_batch
+        self.jeda = jeda
+        self._antrian = queue.Queue()
+        self._thread = threading.Thread(target=self._jalan, name='penulis-ingest', daemon=True)
+        self._thread.start()
+
+    def kirim(self, data, sumber='kiosk'):
+        """Masukkan satu responden; Future berisi True bila tersimpan, False bila dikarantina."""
+        data = dict(data)
+        if not data.get('Tanggal'):
+            data['Tanggal'] = datetime.now().strftime(FORMAT_TANGGAL)
+        hasil = Future()
+        self._antrian.put((data, sumber, hasil))
+        return hasil
+
+    def tutup(self):
+        """Tulis sisa antrian lalu hentikan thread penulis."""
+        self._antrian.put(None)
+        self._thread.join()
+
+    def _jalan(self):
+        berhenti = False
+        while not berhenti:
+            item = self._antrian.get()
+            if item is None:
+                break
+            batch = [item]
+            # Kumpulkan kiriman lain yang datang selama jeda, sampai ukuran batch
+            batas = time.monotonic() + self.jeda
+            while len(batch) < self.ukuran_batch:
+                sisa = batas - time.monotonic()
+                if sisa <= 0:
+                    break
+                try:
+                    item = self._antrian.get(timeout=sisa)
+                except queue.Empty:
+                    break
+                if item is None:
+                    berhenti = True
+                    break
+                batch.append(item)
+            self._tulis(batch)
+
+    def _tulis(self, batch):
+        try:
+            valid, ditolak, _ = pisah_chunk(rekaman_ke_frame(data for data, _, _ in batch))
+            sumber = np.array([sumber for _, sumber, _ in batch], dtype=object)
+            # pisah_chunk mempertahankan index, jadi label baris = posisi kiriman
+            self.repo.karantinakan(ditolak, sumber[ditolak.index])
+            tersimpan = self.repo.simpan(untuk_disimpan(valid), sumber[valid.index])
+        except Exception as e:
+            for _, _, hasil in batch:
+                hasil.set_exception(e)
+            return
+        diterima = set(valid.index[tersimpan])
+        for i, (_, _, hasil) in enumerate(batch):
+            hasil.set_result(i in diterima)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    antrian = None
+
+    def _balas(self, kode, isi):
+        badan = json.dumps(isi).encode('utf-8')
+        self.send_response(kode)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(badan)))
+        self.end_headers()
+        self.wfile.write(badan)
+
+    def do_POST(self):
+        if self.path.rstrip('/') != '/responden':
+            self._balas(404, {'error': 'tidak ditemukan'})
+            return
+        try:
+            isi = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        except ValueError:
+            self._balas(400, {'error': 'JSON tidak valid'})
+            return
+        rekaman = isi if isinstance(isi, list) else [isi]
+        if not all(isinstance(r, dict) for r in rekaman):
+            self._balas(400, {'error': 'harus objek atau daftar objek responden'})
+            return
+        hasil = [self.antrian.kirim(r) for r in rekaman]
+        try:
+            diterima = sum(h.result(timeout=BATAS_TUNGGU) for h in hasil)
+        except TimeoutError:
+            # Kiriman tetap di antrian; duplikat dari kirim ulang akan dikarantina
+            self._balas(503, {'error': 'penyimpanan sibuk, belum terkonfirmasi'})
+            return
+        except Exception as e:
+            self._balas(500, {'error': f'gagal menyimpan: {e}'})
+            return
+        self._balas(200, {'diterima': diterima, 'ditolak': len(hasil) - diterima})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m imigrasi.ingest',
+                                     description="Endpoint HTTP kiriman responden dari kiosk.")
+    parser.add_argument('--db', default=os.environ.get('IMIGRASI_DB', DB_DEFAULT))
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8502)
+    args = parser.parse_args(argv)
+
+    _Handler.antrian = AntrianIngest(RepositoriResponden(args.db))
+    server = ThreadingHTTPServer((args.host, args.port), _Handler)
+    print(f"Menerima POST /responden di {args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        _Handler.antrian.tutup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""Instrumentasi rerun dashboard: durasi, delta memori dan ukuran payload per bagian.
+
+Setiap rerun memakai satu PerekamRerun; hasilnya dikumpulkan RegistriMetrik
+yang dibagi antar sesi sehingga p50/p95 latensi bisa dibaca lintas sesi dan
+diekspor sebagai JSON atau teks Prometheus.
+
+Delta memori adalah selisih RSS proses; server melayani banyak sesi sekaligus,
+jadi angkanya perkiraan kasar, bukan alokasi milik satu bagian saja.
+"""
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+# Jumlah sampel terakhir per bagian yang dipakai menghitung persentil
+JENDELA = 1000
+AWALAN_PROMETHEUS = 'imigrasi'
+
+try:
+    _UKURAN_HALAMAN = os.sysconf('SC_PAGE_SIZE')
+except (AttributeError, ValueError, OSError):
+    _UKURAN_HALAMAN = 4096
+
+
+def rss():
+    """Resident set size proses dalam byte; None bila /proc tidak tersedia."""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _UKURAN_HALAMAN
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class RegistriMetrik:
+    """Kumpulan sampel per bagian dari semua sesi (thread-safe)."""
+
+    def __init__(self, jendela=JENDELA):
+        self._kunci = threading.Lock()
+        self._durasi = defaultdict(lambda: deque(maxlen=jendela))
+        self._memori = defaultdict(lambda: deque(maxlen=jendela))
+        self._jumlah = defaultdict(int)
+        self._total = defaultdict(float)
+        self._payload = {}
+
+    def catat(self, bagian, detik, memori=None, payload=None):
+        with self._kunci:
+            self._durasi[bagian].append(detik)
+            if memori is not None:
+                self._memori[bagian].append(memori)
+            if payload is not None:
+                self._payload[bagian] = payload
+            self._jumlah[bagian] += 1
+            self._total[bagian] += detik
+
+    def ringkasan(self):
+        """DataFrame per bagian: n, p50/p95/maks (ms), rata delta memori (MB), payload terakhir (KB)."""
+        with self._kunci:
+            sampel = {k: (np.array(v), np.array(self._memori[k])) for k, v in self._durasi.items()}
+            jumlah, payload = dict(self._jumlah), dict(self._payload)
+        baris = []
+        for bagian, (durasi, memori) in sorted(sampel.items()):
+            p50, p95 = np.percentile(durasi, [50, 95]) * 1000
+            baris.append({
+                'Bagian': bagian,
+                'n': jumlah[bagian],
+                'p50 (ms)': p50,
+                'p95 (ms)': p95,
+                'Maks (ms)': durasi.max() * 1000,
+                'Δ Memori (MB)': memori.mean() / 2 ** 20 if len(memori) else np.nan,
+                'Payload (KB)': payload[bagian] / 1024 if bagian in payload else np.nan,
+            })
+        return pd.DataFrame(baris, columns=['Bagian', 'n', 'p50 (ms)', 'p95 (ms)', 'Maks (ms)',
+                                            'Δ Memori (MB)', 'Payload (KB)']).set_index('Bagian')
+
+    def ke_json(self, **kwargs):
+        return json.dumps({
+            'waktu': time.time(),
+            'bagian': json.loads(self.ringkasan().to_json(orient='index', force_ascii=False)),
+        }, ensure_ascii=False, **kwargs)
+
+    def ke_prometheus(self):
+        """Format eksposisi teks Prometheus (summary durasi, gauge memori dan payload)."""
+        with self._kunci:
+            sampel = {k: np.array(v) for k, v in self._durasi.items()}
+            memori = {k: np.mean(v) for k, v in self._memori.items() if v}
+            jumlah, total = dict(self._jumlah), dict(self._total)
+            payload = dict(self._payload)
+        nama = f'{AWALAN_PROMETHEUS}_bagian_detik'
+        baris = [f'# HELP {nama} Durasi bagian rerun dashboard.', f'# TYPE {nama} summary']
+        for bagian, durasi in sorted(sampel.items()):
+            label = f'bagian="{_label(bagian)}"'
+            for q in (0.5, 0.95):
+                baris.append(f'{nama}{{{label},quantile="{q}"}} {np.quantile(durasi, q):.6f}')
+            baris.append(f'{nama}_sum{{{label}}} {total[bagian]:.6f}')
+            baris.append(f'{nama}_count{{{label}}} {jumlah[bagian]}')
+        nama = f'{AWALAN_PROMETHEUS}_bagian_memori_delta_byte'
+        baris += [f'# HELP {nama} Rata-rata delta RSS proses selama bagian.', f'# TYPE {nama} gauge']
+        baris += [f'{nama}{{bagian="{_label(k)}"}} {v:.0f}' for k, v in sorted(memori.items())]
+        nama = f'{AWALAN_PROMETHEUS}_bagian_payload_byte'
+        baris += [f'# HELP {nama} Ukuran JSON figure Plotly terakhir.', f'# TYPE {nama} gauge']
+        baris += [f'{nama}{{bagian="{_label(k)}"}} {v}' for k, v in sorted(payload.items())]
+        return '\n'.join(baris) + '\n'
+
+    def tulis_prometheus(self, tujuan):
+        """Tulis teks Prometheus secara atomik (untuk textfile collector node_exporter)."""
+        sementara = f"{tujuan}.{os.getpid()}.tmp"
+        with open(sementara, 'w', encoding='utf-8') as f:
+            f.write(self.ke_prometheus())
+        os.replace(sementara, tujuan)
+
+
+def _label(nilai):
+    return str(nilai).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class PerekamRerun:
+    """Pencatat bagian untuk satu rerun; setiap bagian langsung masuk registri."""
+
+    def __init__(self, registri, ukur_payload=False):
+        self.registri = registri
+        self.ukur_payload = ukur_payload
+        self.bagian_rerun = []
+        self._mulai = time.perf_counter()
+        self._rss_awal = rss()
+
+    @contextmanager
+    def bagian(self, nama, aktif=True, payload=None):
+        """Ukur blok `with`; aktif=False melewatkan pencatatan (mis. tab yang tertutup)."""
+        if not aktif:
+            yield
+            return
+        rss_awal = rss()
+        mulai = time.perf_counter()
+        try:
+            yield
+        finally:
+            detik = time.perf_counter() - mulai
+            rss_akhir = rss()
+            memori = None if rss_awal is None or rss_akhir is None else rss_akhir - rss_awal
+            self.bagian_rerun.append({
+                'Bagian': nama,
+                'ms': detik * 1000,
+                'Δ Memori (MB)': np.nan if memori is None else memori / 2 ** 20,
+                'Payload (KB)': np.nan if payload is None else payload / 1024,
+            })
+            self.registri.catat(nama, detik, memori, payload)
+
+    def payload(self, fig):
+        """Ukuran JSON figure Plotly dalam byte; serialisasi tambahan, jadi hanya bila ukur_payload."""
+        if not self.ukur_payload:
+            return None
+        return len(fig.to_json().encode('utf-8'))
+
+    def selesai(self):
+        """Catat total rerun; panggil di akhir skrip (atau sebelum st.stop)."""
+        detik = time.perf_counter() - self._mulai
+        rss_akhir = rss()
+        memori = None if self._rss_awal is None or rss_akhir is None else rss_akhir - self._rss_awal
+        self.registri.catat('rerun', detik, memori)
+        return detik
+
+    def tabel(self):
+        kolom = ['Bagian', 'ms', 'Δ Memori (MB)', 'Payload (KB)']
+        return pd.DataFrame(self.bagian_rerun, columns=kolom)
@@ -0,0 +1,57 @@
+"""Kategorisasi tingkat kepuasan berbasis ambang yang dapat dikonfigurasi."""
+import numpy as np
+import pandas as pd
+
+# Batas bawah tiap kategori di atas "Sangat Tidak Puas" (nilai >= ambang)
+AMBANG_KEPUASAN = (1.5, 2.5, 3.5, 4.5)
+LABEL_KEPUASAN = ("Sangat Tidak Puas", "Tidak Puas", "Cukup Puas", "Puas", "Sangat Puas")
+
+# Kelompok usia responden untuk pd.cut; batas kiri inklusif (usia 26 masuk "26-35")
+BATAS_USIA = (-np.inf, 26, 36, 46, 56, np.inf)
+LABEL_USIA = ("17-25", "26-35", "36-45", "46-55", "56+")
+# Batas dalam saja, untuk ekspresi SQL di penyimpanan
+AMBANG_USIA = BATAS_USIA[1:-1]
+
+
+def dtype_kategori(label=LABEL_KEPUASAN):
+    return pd.CategoricalDtype(list(label), ordered=True)
+
+
+def kategori_kepuasan(nilai, ambang=AMBANG_KEPUASAN, label=LABEL_KEPUASAN):
+    """Petakan skor ke label kategori dengan np.searchsorted.
+
+    Menerima satu nilai (mengembalikan str), Series (mengembalikan Series
+    kategorikal berurutan dengan index yang sama) atau array/list
+    (mengembalikan pd.Categorical). Nilai kosong menjadi NaN.
+    """
+    if len(label) != len(ambang) + 1:
+        raise ValueError("Jumlah label harus satu lebih banyak dari jumlah ambang")
+    if np.ndim(nilai) == 0:
+        if pd.isna(nilai):
+            return None
+        return label[int(np.searchsorted(ambang, nilai, side='right'))]
+
+    x = np.asarray(nilai, dtype='float64')
+    kode = np.searchsorted(ambang, x, side='right')
+    kode[np.isnan(x)] = -1
+    hasil = pd.Categorical.from_codes(kode, dtype=dtype_kategori(label))
+    if isinstance(nilai, pd.Series):
+        return pd.Series(hasil, index=nilai.index, name='Kategori')
+    return hasil
+
+
+def kelompok_usia(usia):
+    """Petakan usia ke LABEL_USIA dengan pd.cut pada BATAS_USIA.
+
+    Satu nilai mengembalikan str (None bila kosong), Series mengembalikan kolom
+    kategorikal 'Kelompok Usia' dengan index yang sama, array/list
+    mengembalikan pd.Categorical.
+    """
+    if np.ndim(usia) == 0:
+        if pd.isna(usia):
+            return None
+        return str(pd.cut([usia], BATAS_USIA, right=False, labels=LABEL_USIA)[0])
+    hasil = pd.cut(np.asarray(usia, dtype='float64'), BATAS_USIA, right=False, labels=LABEL_USIA)
+    if isinstance(usia, pd.Series):
+        return pd.Series(hasil, index=usia.index, name='Kelompok Usia')
+    return hasil
@@ -0,0 +1,67 @@
+"""Pemeriksaan kualitas data responden: kunci duplikat dan pola jawaban mencurigakan.
+
+Kunci responden adalah hash 64-bit dari Nama (spasi dan huruf besar
+dinormalkan) dan Tanggal per menit. Repositori menyimpannya di indeks
+persisten sehingga kiriman ganda dan CSV yang diimport ulang tertangkap
+tanpa membaca ulang data lama.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from imigrasi.schema import FORMAT_TANGGAL
+
+ALASAN_DUPLIKAT = "Duplikat (Nama + Tanggal)"
+ALASAN_STRAIGHT_LINING = "Straight-lining (semua skor sama)"
+# Beberapa alasan untuk satu baris digabung dengan pemisah ini
+PEMISAH_ALASAN = '; '
+
+_SPASI = re.compile(r'\s+')
+
+
+def _teks_tanggal(tanggal):
+    # Tanggal tersimpan sudah berformat FORMAT_TANGGAL; datetime diformat dulu
+    if pd.api.types.is_datetime64_any_dtype(tanggal):
+        return tanggal.dt.strftime(FORMAT_TANGGAL).fillna('')
+    return tanggal.astype('string').fillna('').str.slice(0, 16)
+
+
+def kunci_responden(df):
+    """Array int64 kunci Nama + Tanggal per baris (muat di kolom INTEGER SQLite)."""
+    nama = df['Nama'].astype('string').fillna('').str.replace(_SPASI, ' ', regex=True).str.strip().str.casefold()
+    teks = (nama + '\x1f' + _teks_tanggal(df['Tanggal'])).to_numpy(dtype=object)
+    return pd.util.hash_array(teks).view('int64')
+
+
+def kunci_satu(data):
+    """Kunci untuk satu dict responden; sama dengan kunci_responden untuk baris yang sama."""
+    nama = _SPASI.sub(' ', str(data.get('Nama') or '')).strip().casefold()
+    tanggal = data.get('Tanggal')
+    if isinstance(tanggal, pd.Timestamp):
+        tanggal = tanggal.strftime(FORMAT_TANGGAL)
+    teks = nama + '\x1f' + ('' if tanggal is None else str(tanggal)[:16])
+    # categorize=False: hasil sama, tanpa overhead factorize untuk satu nilai
+    return int(pd.util.hash_array(np.array([teks], dtype=object), categorize=False).view('int64')[0])
+
+
+def straight_lining(skor):
+    """Mask baris yang semua skornya sama (mis. semua slider dibiarkan di nilai awal)."""
+    skor = np.asarray(skor, dtype='float64')
+    return (skor == skor[:, :1]).all(axis=1)
+
+
+def laporan_kualitas(ringkas):
+    """Jumlah baris karantina per alasan dan sumber.
+
+    `ringkas` berisi Alasan, Sumber dan Jumlah per kombinasi alasan; satu baris
+    dengan beberapa alasan dihitung pada tiap alasannya.
+    """
+    kolom = ['Alasan', 'Sumber', 'Jumlah']
+    if ringkas.empty:
+        return pd.DataFrame(columns=kolom)
+    return (
+        ringkas.assign(Alasan=ringkas['Alasan'].str.split(PEMISAH_ALASAN)).explode('Alasan')
+        .groupby(['Alasan', 'Sumber'], as_index=False)['Jumlah'].sum()
+        .sort_values('Jumlah', ascending=False, ignore_index=True)[kolom]
+    )
@@ -0,0 +1,132 @@
+"""Kubus segmen: Bulan x Kelompok Usia x Jenis Kelamin x Jenis Layanan.
+
+Setiap sel menyimpan n, hitungan puas, jumlah dan jumlah kuadrat semua skor
+(kolom yang sama dengan rollup harian). RepositoriResponden memperbaruinya
+bertahap, sehingga rata-rata, simpangan baku dan persentase puas untuk irisan
+atau pivot apa pun dihitung dari beberapa ratus sel, bukan dari baris responden.
+"""
+import numpy as np
+import pandas as pd
+
+from imigrasi.kategori import LABEL_USIA, kelompok_usia
+from imigrasi.rollups import KOLOM_NILAI, nilai_batch, rata_std, rollup_baris
+from imigrasi.schema import JENIS_KELAMIN, JENIS_LAYANAN, KEPUASAN
+
+DIMENSI_KUBUS = ['Bulan', 'Kelompok Usia', 'Jenis Kelamin', 'Jenis Layanan']
+KOLOM_KUBUS = DIMENSI_KUBUS + KOLOM_NILAI
+UKURAN_KUBUS = ('Rata-rata', 'Simpangan Baku', '% Puas', 'Responden')
+# Label untuk nilai dimensi yang kosong (kunci sel tidak boleh NULL)
+TANPA_LABEL = '-'
+TOTAL = 'Total'
+
+_URUTAN = {
+    'Kelompok Usia': list(LABEL_USIA),
+    'Jenis Kelamin': JENIS_KELAMIN,
+    'Jenis Layanan': JENIS_LAYANAN,
+}
+
+
+def _label(seri):
+    return seri.astype(object).where(seri.notna(), TANPA_LABEL).astype(str)
+
+
+def kubus_batch(df):
+    """Ringkas satu batch responden menjadi sel kubus dengan satu groupby."""
+    data, lengkap = nilai_batch(df)
+    kunci = [
+        df.loc[lengkap, 'Tanggal'].astype(str).str[:7].rename('Bulan'),
+        _label(kelompok_usia(pd.to_numeric(df.loc[lengkap, 'Usia'], errors='coerce'))),
+        _label(df.loc[lengkap, 'Jenis Kelamin']).rename('Jenis Kelamin'),
+        _label(df.loc[lengkap, 'Jenis Layanan']).rename('Jenis Layanan'),
+    ]
+    return data.groupby(kunci).sum().reset_index()[KOLOM_KUBUS]
+
+
+def kubus_baris(data):
+    """Sel kubus untuk satu responden (dict); None bila ada skor kosong."""
+    baris = rollup_baris(data)
+    if baris is None:
+        return None
+    usia = data.get('Usia')
+    kelamin = data.get('Jenis Kelamin')
+    # baris rollup: (Hari, Jenis Layanan, nilai...)
+    return (
+        str(data['Tanggal'])[:7],
+        (kelompok_usia(usia) if usia is not None else None) or TANPA_LABEL,
+        TANPA_LABEL if kelamin is None else str(kelamin),
+        *baris[1:],
+    )
+
+
+def iris_kubus(kubus, mulai=None, sampai=None, layanan=(), kelamin=(), usia=()):
+    """Sel yang cocok dengan filter; urutan argumen sama dengan spesifikasi_filter.
+
+    mulai/sampai boleh berupa tanggal; kubus berbutir bulan, jadi rentang
+    dibulatkan ke bulan penuh.
+    """
+    mask = np.ones(len(kubus), dtype=bool)
+    if mulai is not None:
+        mask &= kubus['Bulan'] >= str(mulai)[:7]
+    if sampai is not None:
+        mask &= kubus['Bulan'] <= str(sampai)[:7]
+    for dimensi, dipilih in (('Jenis Layanan', layanan), ('Jenis Kelamin', kelamin), ('Kelompok Usia', usia)):
+        if dipilih:
+            mask &= kubus[dimensi].isin(dipilih)
+    return kubus[mask]
+
+
+def _ukuran(total, ukuran, skor):
+    if ukuran == 'Responden':
+        return total['n']
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if ukuran == '% Puas':
+            return total['puas'] / total['n'] * 100
+        rata, std = rata_std(total[f'jumlah {skor}'], total[f'kuadrat {skor}'], total['n'])
+    return rata if ukuran == 'Rata-rata' else std
+
+
+def _urutkan(nilai, dimensi):
+    urutan = _URUTAN.get(dimensi, [])
+    ada = set(nilai)
+    return [v for v in urutan if v in ada] + sorted(ada.difference(urutan))
+
+
+def _hitung(sel, dimensi, ukuran, skor):
+    if dimensi:
+        total = sel.groupby(dimensi)[KOLOM_NILAI].sum()
+    else:
+        total = sel[KOLOM_NILAI].sum().to_frame(TOTAL).T
+    return _ukuran(total, ukuran, skor)
+
+
+def pivot_kubus(sel, baris, kolom=None, ukuran='Rata-rata', skor=KEPUASAN, total=True):
+    """Tabel pivot satu ukuran; baris/kolom Total dihitung dari jumlah sel, bukan rata-rata sel."""
+    if sel.empty:
+        return pd.DataFrame(columns=[ukuran] if kolom is None else [])
+    label_baris = _urutkan(sel[baris].unique(), baris)
+    if kolom is None:
+        hasil = _hitung(sel, [baris], ukuran, skor).reindex(label_baris).to_frame(ukuran)
+        if total:
+            hasil.loc[TOTAL] = _hitung(sel, [], ukuran, skor).iloc[0]
+    else:
+        label_kolom = _urutkan(sel[kolom].unique(), kolom)
+        hasil = _hitung(sel, [baris, kolom], ukuran, skor).unstack(kolom).reindex(
+            index=label_baris, columns=label_kolom)
+        if total:
+            hasil[TOTAL] = _hitung(sel, [baris], ukuran, skor)
+            hasil.loc[TOTAL] = [*_hitung(sel, [kolom], ukuran, skor).reindex(label_kolom),
+                                _hitung(sel, [], ukuran, skor).iloc[0]]
+        hasil.columns = hasil.columns.astype(str)
+        hasil.columns.name = kolom
+    hasil.index.name = baris
+    if ukuran == 'Responden':
+        hasil = hasil.fillna(0).astype('int64')
+    return hasil
+
+
+def pilih_sel(sel, pilihan):
+    """Sel kubus di balik satu sel pivot; pilihan {dimensi: label}, label Total = semua nilai."""
+    for dimensi, label in pilihan.items():
+        if label != TOTAL:
+            sel = sel[sel[dimensi] == label]
+    return sel
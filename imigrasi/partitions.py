@@ -0,0 +1,165 @@
+"""Dataset multi-kantor berpartisi gaya Hive: <root>/kantor=<nama>/periode=<YYYY-MM>/*.parquet.
+
+Contoh:
+    python -m imigrasi.partitions data/partisi impor --kantor "Kanim Medan" medan.csv
+    python -m imigrasi.partitions data/partisi bandingkan --periode 2025-01 2025-02
+"""
+import argparse
+import os
+import shutil
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import quote, unquote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from imigrasi.importer import baca_csv
+from imigrasi.running_stats import StatistikBerjalan
+from imigrasi.schema import ASPEK_SERVQUAL, KEPUASAN, KOLOM_RESPONDEN, KOLOM_SKOR, normalisasi
+
+PARTISI_DEFAULT = os.path.join('data', 'partisi')
+
+
+def _folder(nama, nilai):
+    return f"{nama}={quote(str(nilai), safe='')}"
+
+
+def _nilai(folder):
+    return unquote(folder.split('=', 1)[1])
+
+
+@lru_cache(maxsize=4096)
+def _statistik_file(path, mtime_ns):
+    # File parquet tidak pernah diubah setelah ditulis, jadi (path, mtime) aman jadi kunci cache
+    return StatistikBerjalan.dari_df(pq.read_table(path, columns=['Jenis Layanan', 'Jenis Kelamin', *KOLOM_SKOR]).to_pandas())
+
+
+class DatasetPartisi:
+    """Kumpulan respons dari banyak kantor, dipartisi per kantor dan bulan."""
+
+    def __init__(self, root=PARTISI_DEFAULT):
+        self.root = root
+
+    def partisi(self, kantor=None, periode=None):
+        """Daftar (kantor, periode, folder) yang cocok; pemangkasan hanya dari nama folder."""
+        hasil = []
+        if not os.path.isdir(self.root):
+            return hasil
+        for folder_kantor in sorted(os.listdir(self.root)):
+            if not folder_kantor.startswith('kantor='):
+                continue
+            nama_kantor = _nilai(folder_kantor)
+            if kantor is not None and nama_kantor not in kantor:
+                continue
+            jalur_kantor = os.path.join(self.root, folder_kantor)
+            for folder_periode in sorted(os.listdir(jalur_kantor)):
+                if not folder_periode.startswith('periode='):
+                    continue
+                nama_periode = _nilai(folder_periode)
+                if periode is not None and nama_periode not in periode:
+                    continue
+                hasil.append((nama_kantor, nama_periode, os.path.join(jalur_kantor, folder_periode)))
+        return hasil
+
+    def daftar_kantor(self):
+        return sorted({k for k, _, _ in self.partisi()})
+
+    def daftar_periode(self):
+        return sorted({p for _, p, _ in self.partisi()})
+
+    def _file(self, kantor=None, periode=None):
+        return [
+            (k, p, os.path.join(folder, nama))
+            for k, p, folder in self.partisi(kantor, periode)
+            for nama in sorted(os.listdir(folder)) if nama.endswith('.parquet')
+        ]
+
+    def tulis(self, df, kantor):
+        """Tambahkan respons satu kantor; satu segmen parquet baru per periode."""
+        df = normalisasi(df[KOLOM_RESPONDEN])
+        periode = df['Tanggal'].dt.strftime('%Y-%m')
+        for nama_periode, bagian in df.groupby(periode, sort=False):
+            folder = os.path.join(self.root, _folder('kantor', kantor), _folder('periode', nama_periode))
+            os.makedirs(folder, exist_ok=True)
+            tabel = pa.Table.from_pandas(bagian.drop(columns='Kategori'), preserve_index=False)
+            pq.write_table(tabel, os.path.join(folder, f"part-{uuid.uuid4().hex}.parquet"))
+        return len(df)
+
+    def ganti_kantor(self, df, kantor):
+        """Tulis ulang seluruh partisi satu kantor (mis. sinkronisasi dari aplikasi)."""
+        jalur = os.path.join(self.root, _folder('kantor', kantor))
+        if os.path.isdir(jalur):
+            shutil.rmtree(jalur)
+        return self.tulis(df, kantor)
+
+    def muat(self, kantor=None, periode=None, kolom=None):
+        """Baca hanya file partisi yang terpilih, dengan kolom Kantor dan Periode."""
+        bagian = []
+        for k, p, path in self._file(kantor, periode):
+            df = pq.read_table(path, columns=kolom).to_pandas()
+            df['Kantor'] = k
+            df['Periode'] = p
+            bagian.append(df)
+        if not bagian:
+            return pd.DataFrame(columns=list(kolom or KOLOM_RESPONDEN) + ['Kantor', 'Periode'])
+        return pd.concat(bagian, ignore_index=True)
+
+    def statistik_per_kantor(self, kantor=None, periode=None, maks_pekerja=4):
+        """Hitung StatistikBerjalan tiap file secara paralel lalu gabung per kantor."""
+        file = self._file(kantor, periode)
+        with ThreadPoolExecutor(max_workers=maks_pekerja) as pool:
+            semua = list(pool.map(
+                lambda item: _statistik_file(item[2], os.stat(item[2]).st_mtime_ns), file
+            ))
+        hasil = {}
+        for (k, _, _), stat in zip(file, semua):
+            hasil.setdefault(k, StatistikBerjalan()).gabung(stat)
+        return hasil
+
+
+def peringkat_kantor(statistik_per_kantor, dimensi=ASPEK_SERVQUAL):
+    """Rata-rata tiap dimensi ServQual per kantor beserta peringkatnya (1 = terbaik)."""
+    kolom = list(dimensi) + [KEPUASAN]
+    idx = [KOLOM_SKOR.index(k) for k in kolom]
+    rata = pd.DataFrame(
+        {kantor: stat.mean[idx] for kantor, stat in statistik_per_kantor.items() if stat.n},
+        index=kolom,
+    ).T
+    rata.index.name = 'Kantor'
+    peringkat = rata.rank(ascending=False, method='min').astype('Int64').add_prefix('Peringkat ')
+    n = pd.Series({k: s.n for k, s in statistik_per_kantor.items() if s.n}, name='Responden')
+    return pd.concat([n, rata, peringkat], axis=1).sort_values(f'Peringkat {KEPUASAN}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m imigrasi.partitions',
+                                     description="Kelola dataset multi-kantor berpartisi.")
+    parser.add_argument('root', help="Folder root dataset berpartisi")
+    sub = parser.add_subparsers(dest='perintah', required=True)
+
+    impor = sub.add_parser('impor', help="Tambahkan CSV satu kantor")
+    impor.add_argument('--kantor', required=True)
+    impor.add_argument('csv', nargs='+')
+
+    banding = sub.add_parser('bandingkan', help="Peringkat kantor per dimensi ServQual")
+    banding.add_argument('--kantor', nargs='*')
+    banding.add_argument('--periode', nargs='*')
+    args = parser.parse_args(argv)
+
+    dataset = DatasetPartisi(args.root)
+    if args.perintah == 'impor':
+        for path in args.csv:
+            df, alasan = baca_csv(path)
+            print(f"{path}: {dataset.tulis(df, args.kantor)} baris, ditolak {sum(alasan.values())}")
+    else:
+        tabel = peringkat_kantor(dataset.statistik_per_kantor(args.kantor or None, args.periode or None))
+        print(tabel.to_string())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""Filter, pencarian, pengurutan dan paginasi data mentah di sisi server."""
+import numpy as np
+
+from imigrasi.kategori import kelompok_usia
+
+KOLOM_KATEGORI = ('Jenis Layanan', 'Jenis Kelamin')
+KOLOM_CARI = ('Nama', 'Saran')
+
+
+def spesifikasi_filter(mulai=None, sampai=None, layanan=(), kelamin=(), usia=()):
+    """Kunci filter global yang hashable (dipakai sebagai kunci cache).
+
+    Pilihan kosong berarti semua nilai; None bila tidak ada filter sama sekali.
+    """
+    spek = (
+        str(mulai)[:10] if mulai is not None else None,
+        str(sampai)[:10] if sampai is not None else None,
+        tuple(sorted(layanan)),
+        tuple(sorted(kelamin)),
+        tuple(sorted(usia)),
+    )
+    return spek if any(spek) else None
+
+
+class IndeksFilter:
+    """Indeks boolean yang dibangun sekali per versi dataset.
+
+    Setiap nilai kategori dan setiap ambang Kepuasan Keseluruhan (1-5)
+    punya mask sendiri, sehingga filter cukup menggabungkan mask dengan
+    operasi OR/AND tanpa membandingkan ulang kolom setiap rerun.
+    """
+
+    def __init__(self, df, kolom_skor='Kepuasan Keseluruhan'):
+        self.df = df
+        self.n = len(df)
+        self._mask_kategori = {}
+        for kolom in KOLOM_KATEGORI:
+            nilai = df[kolom].astype('category')
+            self._mask_kategori[kolom] = self._mask_per_nilai(nilai)
+        self._mask_kategori['Kelompok Usia'] = self._mask_per_nilai(kelompok_usia(df['Usia']))
+        skor = df[kolom_skor].to_numpy()
+        self._mask_skor = {k: skor >= k for k in range(1, 6)}
+        # Posisi baris diurutkan per hari, rentang tanggal cukup dua searchsorted
+        hari = df['Tanggal'].to_numpy(dtype='datetime64[D]')
+        self._urut_hari = np.argsort(hari, kind='stable')
+        self._hari_urut = hari[self._urut_hari]
+
+    @staticmethod
+    def _mask_per_nilai(nilai):
+        kode = nilai.cat.codes.to_numpy()
+        return {
+            kat: kode == i for i, kat in enumerate(nilai.cat.categories)
+            if (kode == i).any()
+        }
+
+    def nilai(self, kolom):
+        """Nilai kategori yang benar-benar muncul di data."""
+        return list(self._mask_kategori[kolom])
+
+    def _gabung(self, kolom, dipilih):
+        mask = np.zeros(self.n, dtype=bool)
+        for nilai in dipilih:
+            if nilai in self._mask_kategori[kolom]:
+                mask |= self._mask_kategori[kolom][nilai]
+        return mask
+
+    def mask_rentang(self, mulai=None, sampai=None):
+        """Mask baris dengan tanggal di antara mulai dan sampai (inklusif, per hari)."""
+        kiri = 0 if mulai is None else np.searchsorted(self._hari_urut, np.datetime64(mulai, 'D'), 'left')
+        kanan = (np.searchsorted(self._hari_urut, np.datetime64(sampai, 'D'), 'right')
+                 if sampai is not None else self.n)
+        mask = np.zeros(self.n, dtype=bool)
+        mask[self._urut_hari[kiri:kanan]] = True
+        return mask
+
+    def pilih(self, spek):
+        """Kompilasi spesifikasi_filter menjadi mask baris (semua True bila spek None)."""
+        if spek is None:
+            return np.ones(self.n, dtype=bool)
+        mulai, sampai, layanan, kelamin, usia = spek
+        mask = self.mask_rentang(mulai, sampai)
+        for kolom, dipilih in (('Jenis Layanan', layanan), ('Jenis Kelamin', kelamin),
+                               ('Kelompok Usia', usia)):
+            if dipilih:
+                mask &= self._gabung(kolom, dipilih)
+        return mask
+
+    def mask(self, layanan, kelamin, min_kepuasan=1, cari='', dasar=None):
+        """Mask filter tab data mentah, dipersempit dari mask dasar bila ada."""
+        mask = self._gabung('Jenis Layanan', layanan)
+        if dasar is not None:
+            mask &= dasar
+        mask &= self._gabung('Jenis Kelamin', kelamin)
+        mask &= self._mask_skor[int(min_kepuasan)]
+        cari = cari.strip()
+        if cari:
+            # Pencarian teks hanya dijalankan pada baris yang lolos filter
+            posisi = np.flatnonzero(mask)
+            sub = self.df.iloc[posisi]
+            cocok = np.zeros(len(posisi), dtype=bool)
+            for kolom in KOLOM_CARI:
+                cocok |= sub[kolom].str.contains(cari, case=False, regex=False).fillna(False).to_numpy(dtype=bool)
+            mask[:] = False
+            mask[posisi[cocok]] = True
+        return mask
+
+    def halaman(self, mask, urut=None, naik=True, nomor=1, ukuran=50):
+        """Kembalikan (frame satu halaman, jumlah halaman) dari baris terpilih."""
+        posisi = np.flatnonzero(mask)
+        if urut:
+            kunci = self.df[urut].iloc[posisi].reset_index(drop=True)
+            posisi = posisi[kunci.sort_values(ascending=naik, kind='stable').index.to_numpy()]
+        jumlah_halaman = max(1, -(-len(posisi) // ukuran))
+        nomor = min(max(1, nomor), jumlah_halaman)
+        awal = (nomor - 1) * ukuran
+        return self.df.iloc[posisi[awal:awal + ukuran]], jumlah_halaman
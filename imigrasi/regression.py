@@ -0,0 +1,133 @@
+"""Regresi OLS bentuk tertutup dari co-moment StatistikBerjalan (tanpa statsmodels)."""
+from math import lgamma
+
+import numpy as np
+import pandas as pd
+
+from imigrasi.schema import ASPEK_ALL, KEPUASAN, KOLOM_SKOR
+
+_IDX_X = [KOLOM_SKOR.index(k) for k in ASPEK_ALL]
+_IDX_Y = KOLOM_SKOR.index(KEPUASAN)
+
+
+def _betainc(a, b, x, iterasi=200):
+    """Fungsi beta tak lengkap teregularisasi I_x(a, b), vektor terhadap x."""
+    x = np.asarray(x, dtype='float64')
+    # NaN (mis. aspek tanpa variasi) tetap NaN, bukan p-value 0
+    hasil = np.full(x.shape, np.nan)
+    hasil[x <= 0] = 0.0
+    hasil[x >= 1] = 1.0
+    dalam = (x > 0) & (x < 1)
+    if not dalam.any():
+        return hasil
+    # Pakai simetri I_x(a,b) = 1 - I_{1-x}(b,a) agar pecahan berlanjut cepat konvergen
+    balik = x > (a + 1) / (a + b + 2)
+    xv = np.where(balik, 1 - x, x)[dalam]
+    av = np.where(balik[dalam], b, a)
+    bv = np.where(balik[dalam], a, b)
+
+    kecil = 1e-300
+    c = np.ones_like(xv)
+    d = 1 - (av + bv) * xv / (av + 1)
+    d = 1 / np.where(np.abs(d) < kecil, kecil, d)
+    h = d.copy()
+    for m in range(1, iterasi + 1):
+        for koef in (
+            m * (bv - m) * xv / ((av + 2 * m - 1) * (av + 2 * m)),
+            -(av + m) * (av + bv + m) * xv / ((av + 2 * m) * (av + 2 * m + 1)),
+        ):
+            d = 1 + koef * d
+            d = 1 / np.where(np.abs(d) < kecil, kecil, d)
+            c = 1 + koef / c
+            c = np.where(np.abs(c) < kecil, kecil, c)
+            h *= d * c
+
+    lbeta = np.vectorize(lambda p, q: lgamma(p) + lgamma(q) - lgamma(p + q))(av, bv)
+    depan = np.exp(av * np.log(xv) + bv * np.log1p(-xv) - lbeta) / av
+    nilai = depan * h
+    hasil[dalam] = np.where(balik[dalam], 1 - nilai, nilai)
+    return hasil
+
+
+def p_value_t(t, df):
+    """p-value dua sisi untuk statistik t dengan derajat bebas df."""
+    t = np.asarray(t, dtype='float64')
+    if df <= 0:
+        return np.full(t.shape, np.nan)
+    with np.errstate(invalid='ignore'):
+        return _betainc(df / 2, 0.5, df / (df + t ** 2))
+
+
+def regresi_sederhana(stat):
+    """Delapan regresi Kepuasan ~ aspek sekaligus, dari matriks co-moment.
+
+    Kurang dari 3 responden: semua nilai NaN.
+    """
+    n = stat.n
+    if n < 3:
+        kosong = np.full(len(_IDX_X), np.nan)
+        return pd.DataFrame({
+            'Kemiringan': kosong, 'Intersep': kosong, 'R²': kosong, 'p-value': kosong, 'n': n,
+        }, index=pd.Index(ASPEK_ALL, name='Aspek'))
+    s = stat.m2
+    sxx = np.diag(s)[_IDX_X]
+    sxy = s[_IDX_X, _IDX_Y]
+    syy = s[_IDX_Y, _IDX_Y]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        kemiringan = sxy / sxx
+        intersep = stat.mean[_IDX_Y] - kemiringan * stat.mean[_IDX_X]
+        r2 = sxy ** 2 / (sxx * syy)
+        galat = np.sqrt((syy - kemiringan * sxy) / (n - 2) / sxx)
+        t = kemiringan / galat
+    return pd.DataFrame({
+        'Kemiringan': kemiringan,
+        'Intersep': intersep,
+        'R²': r2,
+        'p-value': p_value_t(t, n - 2),
+        'n': n,
+    }, index=pd.Index(ASPEK_ALL, name='Aspek'))
+
+
+def regresi_berganda(stat):
+    """Regresi Kepuasan pada seluruh aspek (persamaan normal via np.linalg.lstsq).
+
+    Bila responden tidak lebih banyak dari jumlah koefisien, tabel berisi NaN.
+    """
+    n, p = stat.n, len(_IDX_X)
+    if n < p + 2:
+        kosong = np.full(p + 1, np.nan)
+        tabel = pd.DataFrame(
+            {'Koefisien': kosong, 'Std. Error': kosong, 't': kosong, 'p-value': kosong},
+            index=pd.Index(['Intersep'] + ASPEK_ALL, name='Variabel'),
+        )
+        return {'koefisien': tabel, 'R²': np.nan, 'R² adj': np.nan, 'n': n}
+    s = stat.m2
+    sxx = s[np.ix_(_IDX_X, _IDX_X)]
+    sxy = s[_IDX_X, _IDX_Y]
+    syy = s[_IDX_Y, _IDX_Y]
+
+    beta = np.linalg.lstsq(sxx, sxy, rcond=None)[0]
+    rss = max(syy - beta @ sxy, 0.0)
+    derajat = n - p - 1
+    xbar = stat.mean[_IDX_X]
+    intersep = stat.mean[_IDX_Y] - beta @ xbar
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sigma2 = rss / derajat
+        invers = np.linalg.pinv(sxx)
+        galat = np.sqrt(sigma2 * np.diag(invers))
+        galat_intersep = np.sqrt(sigma2 * (1 / n + xbar @ invers @ xbar))
+        r2 = 1 - rss / syy
+        r2_adj = 1 - (1 - r2) * (n - 1) / derajat
+
+    koef = np.concatenate([[intersep], beta])
+    se = np.concatenate([[galat_intersep], galat])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = koef / se
+    tabel = pd.DataFrame({
+        'Koefisien': koef,
+        'Std. Error': se,
+        't': t,
+        'p-value': p_value_t(t, derajat),
+    }, index=pd.Index(['Intersep'] + ASPEK_ALL, name='Variabel'))
+    return {'koefisien': tabel, 'R²': r2, 'R² adj': r2_adj, 'n': n}
@@ -0,0 +1,97 @@
+"""Rollup harian per Jenis Layanan: jumlah, jumlah kuadrat dan hitungan puas.
+
+Tabel ini diperbarui bertahap oleh RepositoriResponden setiap kali data
+disimpan, sehingga tren dan ringkasan untuk rentang tanggal apa pun cukup
+dibaca dari beberapa ratus baris rollup, bukan seluruh data responden.
+"""
+import numpy as np
+import pandas as pd
+
+from imigrasi.chart_data import pilih_frekuensi, susun_tren
+from imigrasi.schema import KEPUASAN, KOLOM_SKOR
+
+KOLOM_JUMLAH = [f'jumlah {k}' for k in KOLOM_SKOR]
+KOLOM_KUADRAT = [f'kuadrat {k}' for k in KOLOM_SKOR]
+# Nilai yang bisa dijumlahkan per sel (juga dipakai kubus segmen)
+KOLOM_NILAI = ['n', 'puas'] + KOLOM_JUMLAH + KOLOM_KUADRAT
+KUNCI_ROLLUP = ['Hari', 'Jenis Layanan']
+KOLOM_ROLLUP = KUNCI_ROLLUP + KOLOM_NILAI
+
+
+def nilai_batch(df):
+    """(nilai per baris berkolom KOLOM_NILAI, mask baris dengan skor lengkap)."""
+    skor = df[KOLOM_SKOR].astype('float64')
+    lengkap = skor.notna().all(axis=1)
+    skor = skor[lengkap]
+    data = pd.concat([skor.add_prefix('jumlah '), (skor ** 2).add_prefix('kuadrat ')], axis=1)
+    data['n'] = 1
+    data['puas'] = (skor[KEPUASAN] >= 4).astype('int64')
+    return data[KOLOM_NILAI], lengkap
+
+
+def rollup_batch(df):
+    """Ringkas satu batch responden menjadi baris rollup (Hari x Jenis Layanan)."""
+    data, lengkap = nilai_batch(df)
+    kunci = [
+        df.loc[lengkap, 'Tanggal'].astype(str).str[:10].rename('Hari'),
+        df.loc[lengkap, 'Jenis Layanan'].astype(str).rename('Jenis Layanan'),
+    ]
+    return data.groupby(kunci).sum().reset_index()[KOLOM_ROLLUP]
+
+
+def rollup_baris(data):
+    """Baris rollup untuk satu responden (dict); None bila ada skor kosong."""
+    skor = [float(data[k]) for k in KOLOM_SKOR]
+    if any(np.isnan(skor)):
+        return None
+    return (str(data['Tanggal'])[:10], str(data['Jenis Layanan']), 1, int(skor[-1] >= 4),
+            *skor, *(x * x for x in skor))
+
+
+def rata_std(jumlah, kuadrat, n):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rata = jumlah / n
+        varians = (kuadrat - jumlah ** 2 / n) / (n - 1)
+    return rata, np.sqrt(np.maximum(varians, 0))
+
+
+def tren_dari_rollup(rollup, kolom, frek=None, z=1.96):
+    """Tren per periode dalam format yang sama dengan chart_data.tren_per_bucket.
+
+    Rollup berbutir harian, jadi bucket terhalus adalah 'D'.
+    """
+    tanggal = pd.to_datetime(rollup['Hari'])
+    if frek is None:
+        frek = pilih_frekuensi(tanggal)
+    if frek == 'h':
+        frek = 'D'
+    bucket = tanggal.dt.to_period(frek).dt.start_time
+    total = rollup[KOLOM_NILAI].groupby(bucket).sum()
+    bagian = {}
+    for k in kolom:
+        rata, std = rata_std(total[f'jumlah {k}'], total[f'kuadrat {k}'], total['n'])
+        bagian[(k, 'mean')] = rata
+        bagian[(k, 'count')] = total['n']
+        bagian[(k, 'std')] = std
+    return susun_tren(pd.DataFrame(bagian), kolom, z), frek
+
+
+def ringkasan_rollup(rollup):
+    """Ringkasan untuk rentang rollup: headline, statistik per aspek, dan per layanan."""
+    total = rollup[KOLOM_NILAI].sum()
+    n = total['n']
+    rata, std = rata_std(
+        total[KOLOM_JUMLAH].to_numpy(dtype='float64'),
+        total[KOLOM_KUADRAT].to_numpy(dtype='float64'),
+        n,
+    )
+    per_layanan = rollup.groupby('Jenis Layanan')[['n', *KOLOM_JUMLAH]].sum()
+    rata_layanan = per_layanan[KOLOM_JUMLAH].div(per_layanan['n'], axis=0)
+    rata_layanan.columns = KOLOM_SKOR
+    return {
+        'total_responden': int(n),
+        'rata_rata_kepuasan': rata[-1] if n else np.nan,
+        'persentase_puas': total['puas'] / n * 100 if n else 0.0,
+        'deskriptif': pd.DataFrame({'mean': rata, 'std': std}, index=KOLOM_SKOR),
+        'per_layanan': rata_layanan,
+    }
@@ -0,0 +1,144 @@
+"""Statistik berjalan (Welford) yang diperbarui O(1) per responden baru."""
+import json
+
+import numpy as np
+
+from imigrasi.schema import KOLOM_SKOR
+
+_N_SKOR = len(KOLOM_SKOR)
+
+
+class StatistikBerjalan:
+    """Mean, co-moment, min/max dan penghitung per kategori tanpa menyimpan baris.
+
+    Co-moment disimpan sebagai matriks penuh antar kolom skor sehingga
+    varians (diagonal) dan korelasi Pearson antar aspek bisa dibaca langsung.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean = np.zeros(_N_SKOR)
+        self.m2 = np.zeros((_N_SKOR, _N_SKOR))
+        self.min = np.full(_N_SKOR, np.inf)
+        self.max = np.full(_N_SKOR, -np.inf)
+        self.puas = 0
+        # {jenis layanan: [jumlah responden, jumlah skor per kolom...]}
+        self.per_layanan = {}
+        self.per_kelamin = {}
+
+    def tambah(self, data):
+        """Masukkan satu responden (dict dengan kolom skor)."""
+        x = np.array([float(data[k]) for k in KOLOM_SKOR])
+        if np.isnan(x).any():
+            return
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += np.outer(delta, x - self.mean)
+        np.minimum(self.min, x, out=self.min)
+        np.maximum(self.max, x, out=self.max)
+        self.puas += int(x[-1] >= 4)
+        self._hitung_kategori(data.get('Jenis Layanan'), data.get('Jenis Kelamin'), 1, x)
+
+    def tambah_df(self, df):
+        """Gabungkan satu batch DataFrame (rumus gabungan Chan et al.)."""
+        skor = df[KOLOM_SKOR].to_numpy(dtype='float64')
+        lengkap = ~np.isnan(skor).any(axis=1)
+        skor = skor[lengkap]
+        nb = len(skor)
+        if nb == 0:
+            return
+        mean_b = skor.mean(axis=0)
+        pusat = skor - mean_b
+        self._gabung_momen(nb, mean_b, pusat.T @ pusat)
+        np.minimum(self.min, skor.min(axis=0), out=self.min)
+        np.maximum(self.max, skor.max(axis=0), out=self.max)
+        self.puas += int((skor[:, -1] >= 4).sum())
+
+        sub = df.loc[lengkap]
+        if 'Jenis Layanan' in sub:
+            grup = sub.groupby('Jenis Layanan', observed=True)[KOLOM_SKOR]
+            ukuran = grup.size()
+            for layanan, total_skor in grup.sum().iterrows():
+                self._hitung_kategori(
+                    layanan, None, int(ukuran[layanan]),
+                    total_skor.to_numpy(dtype='float64')
+                )
+        if 'Jenis Kelamin' in sub:
+            for kelamin, jml in sub['Jenis Kelamin'].value_counts().items():
+                if jml:
+                    self._hitung_kategori(None, kelamin, int(jml), None)
+
+    def _gabung_momen(self, nb, mean_b, m2_b):
+        na = self.n
+        n = na + nb
+        delta = mean_b - self.mean
+        self.m2 += m2_b + np.outer(delta, delta) * na * nb / n
+        self.mean += delta * nb / n
+        self.n = n
+
+    def gabung(self, lain):
+        """Gabungkan StatistikBerjalan lain (mis. dari partisi berbeda) ke objek ini."""
+        if lain.n == 0:
+            return self
+        self._gabung_momen(lain.n, lain.mean, lain.m2)
+        np.minimum(self.min, lain.min, out=self.min)
+        np.maximum(self.max, lain.max, out=self.max)
+        self.puas += lain.puas
+        for layanan, entri in lain.per_layanan.items():
+            self._hitung_kategori(layanan, None, entri[0], entri[1:])
+        for kelamin, jml in lain.per_kelamin.items():
+            self._hitung_kategori(None, kelamin, jml, None)
+        return self
+
+    def _hitung_kategori(self, layanan, kelamin, jumlah, total_skor):
+        if layanan is not None and total_skor is not None:
+            entri = self.per_layanan.setdefault(str(layanan), [0] + [0.0] * _N_SKOR)
+            entri[0] += jumlah
+            for i, nilai in enumerate(total_skor, 1):
+                entri[i] += float(nilai)
+        if kelamin is not None:
+            self.per_kelamin[str(kelamin)] = self.per_kelamin.get(str(kelamin), 0) + jumlah
+
+    @classmethod
+    def dari_df(cls, df):
+        stat = cls()
+        stat.tambah_df(df)
+        return stat
+
+    def varians(self):
+        if self.n < 2:
+            return np.full(_N_SKOR, np.nan)
+        return np.diag(self.m2) / (self.n - 1)
+
+    def korelasi(self):
+        """Matriks korelasi Pearson antar semua kolom skor."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sd = np.sqrt(np.diag(self.m2))
+            return self.m2 / np.outer(sd, sd)
+
+    def to_json(self):
+        return json.dumps({
+            'n': self.n,
+            'mean': self.mean.tolist(),
+            'm2': self.m2.tolist(),
+            'min': [None if np.isinf(v) else v for v in self.min],
+            'max': [None if np.isinf(v) else v for v in self.max],
+            'puas': self.puas,
+            'per_layanan': self.per_layanan,
+            'per_kelamin': self.per_kelamin,
+        })
+
+    @classmethod
+    def from_json(cls, teks):
+        isi = json.loads(teks)
+        stat = cls()
+        stat.n = isi['n']
+        stat.mean = np.array(isi['mean'])
+        stat.m2 = np.array(isi['m2'])
+        stat.min = np.array([np.inf if v is None else v for v in isi['min']])
+        stat.max = np.array([-np.inf if v is None else v for v in isi['max']])
+        stat.puas = isi['puas']
+        stat.per_layanan = isi['per_layanan']
+        stat.per_kelamin = isi['per_kelamin']
+        return stat
@@ -0,0 +1,72 @@
+"""Skema data responden yang dipakai form, penyimpanan, dan dashboard."""
+import pandas as pd
+
+from imigrasi.kategori import kategori_kepuasan
+
+# Urutan kolom sama persis dengan data yang dibentuk oleh form_responden
+KOLOM_RESPONDEN = [
+    'Tanggal', 'Nama', 'Jenis Kelamin', 'Usia', 'Jenis Layanan',
+    'Fasilitas Fisik', 'Keandalan', 'Responsivitas', 'Jaminan', 'Empati',
+    'Waktu Tunggu', 'Kemudahan Prosedur', 'Kejelasan Informasi',
+    'Kepuasan Keseluruhan', 'Saran'
+]
+
+ASPEK_ALL = ['Fasilitas Fisik', 'Keandalan', 'Responsivitas',
+             'Jaminan', 'Empati', 'Waktu Tunggu',
+             'Kemudahan Prosedur', 'Kejelasan Informasi']
+ASPEK_SERVQUAL = ['Fasilitas Fisik', 'Keandalan', 'Responsivitas', 'Jaminan', 'Empati']
+ASPEK_ADMIN = ['Waktu Tunggu', 'Kemudahan Prosedur', 'Kejelasan Informasi', 'Keandalan']
+
+KEPUASAN = 'Kepuasan Keseluruhan'
+KOLOM_SKOR = ASPEK_ALL + [KEPUASAN]
+
+# Format teks Tanggal yang disimpan (resolusi menit, sama dengan form)
+FORMAT_TANGGAL = "%Y-%m-%d %H:%M"
+
+# Kunci partisi: asal kantor dan periode (bulan) setiap respons
+KANTOR_DEFAULT = "Kantor Imigrasi Kelas II TPI Langsa"
+KOLOM_PARTISI = ['Kantor', 'Periode']
+
+JENIS_KELAMIN = ["Laki-laki", "Perempuan"]
+JENIS_LAYANAN = ["Paspor Baru", "Perpanjangan Paspor", "Visa", "Izin Tinggal", "Lainnya"]
+
+# Tata letak kanonik di memori: skor int8, enum kategorikal, waktu datetime64,
+# teks bebas disimpan sebagai string berbasis Arrow
+DTYPE_KANONIK = {
+    'Nama': 'string[pyarrow]',
+    'Jenis Kelamin': pd.CategoricalDtype(JENIS_KELAMIN),
+    'Usia': 'int8',
+    'Jenis Layanan': pd.CategoricalDtype(JENIS_LAYANAN),
+    'Saran': 'string[pyarrow]',
+    **{kolom: 'int8' for kolom in KOLOM_SKOR},
+}
+
+
+def normalisasi(df):
+    """Ubah frame responden ke tata letak kanonik dan tambahkan kolom turunan."""
+    df = df.astype({k: v for k, v in DTYPE_KANONIK.items() if k in df.columns})
+    if 'Tanggal' in df.columns:
+        df['Tanggal'] = pd.to_datetime(df['Tanggal'], format='mixed')
+    if KEPUASAN in df.columns:
+        df['Kategori'] = kategori_kepuasan(df[KEPUASAN])
+    return df
+
+
+def laporan_memori(df_asli, df_ringkas):
+    """Bandingkan pemakaian memori (deep) per kolom sebelum dan sesudah normalisasi.
+
+    Kolom turunan yang hanya ada di df_ringkas (mis. Kategori) tampil sebagai
+    baris sendiri tanpa nilai Sebelum dan ikut dihitung di total Sesudah.
+    """
+    kolom = list(df_asli.columns) + [k for k in df_ringkas.columns if k not in df_asli.columns]
+    sebelum = df_asli.memory_usage(deep=True, index=False).reindex(kolom)
+    sesudah = df_ringkas.memory_usage(deep=True, index=False).reindex(kolom)
+    laporan = pd.DataFrame({
+        'Tipe Asli': [str(df_asli[k].dtype) if k in df_asli.columns else '' for k in kolom],
+        'Tipe Ringkas': [str(df_ringkas[k].dtype) if k in df_ringkas.columns else '' for k in kolom],
+        'Sebelum (KB)': sebelum / 1024,
+        'Sesudah (KB)': sesudah / 1024,
+    }, index=kolom)
+    laporan.loc['Total'] = ['', '', sebelum.sum() / 1024, sesudah.sum() / 1024]
+    laporan['Hemat %'] = (1 - laporan['Sesudah (KB)'] / laporan['Sebelum (KB)']) * 100
+    return laporan
@@ -0,0 +1,590 @@
+"""Penyimpanan responden berbasis SQLite (append-only, dipakai bersama antar sesi)."""
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from imigrasi.importer import pisah_chunk, untuk_disimpan
+from imigrasi.kategori import AMBANG_USIA, LABEL_USIA
+from imigrasi.kualitas import ALASAN_DUPLIKAT, kunci_responden, kunci_satu
+from imigrasi.kubus import DIMENSI_KUBUS, KOLOM_KUBUS, kubus_baris, kubus_batch
+from imigrasi.rollups import KOLOM_NILAI, KOLOM_ROLLUP, KUNCI_ROLLUP, rollup_baris, rollup_batch
+from imigrasi.running_stats import StatistikBerjalan
+from imigrasi.schema import KANTOR_DEFAULT, KOLOM_PARTISI, KOLOM_RESPONDEN, KOLOM_SKOR
+from imigrasi.teks import ekspresi_cari, frekuensi_istilah, token
+
+DB_DEFAULT = os.path.join('data', 'responden.db')
+
+_TIPE_SQL = {'Usia': 'INTEGER', **{kolom: 'INTEGER' for kolom in KOLOM_SKOR}}
+_KOLOM_TABEL = KOLOM_RESPONDEN + KOLOM_PARTISI
+_KOLOM_KARANTINA = ['Waktu', 'Sumber', 'Alasan'] + KOLOM_RESPONDEN
+# Batas parameter per pernyataan pada SQLite versi lama
+_BATAS_PARAMETER = 900
+
+
+def _q(nama):
+    # Nama kolom mengandung spasi, jadi selalu di-quote
+    return '"' + nama.replace('"', '""') + '"'
+
+
+def _syarat_filter(spek):
+    """Klausa WHERE (daftar, parameter) untuk spesifikasi_filter dari imigrasi.query."""
+    syarat, parameter = [], []
+    if spek is None:
+        return syarat, parameter
+    mulai, sampai, layanan, kelamin, usia = spek
+    if mulai is not None:
+        syarat.append('substr("Tanggal", 1, 10) >= ?')
+        parameter.append(mulai)
+    if sampai is not None:
+        syarat.append('substr("Tanggal", 1, 10) <= ?')
+        parameter.append(sampai)
+    for kolom, dipilih in (('Jenis Layanan', layanan), ('Jenis Kelamin', kelamin)):
+        if dipilih:
+            syarat.append(f"{_q(kolom)} IN ({', '.join('?' for _ in dipilih)})")
+            parameter.extend(dipilih)
+    if usia:
+        batas = (None, *AMBANG_USIA, None)
+        rentang = []
+        for label in usia:
+            i = LABEL_USIA.index(label)
+            bawah, atas = batas[i], batas[i + 1]
+            bagian = ([f'"Usia" >= {bawah}'] if bawah is not None else []) + \
+                     ([f'"Usia" < {atas}'] if atas is not None else [])
+            rentang.append('(' + ' AND '.join(bagian) + ')')
+        syarat.append('(' + ' OR '.join(rentang) + ')')
+    return syarat, parameter
+
+
+class SnapshotBaca:
+    """Koneksi baca terpisah dalam satu transaksi (WAL).
+
+    Semua pembacaan melihat versi data yang sama, sementara penulisan dari
+    sesi lain tetap berjalan tanpa menunggu.
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.versi = conn.execute("SELECT nilai FROM meta WHERE kunci = 'versi'").fetchone()[0]
+
+    def statistik(self):
+        baris = self._conn.execute("SELECT isi FROM statistik WHERE kunci = 'semua'").fetchone()
+        return StatistikBerjalan.from_json(baris[0]) if baris else StatistikBerjalan()
+
+    def jumlah(self):
+        return self._conn.execute("SELECT COUNT(*) FROM responden").fetchone()[0]
+
+    def bertahap(self, ukuran=20_000, kolom=None):
+        """Baca responden per chunk berurutan id."""
+        daftar = ', '.join(_q(k) for k in (kolom or _KOLOM_TABEL))
+        return pd.read_sql_query(
+            f"SELECT {daftar} FROM responden ORDER BY id", self._conn, chunksize=ukuran
+        )
+
+
+class RepositoriResponden:
+    """Repositori responden: insert O(1) per baris, baca per kolom.
+
+    Setiap baris diberi kunci partisi Kantor dan Periode (YYYY-MM); baris
+    tanpa Kantor dianggap milik kantor repositori ini.
+    """
+
+    def __init__(self, path=DB_DEFAULT, kantor=KANTOR_DEFAULT):
+        self.path = path
+        self.kantor = kantor
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        # Satu koneksi dibagi antar thread Streamlit, penulisan dijaga lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        # journal_mode tidak bisa diubah di dalam transaksi
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._transaksi():
+            kolom_sql = ', '.join(
+                f"{_q(k)} {_TIPE_SQL.get(k, 'TEXT')}" for k in KOLOM_RESPONDEN
+            )
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS responden "
+                f"(id INTEGER PRIMARY KEY AUTOINCREMENT, {kolom_sql})"
+            )
+            # Database lama dibuat sebelum ada kolom partisi
+            ada = {baris[1] for baris in self._conn.execute("PRAGMA table_info(responden)")}
+            for kolom in KOLOM_PARTISI:
+                if kolom not in ada:
+                    self._conn.execute(f"ALTER TABLE responden ADD COLUMN {_q(kolom)} TEXT")
+            self._conn.execute(
+                'UPDATE responden SET "Kantor" = ? WHERE "Kantor" IS NULL', (kantor,)
+            )
+            self._conn.execute(
+                'UPDATE responden SET "Periode" = substr("Tanggal", 1, 7) WHERE "Periode" IS NULL'
+            )
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_partisi ON responden ("Kantor", "Periode")'
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (kunci TEXT PRIMARY KEY, nilai INTEGER)"
+            )
+            self._conn.execute("INSERT OR IGNORE INTO meta VALUES ('versi', 0)")
+            # Statistik berjalan disimpan di file yang sama dengan datanya
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS statistik (kunci TEXT PRIMARY KEY, isi TEXT)"
+            )
+            ada_indeks_saran = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'saran_fts'"
+            ).fetchone() is not None
+            # Indeks teks saran: rowid = responden.id, isi = token tanpa stopword
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS saran_fts USING fts5(teks, content='')"
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS saran_istilah ("Jenis Layanan" TEXT, "Istilah" TEXT, '
+                '"N" INTEGER, "Frekuensi" INTEGER NOT NULL, PRIMARY KEY ("Jenis Layanan", "Istilah"))'
+            )
+            if not ada_indeks_saran:
+                # Database lama: indeks seluruh saran yang sudah ada sekali saja
+                self._indeks_saran(0)
+            nilai_sql = ', '.join(
+                f"{_q(k)} {'INTEGER' if k in ('n', 'puas') else 'REAL'} NOT NULL"
+                for k in KOLOM_NILAI
+            )
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS rollup_harian (\"Hari\" TEXT, \"Jenis Layanan\" TEXT, "
+                f"{nilai_sql}, PRIMARY KEY (\"Hari\", \"Jenis Layanan\"))"
+            )
+            # Kubus segmen (Bulan x Kelompok Usia x Jenis Kelamin x Jenis Layanan)
+            dimensi_sql = ', '.join(f"{_q(k)} TEXT" for k in DIMENSI_KUBUS)
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS kubus ({dimensi_sql}, {nilai_sql}, "
+                f"PRIMARY KEY ({', '.join(_q(k) for k in DIMENSI_KUBUS)}))"
+            )
+            ada_indeks_kunci = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'kunci_responden'"
+            ).fetchone() is not None
+            # Indeks kunci Nama + Tanggal (hash 64-bit) untuk deteksi duplikat
+            self._conn.execute("CREATE TABLE IF NOT EXISTS kunci_responden (kunci INTEGER PRIMARY KEY)")
+            if not ada_indeks_kunci:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO kunci_responden VALUES (?)",
+                    ((k,) for k in kunci_responden(self.muat(['Nama', 'Tanggal'])).tolist())
+                )
+            # Baris yang ditolak validasi atau deduplikasi, disimpan apa adanya
+            kolom_karantina = ', '.join(f"{_q(k)} TEXT" for k in _KOLOM_KARANTINA)
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS karantina (id INTEGER PRIMARY KEY AUTOINCREMENT, {kolom_karantina})"
+            )
+        self._statistik = None
+        self._versi_statistik = None
+        self.statistik()
+        self._bangun_rollup_bila_kosong()
+
+    @contextmanager
+    def _transaksi(self):
+        """Transaksi tulis yang mengambil kunci tulis SQLite sejak awal (BEGIN IMMEDIATE).
+
+        Pembacaan di dalamnya (id terakhir, kunci duplikat, statistik) tidak bisa
+        diselingi commit dari proses lain, misalnya server ingest dan dashboard
+        yang menulis ke file yang sama. Di dalam transaksi yang sudah berjalan,
+        blok ini menumpang transaksi itu.
+        """
+        with self._lock:
+            if self._conn.in_transaction:
+                yield
+                return
+            try:
+                with self._conn:
+                    self._conn.execute("BEGIN IMMEDIATE")
+                    yield
+            except BaseException:
+                # Statistik di memori mungkin sudah memuat perubahan yang di-rollback
+                self._statistik = None
+                raise
+
+    def transaksi(self):
+        """Satu transaksi untuk beberapa penulisan (mis. kosongkan + import per chunk).
+
+        Bila ada yang gagal di dalamnya, tidak ada yang berubah.
+        """
+        return self._transaksi()
+
+    def _naikkan_versi(self):
+        self._conn.execute("UPDATE meta SET nilai = nilai + 1 WHERE kunci = 'versi'")
+
+    def _simpan_statistik(self, stat):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO statistik VALUES ('semua', ?)", (stat.to_json(),)
+        )
+
+    def _perbarui_statistik(self, ubah):
+        # Dipanggil di dalam transaksi tulis; ubah(stat) memasukkan data baru
+        stat = self.statistik()
+        try:
+            ubah(stat)
+            self._simpan_statistik(stat)
+            self._naikkan_versi()
+        except Exception:
+            self._statistik = None
+            raise
+        self._versi_statistik = self._conn.execute(
+            "SELECT nilai FROM meta WHERE kunci = 'versi'"
+        ).fetchone()[0]
+
+    def _upsert_jumlah(self, tabel, kunci, baris):
+        # Upsert penjumlahan: baris rollup/sel kubus yang sudah ada cukup ditambah
+        kolom_semua = kunci + KOLOM_NILAI
+        kolom = ', '.join(_q(k) for k in kolom_semua)
+        tanda = ', '.join('?' for _ in kolom_semua)
+        tambah = ', '.join(f"{_q(k)} = {_q(k)} + excluded.{_q(k)}" for k in KOLOM_NILAI)
+        self._conn.executemany(
+            f"INSERT INTO {tabel} ({kolom}) VALUES ({tanda}) "
+            f"ON CONFLICT ({', '.join(_q(k) for k in kunci)}) DO UPDATE SET {tambah}",
+            baris,
+        )
+
+    def _upsert_rollup(self, baris):
+        self._upsert_jumlah('rollup_harian', KUNCI_ROLLUP, baris)
+
+    def _upsert_kubus(self, baris):
+        self._upsert_jumlah('kubus', DIMENSI_KUBUS, baris)
+
+    def _perbarui_rollup(self, df):
+        rollup = rollup_batch(df)
+        if not rollup.empty:
+            self._upsert_rollup(rollup.astype(object).itertuples(index=False, name=None))
+
+    def _perbarui_kubus(self, df):
+        kubus = kubus_batch(df)
+        if not kubus.empty:
+            self._upsert_kubus(kubus.astype(object).itertuples(index=False, name=None))
+
+    def _id_terakhir(self):
+        return self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM responden").fetchone()[0]
+
+    def _indeks_saran(self, id_awal):
+        # Saran pada baris baru (id > id_awal) diindeks di transaksi yang sama
+        baru = self._conn.execute(
+            'SELECT id, "Jenis Layanan", "Saran" FROM responden '
+            'WHERE id > ? AND "Saran" IS NOT NULL AND "Saran" != \'\'', (id_awal,)
+        ).fetchall()
+        if not baru:
+            return
+        self._conn.executemany(
+            "INSERT INTO saran_fts (rowid, teks) VALUES (?, ?)",
+            ((i, ' '.join(token(saran))) for i, _, saran in baru)
+        )
+        istilah = frekuensi_istilah((layanan, saran) for _, layanan, saran in baru)
+        self._conn.executemany(
+            'INSERT INTO saran_istilah VALUES (?, ?, ?, ?) '
+            'ON CONFLICT ("Jenis Layanan", "Istilah") DO UPDATE SET "Frekuensi" = "Frekuensi" + excluded."Frekuensi"',
+            ((*kunci, jumlah) for kunci, jumlah in istilah.items())
+        )
+
+    def _bangun_rollup_bila_kosong(self):
+        # Database lama tanpa rollup/kubus: bangun sekali dari seluruh baris
+        with self._transaksi():
+            kosong = {
+                tabel: perbarui for tabel, perbarui in
+                (('rollup_harian', self._perbarui_rollup), ('kubus', self._perbarui_kubus))
+                if self._conn.execute(f"SELECT 1 FROM {tabel} LIMIT 1").fetchone() is None
+            }
+            if not kosong or self.jumlah() == 0:
+                return
+            df = self.muat(['Tanggal', 'Jenis Kelamin', 'Usia', 'Jenis Layanan', *KOLOM_SKOR])
+            for perbarui in kosong.values():
+                perbarui(df)
+
+    def _partisi(self, data):
+        kantor = data.get('Kantor') or self.kantor
+        tanggal = data.get('Tanggal')
+        return kantor, str(tanggal)[:7] if tanggal is not None else None
+
+    def _insert(self, baris):
+        kolom = ', '.join(_q(k) for k in _KOLOM_TABEL)
+        tanda = ', '.join('?' for _ in _KOLOM_TABEL)
+        self._conn.executemany(
+            f"INSERT INTO responden ({kolom}) VALUES ({tanda})", baris
+        )
+
+    def _kunci_ada(self, kunci):
+        # Setiap kunci dicari lewat PRIMARY KEY, tanpa memindai data lama
+        ada = set()
+        daftar = kunci.tolist()
+        for i in range(0, len(daftar), _BATAS_PARAMETER):
+            bagian = daftar[i:i + _BATAS_PARAMETER]
+            ada.update(k for (k,) in self._conn.execute(
+                f"SELECT kunci FROM kunci_responden WHERE kunci IN ({', '.join('?' for _ in bagian)})", bagian
+            ))
+        return ada
+
+    def _karantina(self, df, sumber):
+        nilai = df.reindex(columns=KOLOM_RESPONDEN).astype('string').astype(object)
+        nilai = nilai.where(df.reindex(columns=KOLOM_RESPONDEN).notna(), None)
+        nilai.insert(0, 'Alasan', df['Alasan'].to_numpy())
+        nilai.insert(0, 'Sumber', sumber)
+        nilai.insert(0, 'Waktu', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        self._conn.executemany(
+            f"INSERT INTO karantina ({', '.join(_q(k) for k in _KOLOM_KARANTINA)}) "
+            f"VALUES ({', '.join('?' for _ in _KOLOM_KARANTINA)})",
+            nilai.itertuples(index=False, name=None)
+        )
+        return len(nilai)
+
+    def karantinakan(self, df, sumber):
+        """Simpan baris yang ditolak (df berkolom 'Alasan'); sumber teks atau per baris."""
+        if df.empty:
+            return 0
+        with self._transaksi():
+            return self._karantina(df, sumber)
+
+    def _saring(self, df, sumber):
+        # Validasi yang sama dengan import CSV dan kiosk; baris ditolak dikarantina
+        df = df.reset_index(drop=True)
+        valid, ditolak, _ = pisah_chunk(df)
+        if not ditolak.empty:
+            self._karantina(ditolak, sumber)
+        valid = untuk_disimpan(valid)
+        if 'Kantor' in df.columns:
+            valid['Kantor'] = df.loc[valid.index, 'Kantor']
+        return valid
+
+    def tambah(self, data, sumber='form'):
+        """Validasi lalu simpan satu responden (dict dengan kunci KOLOM_RESPONDEN).
+
+        Kembalikan False (dan karantina barisnya) bila baris tidak valid atau
+        Nama + Tanggal sudah ada.
+        """
+        with self._transaksi():
+            valid = self._saring(pd.DataFrame([data]), sumber)
+            if valid.empty:
+                return False
+            data = valid.to_dict('records')[0]
+            kunci = kunci_satu(data)
+            if self._conn.execute("SELECT 1 FROM kunci_responden WHERE kunci = ?", (kunci,)).fetchone():
+                self._karantina(pd.DataFrame([{**data, 'Alasan': ALASAN_DUPLIKAT}]), sumber)
+                return False
+            id_awal = self._id_terakhir()
+            self._insert([tuple(data.get(k) for k in KOLOM_RESPONDEN) + self._partisi(data)])
+            self._conn.execute("INSERT INTO kunci_responden VALUES (?)", (kunci,))
+            self._indeks_saran(id_awal)
+            baris = rollup_baris(data)
+            if baris is not None:
+                self._upsert_rollup([baris])
+                self._upsert_kubus([kubus_baris(data)])
+            self._perbarui_statistik(lambda stat: stat.tambah(data))
+        return True
+
+    def simpan(self, df, sumber='batch', lewati_duplikat=False):
+        """Simpan baris yang Nama + Tanggal-nya belum ada; kembalikan mask baris yang tersimpan.
+
+        df harus sudah lolos pisah_chunk dan untuk_disimpan (seperti import_csv
+        dan server ingest); masukan mentah lewat tambah/tambah_banyak.
+        Duplikat terhadap data tersimpan atau di dalam df sendiri dikarantina,
+        kecuali lewati_duplikat. Pemeriksaan dan penulisan satu transaksi.
+        """
+        if df.empty:
+            return np.zeros(0, dtype=bool)
+        kunci = kunci_responden(df)
+        with self._transaksi():
+            ada = self._kunci_ada(kunci)
+            baru = ~pd.Series(kunci).duplicated().to_numpy()
+            if ada:
+                baru &= np.fromiter((k not in ada for k in kunci.tolist()), dtype=bool, count=len(kunci))
+            if not lewati_duplikat and not baru.all():
+                sumber_duplikat = sumber if np.isscalar(sumber) else np.asarray(sumber)[~baru]
+                self._karantina(df.loc[~baru].assign(Alasan=ALASAN_DUPLIKAT), sumber_duplikat)
+            if baru.any():
+                self._tulis(df.loc[baru], kunci[baru])
+        return baru
+
+    def _tulis(self, df, kunci):
+        kantor = df['Kantor'].fillna(self.kantor) if 'Kantor' in df.columns else self.kantor
+        df = df.reindex(columns=KOLOM_RESPONDEN)
+        nilai = df.astype(object).where(df.notna(), None)
+        nilai['Kantor'] = kantor
+        nilai['Periode'] = df['Tanggal'].astype(str).str[:7]
+        id_awal = self._id_terakhir()
+        self._insert(nilai.itertuples(index=False, name=None))
+        self._conn.executemany("INSERT INTO kunci_responden VALUES (?)", ((k,) for k in kunci.tolist()))
+        self._indeks_saran(id_awal)
+        self._perbarui_rollup(df)
+        self._perbarui_kubus(df)
+        self._perbarui_statistik(lambda stat: stat.tambah_df(df))
+
+    def tambah_banyak(self, df, sumber='batch'):
+        """Validasi lalu simpan banyak responden dalam satu transaksi.
+
+        Baris tidak valid dan duplikat dikarantina; kembalikan jumlah yang tersimpan.
+        """
+        with self._transaksi():
+            return int(self.simpan(self._saring(df, sumber), sumber).sum())
+
+    def ganti(self, df):
+        """Ganti seluruh isi penyimpanan dengan baris df yang valid (satu transaksi)."""
+        with self._transaksi():
+            self.kosongkan()
+            return self.tambah_banyak(df)
+
+    def kosongkan(self):
+        with self._transaksi():
+            self._conn.execute("DELETE FROM responden")
+            self._conn.execute("DELETE FROM rollup_harian")
+            self._conn.execute("DELETE FROM kubus")
+            self._conn.execute("INSERT INTO saran_fts (saran_fts) VALUES ('delete-all')")
+            self._conn.execute("DELETE FROM saran_istilah")
+            self._conn.execute("DELETE FROM kunci_responden")
+            self._conn.execute("DELETE FROM karantina")
+            self._statistik = StatistikBerjalan()
+            self._versi_statistik = self.versi()
+            self._perbarui_statistik(lambda stat: None)
+
+    def statistik(self):
+        """StatistikBerjalan terkini; dibaca ulang dari disk hanya bila versi berubah."""
+        with self._lock:
+            versi = self.versi()
+            if self._statistik is None or versi != self._versi_statistik:
+                baris = self._conn.execute(
+                    "SELECT isi FROM statistik WHERE kunci = 'semua'"
+                ).fetchone()
+                if baris is not None:
+                    self._statistik = StatistikBerjalan.from_json(baris[0])
+                else:
+                    # Database lama tanpa statistik: bangun sekali dari seluruh baris
+                    with self._transaksi():
+                        self._statistik = StatistikBerjalan.dari_df(self.muat())
+                        self._simpan_statistik(self._statistik)
+                self._versi_statistik = versi
+            return self._statistik
+
+    @contextmanager
+    def snapshot(self):
+        """SnapshotBaca untuk pembacaan panjang (mis. ekspor) tanpa memegang lock."""
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        try:
+            conn.execute("BEGIN")
+            yield SnapshotBaca(conn)
+        finally:
+            conn.close()
+
+    def versi(self):
+        """Nomor versi dataset, naik setiap kali data berubah."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT nilai FROM meta WHERE kunci = 'versi'"
+            ).fetchone()[0]
+
+    def jumlah(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responden").fetchone()[0]
+
+    def muat(self, kolom=None, kantor=None, periode=None):
+        """Baca responden; hanya kolom yang diminta yang diambil dari disk.
+
+        kantor/periode (list) membatasi baca ke partisi tertentu lewat indeks.
+        """
+        kolom = list(kolom or KOLOM_RESPONDEN)
+        daftar = ', '.join(_q(k) for k in kolom)
+        syarat, parameter = [], []
+        for nama, nilai in (('Kantor', kantor), ('Periode', periode)):
+            if nilai is not None:
+                syarat.append(f"{_q(nama)} IN ({', '.join('?' for _ in nilai)})")
+                parameter.extend(nilai)
+        where = f" WHERE {' AND '.join(syarat)}" if syarat else ''
+        with self._lock:
+            return pd.read_sql_query(
+                f"SELECT {daftar} FROM responden{where} ORDER BY id", self._conn, params=parameter
+            )
+
+    def daftar_partisi(self):
+        """Jumlah responden per (Kantor, Periode)."""
+        with self._lock:
+            return pd.read_sql_query(
+                'SELECT "Kantor", "Periode", COUNT(*) AS n FROM responden '
+                'GROUP BY "Kantor", "Periode" ORDER BY "Kantor", "Periode"', self._conn
+            )
+
+    def muat_rollup(self, mulai=None, sampai=None):
+        """Baris rollup harian dalam rentang tanggal (YYYY-MM-DD, inklusif)."""
+        syarat, parameter = [], []
+        if mulai is not None:
+            syarat.append('"Hari" >= ?')
+            parameter.append(str(mulai)[:10])
+        if sampai is not None:
+            syarat.append('"Hari" <= ?')
+            parameter.append(str(sampai)[:10])
+        where = f" WHERE {' AND '.join(syarat)}" if syarat else ''
+        with self._lock:
+            return pd.read_sql_query(
+                f"SELECT {', '.join(_q(k) for k in KOLOM_ROLLUP)} FROM rollup_harian{where} "
+                'ORDER BY "Hari"', self._conn, params=parameter
+            )
+
+    def muat_kubus(self):
+        """Seluruh sel kubus segmen (beberapa ratus baris per tahun)."""
+        with self._lock:
+            return pd.read_sql_query(
+                f"SELECT {', '.join(_q(k) for k in KOLOM_KUBUS)} FROM kubus "
+                f"ORDER BY {', '.join(_q(k) for k in DIMENSI_KUBUS)}", self._conn
+            )
+
+    def cari_saran(self, kata='', spek=None, nomor=1, ukuran=20):
+        """Satu halaman saran terbaru yang cocok dengan kata kunci dan filter global.
+
+        Kembalikan (DataFrame Tanggal/Jenis Layanan/Saran, jumlah saran yang cocok).
+        """
+        syarat, parameter = _syarat_filter(spek)
+        syarat.append('r."Saran" IS NOT NULL AND r."Saran" != \'\'')
+        dari = "responden r"
+        ekspresi = ekspresi_cari(kata)
+        if ekspresi is not None:
+            dari += " JOIN saran_fts ON saran_fts.rowid = r.id"
+            syarat.append("saran_fts MATCH ?")
+            parameter.append(ekspresi)
+        elif kata.strip():
+            # Hanya stopword: tidak ada yang bisa dicari
+            return pd.DataFrame(columns=['Tanggal', 'Jenis Layanan', 'Saran']), 0
+        where = ' AND '.join(syarat)
+        with self._lock:
+            jumlah = self._conn.execute(
+                f"SELECT COUNT(*) FROM {dari} WHERE {where}", parameter
+            ).fetchone()[0]
+            halaman = pd.read_sql_query(
+                f'SELECT r."Tanggal", r."Jenis Layanan", r."Saran" FROM {dari} WHERE {where} '
+                "ORDER BY r.id DESC LIMIT ? OFFSET ?",
+                self._conn, params=[*parameter, ukuran, (max(1, nomor) - 1) * ukuran]
+            )
+        return halaman, jumlah
+
+    def muat_karantina(self, batas=None, kolom=None):
+        """Baris karantina terbaru lebih dulu; `batas` membatasi jumlah baris."""
+        daftar = ', '.join(_q(k) for k in (kolom or _KOLOM_KARANTINA))
+        with self._lock:
+            return pd.read_sql_query(
+                f"SELECT {daftar} FROM karantina ORDER BY id DESC LIMIT ?",
+                self._conn, params=[-1 if batas is None else batas]
+            )
+
+    def ringkasan_karantina(self):
+        """Jumlah baris karantina per kombinasi (Alasan, Sumber)."""
+        with self._lock:
+            return pd.read_sql_query(
+                'SELECT "Alasan", "Sumber", COUNT(*) AS "Jumlah" FROM karantina '
+                'GROUP BY "Alasan", "Sumber"', self._conn
+            )
+
+    def istilah_saran(self, n=1, layanan=None):
+        """Frekuensi istilah (n-gram) per Jenis Layanan dari indeks bertahap."""
+        syarat, parameter = ['"N" = ?'], [n]
+        if layanan:
+            syarat.append(f'"Jenis Layanan" IN ({", ".join("?" for _ in layanan)})')
+            parameter.extend(layanan)
+        with self._lock:
+            return pd.read_sql_query(
+                f'SELECT "Jenis Layanan", "Istilah", "Frekuensi" FROM saran_istilah '
+                f'WHERE {" AND ".join(syarat)} ORDER BY "Frekuensi" DESC, "Istilah"',
+                self._conn, params=parameter
+            )
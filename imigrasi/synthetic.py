@@ -0,0 +1,111 @@
+"""Generator data responden sintetis sesuai skema form_responden.
+
+Contoh:
+    python -m imigrasi.synthetic 100000 --output data/sintetis.csv
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from imigrasi.schema import ASPEK_ALL, JENIS_KELAMIN, JENIS_LAYANAN, KEPUASAN, KOLOM_RESPONDEN
+
+NAMA_DEPAN = ["Ahmad", "Budi", "Cut", "Dewi", "Fajar", "Hendra", "Indah", "Irwan", "Maya",
+              "Muhammad", "Nur", "Putri", "Rahmat", "Rina", "Siti", "Teuku", "Wahyu", "Yusuf"]
+NAMA_BELAKANG = ["Saputra", "Lestari", "Hasibuan", "Nasution", "Siregar", "Rahman",
+                 "Harahap", "Lubis", "Pratama", "Wijaya", "Kurniawan", "Syahputra"]
+
+SARAN_NEGATIF = [
+    "Antrian terlalu lama, mohon tambah loket",
+    "Informasi persyaratan kurang jelas",
+    "Prosedur pengambilan paspor berbelit",
+    "Ruang tunggu panas dan sempit",
+    "Petugas kurang ramah saat melayani",
+    "Sistem antrian online sering error",
+]
+SARAN_POSITIF = [
+    "Pelayanan cepat dan petugas ramah",
+    "Ruang tunggu bersih dan nyaman",
+    "Prosesnya mudah, terima kasih",
+    "Petugas sangat membantu menjelaskan persyaratan",
+]
+
+# Rata-rata laten per layanan agar perbandingan antar layanan tidak datar
+EFEK_LAYANAN = {"Paspor Baru": 0.0, "Perpanjangan Paspor": 0.3, "Visa": -0.2,
+                "Izin Tinggal": -0.4, "Lainnya": 0.1}
+# Bobot tiap aspek terhadap kepuasan keseluruhan
+BOBOT_ASPEK = np.array([0.08, 0.2, 0.12, 0.1, 0.08, 0.18, 0.14, 0.1])
+
+
+def buat_responden(n, mulai='2025-01-01', bulan=12, seed=None):
+    """Buat n responden dengan korelasi antar aspek yang realistis.
+
+    Setiap responden punya tingkat kepuasan laten; skor aspek = laten +
+    derau per aspek, dan kepuasan keseluruhan mengikuti kombinasi berbobot
+    dari aspek. Tanggal tersebar pada jam kerja selama `bulan` bulan. Semua
+    baris lolos validasi dan kunci duplikat, jadi repositori menyimpan tepat n.
+    """
+    rng = np.random.default_rng(seed)
+    layanan = rng.choice(JENIS_LAYANAN, n, p=[0.35, 0.3, 0.1, 0.15, 0.1])
+    efek = pd.Series(layanan).map(EFEK_LAYANAN).to_numpy()
+    laten = rng.normal(3.4, 0.8, n) + efek
+
+    aspek = laten[:, None] + rng.normal(0, 0.7, (n, len(ASPEK_ALL)))
+    aspek[:, ASPEK_ALL.index('Waktu Tunggu')] -= 0.4
+    skor_aspek = np.clip(np.rint(aspek), 1, 5).astype(np.int8)
+    keseluruhan = aspek @ BOBOT_ASPEK + rng.normal(0, 0.5, n)
+    skor_kepuasan = np.clip(np.rint(keseluruhan), 1, 5).astype(np.int8)
+
+    awal = pd.Timestamp(mulai)
+    hari = rng.integers(0, (awal + pd.DateOffset(months=bulan) - awal).days, n)
+    menit = rng.integers(8 * 60, 16 * 60, n)
+    tanggal = (awal + pd.to_timedelta(hari, unit='D') + pd.to_timedelta(menit, unit='min'))
+
+    ada_saran = rng.random(n) < 0.3
+    negatif = skor_kepuasan <= 3
+    saran = np.where(
+        negatif,
+        rng.choice(SARAN_NEGATIF, n),
+        rng.choice(SARAN_POSITIF, n),
+    )
+    saran = np.where(ada_saran, saran, '')
+
+    # Nomor urut membuat Nama unik, jadi Nama + Tanggal tidak pernah terdeteksi duplikat
+    nama = (pd.Series(rng.choice(NAMA_DEPAN, n)) + ' ' + rng.choice(NAMA_BELAKANG, n)
+            + ' ' + pd.Series(np.arange(1, n + 1)).astype(str))
+    kelamin = rng.choice(JENIS_KELAMIN, n)
+    usia = np.clip(rng.normal(36, 12, n).round(), 17, 100).astype(np.int64)
+
+    # Semua skor sama akan dikarantina sebagai straight-lining; geser satu aspek
+    # ke arah tengah agar n baris yang dibuat = n baris yang tersimpan
+    sama = np.flatnonzero((skor_aspek == skor_kepuasan[:, None]).all(axis=1))
+    geser = rng.integers(0, len(ASPEK_ALL), len(sama))
+    skor_aspek[sama, geser] += np.where(skor_aspek[sama, geser] <= 3, 1, -1).astype(np.int8)
+
+    df = pd.DataFrame({
+        'Tanggal': tanggal.strftime("%Y-%m-%d %H:%M"),
+        'Nama': nama.to_numpy(),
+        'Jenis Kelamin': kelamin,
+        'Usia': usia,
+        'Jenis Layanan': layanan,
+        **{k: skor_aspek[:, i] for i, k in enumerate(ASPEK_ALL)},
+        KEPUASAN: skor_kepuasan,
+        'Saran': saran,
+    })
+    return df.sort_values('Tanggal', ignore_index=True)[KOLOM_RESPONDEN]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m imigrasi.synthetic',
+                                     description="Buat CSV responden sintetis.")
+    parser.add_argument('jumlah', type=int)
+    parser.add_argument('--output', default='responden_sintetis.csv')
+    parser.add_argument('--bulan', type=int, default=12)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+    buat_responden(args.jumlah, bulan=args.bulan, seed=args.seed).to_csv(args.output, index=False)
+    print(args.output)
+
+
+if __name__ == '__main__':
+    main()
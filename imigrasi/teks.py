@@ -0,0 +1,74 @@
+"""Tokenisasi saran berbahasa Indonesia untuk indeks teks dan ringkasan kata."""
+import re
+from collections import Counter
+
+import pandas as pd
+
+# Kata fungsi yang tidak bermakna sendiri; kata penilai seperti "tidak",
+# "kurang" dan "sangat" sengaja dipertahankan agar bigram "kurang jelas" tetap utuh
+STOPWORDS = frozenset("""
+ada adalah agar akan aku anda apa apakah atau bagi bahwa begitu bila bisa buat dalam dan
+dapat dari demi dengan di dia ia ini itu jadi jika juga kalau kami kamu karena kita ke kepada
+lagi maka masih mereka mohon namun oleh pada para pun saat saja saya sih sudah supaya tapi
+tetapi tolong untuk yaitu yang ya
+""".split())
+# Partikel/enklitik yang dilepas dari akhir kata ("antriannya" -> "antrian")
+_AKHIRAN = ('nya', 'lah', 'kah')
+_POLA_KATA = re.compile(r"[a-z0-9]+")
+# n-gram tidak melewati tanda baca ("mudah, terima kasih" bukan "mudah terima")
+_POLA_KLAUSA = re.compile(r"[.,;:!?()\n]+")
+MAKS_NGRAM = 2
+
+
+def token(teks):
+    """Daftar token huruf kecil tanpa stopword dan partikel akhir."""
+    if not isinstance(teks, str):
+        return []
+    hasil = []
+    for kata in _POLA_KATA.findall(teks.lower()):
+        for akhiran in _AKHIRAN:
+            if kata.endswith(akhiran) and len(kata) > len(akhiran) + 3:
+                kata = kata[:-len(akhiran)]
+                break
+        if kata not in STOPWORDS and len(kata) > 1:
+            hasil.append(kata)
+    return hasil
+
+
+def klausa(teks):
+    """Token per klausa (dipisah tanda baca), dasar pembentukan n-gram."""
+    if not isinstance(teks, str):
+        return []
+    return [kata for kata in map(token, _POLA_KLAUSA.split(teks)) if kata]
+
+
+def ngram(daftar_token, n):
+    return [' '.join(daftar_token[i:i + n]) for i in range(len(daftar_token) - n + 1)]
+
+
+def ekspresi_cari(teks):
+    """Ekspresi MATCH FTS5: semua kata harus ada, masing-masing sebagai awalan."""
+    kata = token(teks)
+    if not kata:
+        return None
+    return ' AND '.join(f'"{k}"*' for k in kata)
+
+
+def frekuensi_istilah(pasangan, maks_n=MAKS_NGRAM):
+    """Counter {(layanan, istilah, n): frekuensi} dari pasangan (layanan, saran)."""
+    hitung = Counter()
+    for layanan, saran in pasangan:
+        for kata in klausa(saran):
+            for n in range(1, maks_n + 1):
+                for istilah in ngram(kata, n):
+                    hitung[(str(layanan), istilah, n)] += 1
+    return hitung
+
+
+def hitung_istilah(df, maks_n=MAKS_NGRAM):
+    """Frekuensi unigram..n-gram per Jenis Layanan dari kolom Saran."""
+    hitung = frekuensi_istilah(zip(df['Jenis Layanan'], df['Saran']), maks_n)
+    return pd.DataFrame(
+        [(*kunci, jumlah) for kunci, jumlah in hitung.items()],
+        columns=['Jenis Layanan', 'Istilah', 'N', 'Frekuensi'],
+    )
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from imigrasi.analytics import hitung_laporan, main, muat_dataset
+from imigrasi.schema import KOLOM_RESPONDEN
+from imigrasi.synthetic import buat_responden
+
+
+def test_laporan_dari_csv(tmp_path):
+    path = tmp_path / 'langsa.csv'
+    buat_responden(300, seed=2).to_csv(path, index=False)
+    assert main([str(path), '--output', str(tmp_path / 'keluar')]) == 0
+    laporan = json.loads((tmp_path / 'keluar' / 'langsa.json').read_text(encoding='utf-8'))
+    assert laporan['ringkasan']['total_responden'] > 0
+    assert laporan['rekomendasi']['terlemah']['aspek']
+
+
+def test_dataset_kosong_dilaporkan(tmp_path, capsys):
+    path = tmp_path / 'kosong.csv'
+    path.write_text(','.join(KOLOM_RESPONDEN) + '\n', encoding='utf-8')
+    assert main([str(path), '--output', str(tmp_path)]) == 1
+    assert 'tidak ada data' in capsys.readouterr().err
+    assert hitung_laporan(muat_dataset(str(path)))['rekomendasi'] is None
+
+
+def test_path_db_salah_tidak_membuat_database(tmp_path):
+    path = tmp_path / 'salah.db'
+    with pytest.raises(FileNotFoundError):
+        muat_dataset(str(path))
+    with pytest.raises(SystemExit):
+        main([str(path)])
+    assert not path.exists()
@@ -0,0 +1,23 @@
+import os
+
+from imigrasi.export import buat_ekspor
+from imigrasi.storage import RepositoriResponden
+from imigrasi.synthetic import buat_responden
+
+
+def test_ekspor_hanya_menghapus_versi_lebih_lama(tmp_path):
+    repo = RepositoriResponden(str(tmp_path / 'responden.db'))
+    repo.tambah_banyak(buat_responden(100, seed=1))
+    folder = str(tmp_path / 'ekspor')
+    path = buat_ekspor(repo, 'csv', folder)
+    awalan, versi = os.path.basename(path).rsplit('-v', 1)
+    versi = int(versi.split('.')[0])
+    # File versi lain seolah ditulis job yang selesai sebelum/sesudah job ini
+    lama = os.path.join(folder, f"{awalan}-v{versi - 1}.csv")
+    baru = os.path.join(folder, f"{awalan}-v{versi + 1}.csv")
+    for p in (lama, baru):
+        open(p, 'w').close()
+
+    assert buat_ekspor(repo, 'csv', folder) == path
+    assert os.path.exists(path) and os.path.exists(baru)
+    assert not os.path.exists(lama)
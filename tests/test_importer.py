@@ -0,0 +1,96 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from imigrasi.importer import MODE_GANTI, SkemaTidakValid, baca_chunk, baca_csv, import_csv, pisah_chunk, validasi_chunk
+from imigrasi.kualitas import ALASAN_STRAIGHT_LINING, PEMISAH_ALASAN
+from imigrasi.schema import KOLOM_RESPONDEN, KOLOM_SKOR
+from imigrasi.storage import RepositoriResponden
+from imigrasi.synthetic import buat_responden
+
+
+def _chunk(df):
+    # Bentuk yang sama dengan satu chunk import_csv
+    return next(baca_chunk(io.StringIO(df.to_csv(index=False))))
+
+
+@pytest.fixture
+def mentah():
+    df = buat_responden(20, seed=7).astype({k: 'int64' for k in KOLOM_SKOR})
+    # Skor bervariasi agar tidak ada baris straight-lining kecuali yang disengaja
+    df[KOLOM_SKOR] = np.tile([1, 2, 3, 4, 5, 1, 2, 3, 4], (len(df), 1))
+    return df
+
+
+def test_alasan_penolakan(mentah):
+    mentah.loc[0, 'Tanggal'] = 'bukan tanggal'
+    mentah.loc[1, 'Nama'] = '   '
+    mentah.loc[2, 'Jenis Kelamin'] = 'Lainnya'
+    mentah.loc[3, 'Jenis Layanan'] = 'Tidak Ada'
+    mentah.loc[4, 'Usia'] = 12
+    mentah.loc[5, 'Keandalan'] = 7
+    mentah.loc[6, KOLOM_SKOR] = 3
+    mentah.loc[7, ['Usia', 'Empati']] = [150, 0]
+
+    valid, alasan = validasi_chunk(_chunk(mentah))
+    assert len(valid) == len(mentah) - 8
+    assert alasan == {
+        'Tanggal tidak valid': 1,
+        'Nama kosong': 1,
+        'Jenis Kelamin tidak dikenal': 1,
+        'Jenis Layanan tidak dikenal': 1,
+        'Usia tidak valid': 2,
+        'Skor di luar 1-5': 2,
+        ALASAN_STRAIGHT_LINING: 1,
+    }
+    assert valid[KOLOM_SKOR].dtypes.eq('int8').all()
+
+
+def test_baris_ditolak_membawa_semua_alasannya(mentah):
+    mentah.loc[0, ['Usia', 'Empati']] = [150, 0]
+    _, ditolak, _ = pisah_chunk(_chunk(mentah))
+    assert ditolak.loc[0, 'Alasan'].split(PEMISAH_ALASAN) == ['Usia tidak valid', 'Skor di luar 1-5']
+    # Nilai asli dari CSV (teks), bukan hasil konversi
+    assert ditolak.loc[0, 'Usia'] == '150'
+
+
+def test_baca_csv_header_saja():
+    df, alasan = baca_csv(io.StringIO(','.join(KOLOM_RESPONDEN) + '\n'))
+    assert df.empty and list(df.columns) == KOLOM_RESPONDEN
+    assert not alasan
+
+
+def test_header_kurang_ditolak():
+    with pytest.raises(SkemaTidakValid):
+        baca_csv(io.StringIO('Tanggal,Nama\n2025-01-01 08:00,Budi\n'))
+
+
+def test_sel_rusak_dikarantina_bukan_menggagalkan_import(mentah, tmp_path):
+    mentah = mentah.astype({'Usia': object, 'Keandalan': object})
+    mentah.loc[3, 'Usia'] = 'abc'
+    mentah.loc[4, 'Keandalan'] = 'empat'
+    mentah.loc[5, 'Jenis Kelamin'] = 'Lainnya'
+    repo = RepositoriResponden(str(tmp_path / 'responden.db'))
+    hasil = import_csv(io.StringIO(mentah.to_csv(index=False)), repo, ukuran_chunk=8)
+    assert hasil['disimpan'] == len(mentah) - 3
+    karantina = repo.muat_karantina().set_index('Nama')
+    assert karantina.loc[mentah.loc[3, 'Nama'], 'Alasan'] == 'Usia tidak valid'
+    assert karantina.loc[mentah.loc[3, 'Nama'], 'Usia'] == 'abc'
+    assert karantina.loc[mentah.loc[4, 'Nama'], 'Alasan'] == 'Skor di luar 1-5'
+    assert karantina.loc[mentah.loc[5, 'Nama'], 'Alasan'] == 'Jenis Kelamin tidak dikenal'
+
+
+def test_mode_ganti_gagal_di_chunk_akhir_tidak_menghapus_data(mentah, tmp_path):
+    repo = RepositoriResponden(str(tmp_path / 'responden.db'))
+    repo.tambah_banyak(mentah)
+    sebelum = repo.jumlah()
+    # Baris dengan kolom berlebih di chunk ketiga membuat parser CSV gagal
+    baris = mentah.assign(Nama=mentah['Nama'] + ' baru').to_csv(index=False).splitlines()
+    baris.insert(18, baris[18] + ',x,y')
+    with pytest.raises(pd.errors.ParserError):
+        import_csv(io.StringIO('\n'.join(baris) + '\n'), repo, mode=MODE_GANTI, ukuran_chunk=8)
+    assert repo.jumlah() == sebelum
+    assert repo.statistik().n == sebelum
+    assert repo.muat()['Nama'].str.endswith(' baru').sum() == 0
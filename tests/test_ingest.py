@@ -0,0 +1,79 @@
+import json
+import sqlite3
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import Future
+
+import pytest
+
+import imigrasi.ingest as ingest
+from imigrasi.ingest import AntrianIngest, _Handler
+from imigrasi.kualitas import straight_lining
+from imigrasi.schema import KOLOM_SKOR
+from imigrasi.storage import RepositoriResponden
+from imigrasi.synthetic import buat_responden
+
+
+class _AntrianPalsu:
+    """Antrian dengan Future yang gagal atau tidak pernah selesai."""
+
+    def __init__(self, galat=None):
+        self.galat = galat
+
+    def kirim(self, data, sumber='kiosk'):
+        hasil = Future()
+        if self.galat is not None:
+            hasil.set_exception(self.galat)
+        return hasil
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = ingest.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/responden"
+    server.shutdown()
+    server.server_close()
+    monkeypatch.setattr(_Handler, 'antrian', None)
+
+
+def _post(url, isi):
+    permintaan = urllib.request.Request(url, data=json.dumps(isi).encode(), method='POST')
+    try:
+        with urllib.request.urlopen(permintaan, timeout=10) as jawaban:
+            return jawaban.status, json.loads(jawaban.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def _rekaman(n=2):
+    df = buat_responden(4 * n, seed=6)
+    return df[~straight_lining(df[KOLOM_SKOR])].head(n).to_dict('records')
+
+
+def test_galat_penulis_dijawab_500(server, monkeypatch):
+    monkeypatch.setattr(_Handler, 'antrian', _AntrianPalsu(sqlite3.OperationalError('database is locked')))
+    kode, isi = _post(server, _rekaman())
+    assert kode == 500
+    assert 'database is locked' in isi['error']
+
+
+def test_batas_tunggu_dijawab_503(server, monkeypatch):
+    monkeypatch.setattr(ingest, 'BATAS_TUNGGU', 0.1)
+    monkeypatch.setattr(_Handler, 'antrian', _AntrianPalsu())
+    kode, isi = _post(server, _rekaman(1)[0])
+    assert kode == 503
+    assert 'error' in isi
+
+
+def test_kiriman_tersimpan(server, monkeypatch, tmp_path):
+    repo = RepositoriResponden(str(tmp_path / 'responden.db'))
+    antrian = AntrianIngest(repo, jeda=0.05)
+    monkeypatch.setattr(_Handler, 'antrian', antrian)
+    rekaman = _rekaman(2)
+    kode, isi = _post(server, rekaman + rekaman[:1])
+    antrian.tutup()
+    assert kode == 200
+    assert isi == {'diterima': len(rekaman), 'ditolak': 1}
+    assert repo.jumlah() == len(rekaman)
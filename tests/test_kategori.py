@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from imigrasi.kategori import LABEL_USIA, kelompok_usia
+
+
+@pytest.mark.parametrize('usia, label', [
+    (17, '17-25'), (25, '17-25'), (25.9, '17-25'),
+    (26, '26-35'), (35, '26-35'),
+    (36, '36-45'), (45, '36-45'),
+    (46, '46-55'), (55, '46-55'),
+    (56, '56+'), (100, '56+'),
+])
+def test_kelompok_usia_di_batas(usia, label):
+    assert kelompok_usia(usia) == label
+    assert kelompok_usia(pd.Series([usia]))[0] == label
+
+
+def test_kelompok_usia_series_dan_kosong():
+    usia = pd.Series([40, np.nan, 18], index=[7, 8, 9])
+    hasil = kelompok_usia(usia)
+    assert hasil.name == 'Kelompok Usia'
+    assert list(hasil.index) == [7, 8, 9]
+    assert list(hasil.cat.categories) == list(LABEL_USIA) and hasil.cat.ordered
+    assert hasil.isna().tolist() == [False, True, False]
+    assert kelompok_usia(np.nan) is None
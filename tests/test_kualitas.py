@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+from imigrasi.kualitas import kunci_responden, kunci_satu, laporan_kualitas, straight_lining
+from imigrasi.synthetic import buat_responden
+
+
+def test_kunci_vektor_sama_dengan_kunci_satu():
+    df = buat_responden(300, seed=3)
+    kunci = kunci_responden(df)
+    assert kunci.dtype == np.int64
+    assert kunci.tolist() == [kunci_satu(data) for data in df.to_dict('records')]
+
+
+def test_kunci_menormalkan_nama_dan_tanggal():
+    df = pd.DataFrame({
+        'Nama': ['Budi Saputra', '  budi   SAPUTRA ', 'Budi Saputra'],
+        'Tanggal': ['2025-01-01 08:00', '2025-01-01 08:00:59', '2025-01-01 08:01'],
+    })
+    kunci = kunci_responden(df)
+    assert kunci[0] == kunci[1] != kunci[2]
+    waktu = df.assign(Tanggal=pd.to_datetime(df['Tanggal'], format='mixed'))
+    assert kunci_responden(waktu)[0] == kunci[0]
+    assert kunci_satu({'Nama': 'BUDI saputra', 'Tanggal': pd.Timestamp('2025-01-01 08:00')}) == kunci[0]
+
+
+def test_straight_lining():
+    skor = np.array([[3, 3, 3], [1, 2, 3], [5, 5, 5]])
+    assert straight_lining(skor).tolist() == [True, False, True]
+
+
+def test_laporan_kualitas_memecah_alasan_gabungan():
+    ringkas = pd.DataFrame({
+        'Alasan': ['Usia tidak valid; Skor di luar 1-5', 'Usia tidak valid'],
+        'Sumber': ['csv', 'csv'],
+        'Jumlah': [2, 3],
+    })
+    laporan = laporan_kualitas(ringkas).set_index('Alasan')['Jumlah']
+    assert laporan.to_dict() == {'Usia tidak valid': 5, 'Skor di luar 1-5': 2}
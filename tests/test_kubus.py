@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from imigrasi.kategori import kelompok_usia
+from imigrasi.kubus import TOTAL, iris_kubus, kubus_baris, kubus_batch, pilih_sel, pivot_kubus
+from imigrasi.rollups import KOLOM_NILAI, ringkasan_rollup
+from imigrasi.schema import KEPUASAN
+from imigrasi.synthetic import buat_responden
+
+
+@pytest.fixture(scope='module')
+def mentah():
+    df = buat_responden(2000, seed=8)
+    return df.assign(**{'Kelompok Usia': kelompok_usia(df['Usia']).astype(str), 'Bulan': df['Tanggal'].str[:7]})
+
+
+@pytest.fixture(scope='module')
+def kubus(mentah):
+    return kubus_batch(mentah)
+
+
+@pytest.mark.parametrize('ukuran, aggfunc, skor', [
+    ('Rata-rata', 'mean', KEPUASAN),
+    ('Simpangan Baku', 'std', 'Waktu Tunggu'),
+    ('Responden', 'count', KEPUASAN),
+])
+def test_pivot_sama_dengan_pivot_table(mentah, kubus, ukuran, aggfunc, skor):
+    pivot = pivot_kubus(kubus, 'Kelompok Usia', 'Jenis Layanan', ukuran, skor)
+    acuan = mentah.pivot_table(index='Kelompok Usia', columns='Jenis Layanan', values=skor,
+                               aggfunc=aggfunc, margins=True, margins_name=TOTAL)
+    np.testing.assert_allclose(
+        pivot.loc[acuan.index, acuan.columns].to_numpy(dtype='float64'), acuan.to_numpy(dtype='float64')
+    )
+
+
+def test_persen_puas(mentah, kubus):
+    pivot = pivot_kubus(kubus, 'Jenis Kelamin', ukuran='% Puas')
+    acuan = (mentah[KEPUASAN] >= 4).groupby(mentah['Jenis Kelamin']).mean() * 100
+    np.testing.assert_allclose(pivot.loc[acuan.index, '% Puas'], acuan)
+    assert pivot.loc[TOTAL, '% Puas'] == pytest.approx((mentah[KEPUASAN] >= 4).mean() * 100)
+
+
+def test_kubus_baris_sama_dengan_batch(mentah, kubus):
+    baris = [kubus_baris(data) for data in mentah.to_dict('records')]
+    per_baris = pd.DataFrame(baris, columns=kubus.columns)
+    gabung = per_baris.groupby(list(kubus.columns[:4]), as_index=False)[KOLOM_NILAI].sum()
+    pd.testing.assert_frame_equal(gabung, kubus, check_dtype=False)
+
+
+def test_iris_dan_pilih_sel(mentah, kubus):
+    sel = pilih_sel(iris_kubus(kubus, '2025-03-10', '2025-06-01', kelamin=('Perempuan',)),
+                    {'Jenis Layanan': 'Visa', 'Kelompok Usia': TOTAL})
+    acuan = mentah[mentah['Bulan'].between('2025-03', '2025-06')
+                   & (mentah['Jenis Kelamin'] == 'Perempuan') & (mentah['Jenis Layanan'] == 'Visa')]
+    ringkasan = ringkasan_rollup(sel)
+    assert ringkasan['total_responden'] == len(acuan)
+    assert ringkasan['rata_rata_kepuasan'] == pytest.approx(acuan[KEPUASAN].mean())
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from imigrasi.regression import p_value_t, regresi_sederhana
+from imigrasi.running_stats import StatistikBerjalan
+from imigrasi.synthetic import buat_responden
+
+
+def test_p_value_nan_tetap_nan():
+    p = p_value_t(np.array([np.nan, 0.0, np.inf]), 10)
+    assert np.isnan(p[0])
+    assert p[1] == 1.0
+    assert p[2] == 0.0
+
+
+def test_aspek_tanpa_variasi_tidak_signifikan():
+    df = buat_responden(200, seed=1)
+    df['Keandalan'] = 3
+    hasil = regresi_sederhana(StatistikBerjalan.dari_df(df))
+    assert np.isnan(hasil.loc['Keandalan', 'Kemiringan'])
+    assert np.isnan(hasil.loc['Keandalan', 'p-value'])
+    assert hasil.drop(index='Keandalan')['p-value'].notna().all()
+
+
+def test_regresi_berganda_sama_dengan_lstsq():
+    from imigrasi.regression import regresi_berganda
+    from imigrasi.schema import ASPEK_ALL, KEPUASAN
+
+    df = buat_responden(400, seed=4)
+    hasil = regresi_berganda(StatistikBerjalan.dari_df(df))
+    x = np.column_stack([np.ones(len(df)), df[ASPEK_ALL].to_numpy(dtype='float64')])
+    y = df[KEPUASAN].to_numpy(dtype='float64')
+    koef, rss, *_ = np.linalg.lstsq(x, y, rcond=None)
+    np.testing.assert_allclose(hasil['koefisien']['Koefisien'], koef, atol=1e-10)
+    np.testing.assert_allclose(hasil['R²'], 1 - rss[0] / ((y - y.mean()) ** 2).sum())
+
+
+def test_regresi_sederhana_sama_dengan_polyfit():
+    from imigrasi.schema import ASPEK_ALL, KEPUASAN
+
+    df = buat_responden(300, seed=5)
+    hasil = regresi_sederhana(StatistikBerjalan.dari_df(df))
+    for aspek in ASPEK_ALL:
+        kemiringan, intersep = np.polyfit(df[aspek], df[KEPUASAN], 1)
+        assert hasil.loc[aspek, 'Kemiringan'] == pytest.approx(kemiringan)
+        assert hasil.loc[aspek, 'Intersep'] == pytest.approx(intersep)
+
+
+def test_tanpa_responden_berisi_nan():
+    from imigrasi.regression import regresi_berganda
+
+    kosong = StatistikBerjalan()
+    assert regresi_sederhana(kosong)['p-value'].isna().all()
+    hasil = regresi_berganda(kosong)
+    assert hasil['koefisien'].isna().all().all()
+    assert np.isnan(hasil['R²'])
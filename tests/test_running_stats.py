@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from imigrasi.running_stats import StatistikBerjalan
+from imigrasi.schema import KOLOM_SKOR
+from imigrasi.synthetic import buat_responden
+
+
+@pytest.fixture(scope='module')
+def df():
+    return buat_responden(500, seed=11)
+
+
+def test_sama_dengan_pandas(df):
+    stat = StatistikBerjalan.dari_df(df)
+    skor = df[KOLOM_SKOR].astype('float64')
+    assert stat.n == len(df)
+    np.testing.assert_allclose(stat.mean, skor.mean())
+    np.testing.assert_allclose(stat.varians(), skor.var())
+    np.testing.assert_allclose(stat.korelasi(), skor.corr())
+    np.testing.assert_array_equal(stat.min, skor.min())
+    np.testing.assert_array_equal(stat.max, skor.max())
+    assert stat.puas == (skor['Kepuasan Keseluruhan'] >= 4).sum()
+    assert stat.per_kelamin == df['Jenis Kelamin'].value_counts().to_dict()
+
+
+def test_tambah_per_baris_dan_gabung_sama_dengan_batch(df):
+    batch = StatistikBerjalan.dari_df(df)
+    per_baris = StatistikBerjalan()
+    for data in df.iloc[:200].to_dict('records'):
+        per_baris.tambah(data)
+    per_baris.gabung(StatistikBerjalan.dari_df(df.iloc[200:]))
+    assert per_baris.n == batch.n
+    np.testing.assert_allclose(per_baris.mean, batch.mean)
+    np.testing.assert_allclose(per_baris.m2, batch.m2)
+
+
+def test_json_bolak_balik(df):
+    stat = StatistikBerjalan.dari_df(df)
+    salinan = StatistikBerjalan.from_json(stat.to_json())
+    np.testing.assert_array_equal(salinan.m2, stat.m2)
+    assert salinan.per_layanan == stat.per_layanan
@@ -0,0 +1,18 @@
+import pytest
+
+from imigrasi.schema import laporan_memori, normalisasi
+from imigrasi.synthetic import buat_responden
+
+
+def test_laporan_memori_menghitung_kolom_turunan():
+    asli = buat_responden(500, seed=1)
+    ringkas = normalisasi(asli)
+    laporan = laporan_memori(asli, ringkas)
+
+    assert 'Kategori' in laporan.index
+    assert laporan.loc['Kategori', 'Tipe Asli'] == ''
+    assert laporan.loc['Kategori', 'Sesudah (KB)'] > 0
+    total = ringkas.memory_usage(deep=True, index=False).sum() / 1024
+    assert laporan.loc['Total', 'Sesudah (KB)'] == pytest.approx(total)
+    assert laporan.loc['Total', 'Sebelum (KB)'] == pytest.approx(
+        asli.memory_usage(deep=True, index=False).sum() / 1024)
@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+from imigrasi.storage import RepositoriResponden
+from imigrasi.synthetic import buat_responden
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+from bench_startup import MODUL_BERAT, render_pertama  # noqa: E402
+
+# Detik sampai render pertama di proses baru; bisa dilonggarkan di mesin CI yang lambat
+ANGGARAN_RENDER = float(os.environ.get('IMIGRASI_ANGGARAN_RENDER', 8))
+
+
+@pytest.mark.parametrize('n, modul_boleh', [
+    (0, set()),
+    # Tab pertama menggambar grafik begitu ada data
+    (10_000, {'plotly.express'}),
+])
+def test_render_pertama_dalam_anggaran(tmp_path, n, modul_boleh):
+    db = str(tmp_path / 'responden.db')
+    repo = RepositoriResponden(db)
+    repo.tambah_banyak(buat_responden(n, seed=42))
+    assert repo.jumlah() == n
+    hasil, _ = render_pertama(db)
+    assert hasil['detik'] <= ANGGARAN_RENDER
+    assert set(hasil['modul']) & set(MODUL_BERAT) <= modul_boleh
@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+from imigrasi.storage import RepositoriResponden
+from imigrasi.synthetic import buat_responden
+from imigrasi.teks import frekuensi_istilah
+
+
+def _paralel(kerja, *argumen):
+    galat = []
+
+    def jalan(arg):
+        try:
+            kerja(arg)
+        except Exception as e:  # dilaporkan lewat assert di bawah
+            galat.append(e)
+
+    utas = [threading.Thread(target=jalan, args=(arg,)) for arg in argumen]
+    for t in utas:
+        t.start()
+    for t in utas:
+        t.join()
+    assert not galat
+
+
+@pytest.fixture
+def path_db(tmp_path):
+    return str(tmp_path / 'responden.db')
+
+
+def test_dua_repositori_tidak_mengindeks_saran_ganda(path_db):
+    # Dua koneksi ke file yang sama, seperti server ingest dan dashboard
+    a, b = RepositoriResponden(path_db), RepositoriResponden(path_db)
+    df = buat_responden(1200, seed=1)
+
+    def kerja(arg):
+        repo, bagian = arg
+        for i in range(0, len(bagian), 25):
+            repo.tambah_banyak(bagian.iloc[i:i + 25])
+
+    _paralel(kerja, (a, df.iloc[:600]), (b, df.iloc[600:]))
+    conn = a._conn
+    saran = conn.execute(
+        'SELECT "Jenis Layanan", "Saran" FROM responden WHERE "Saran" != \'\''
+    ).fetchall()
+    total = conn.execute('SELECT SUM("Frekuensi") FROM saran_istilah').fetchone()[0]
+    assert total == sum(frekuensi_istilah(saran).values())
+    assert conn.execute("SELECT COUNT(*) FROM saran_fts").fetchone()[0] == len(saran)
+    assert a.statistik().n == a.jumlah()
+
+
+def test_tambah_mengarantina_baris_tidak_valid(path_db):
+    repo = RepositoriResponden(path_db)
+    df = buat_responden(50, seed=3)
+    df.loc[0, 'Fasilitas Fisik'] = 9
+    df.loc[1, 'Jenis Layanan'] = 'Layanan Fiktif'
+    tersimpan = repo.tambah_banyak(df)
+    rusak = {**df.iloc[2].to_dict(), 'Nama': 'Baris Rusak', 'Usia': 5}
+    assert repo.tambah(rusak) is False
+
+    alasan = set(repo.muat_karantina()['Alasan'])
+    assert {'Skor di luar 1-5', 'Jenis Layanan tidak dikenal', 'Usia tidak valid'} <= alasan
+    assert repo.jumlah() == tersimpan < 50
+    assert repo.statistik().n == tersimpan
+    assert repo.muat_kubus()['n'].sum() == tersimpan
+    assert repo.muat_rollup()['n'].sum() == tersimpan
+
+
+def test_dua_repositori_tidak_menyimpan_duplikat(path_db):
+    # Kiriman yang sama masuk lewat dua koneksi; cek kunci dan insert harus satu transaksi
+    a, b = RepositoriResponden(path_db), RepositoriResponden(path_db)
+    df = buat_responden(600, seed=2)
+
+    def kerja(repo):
+        for i in range(0, len(df), 20):
+            repo.tambah_banyak(df.iloc[i:i + 20])
+
+    _paralel(kerja, a, b)
+    karantina = a.muat_karantina()
+    duplikat = (karantina['Alasan'] == 'Duplikat (Nama + Tanggal)').sum()
+    assert a.jumlah() == duplikat
+    assert a.jumlah() + len(karantina) == 2 * len(df)
+    assert a._conn.execute("SELECT COUNT(*) FROM kunci_responden").fetchone()[0] == a.jumlah()
+    assert a.statistik().n == a.jumlah()
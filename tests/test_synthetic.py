@@ -0,0 +1,17 @@
+from imigrasi.kualitas import kunci_responden, straight_lining
+from imigrasi.schema import KOLOM_SKOR
+from imigrasi.storage import RepositoriResponden
+from imigrasi.synthetic import buat_responden
+
+
+def test_semua_baris_sintetis_tersimpan(tmp_path):
+    n = 5000
+    df = buat_responden(n, seed=42)
+    assert len(set(kunci_responden(df).tolist())) == n
+    assert not straight_lining(df[KOLOM_SKOR]).any()
+    assert df[KOLOM_SKOR].isin([1, 2, 3, 4, 5]).all().all()
+
+    repo = RepositoriResponden(str(tmp_path / 'responden.db'))
+    assert repo.tambah_banyak(df) == n
+    assert repo.jumlah() == n
+    assert repo.muat_karantina().empty